@@ -6,8 +6,6 @@ Create Date: 2026-01-21
 
 """
 
-import sqlalchemy as sa
-
 from alembic import op
 
 # revision identifiers
@@ -18,20 +16,28 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add address fields to users table
-    op.add_column("users", sa.Column("address_line1", sa.String(), nullable=True))
-    op.add_column("users", sa.Column("address_line2", sa.String(), nullable=True))
-    op.add_column("users", sa.Column("city", sa.String(), nullable=True))
-    op.add_column("users", sa.Column("postal_code", sa.String(10), nullable=True))
-    op.add_column(
-        "users",
-        sa.Column("country", sa.String(), server_default="France", nullable=True),
+    # Add address fields to users table. One ALTER TABLE takes the users lock
+    # once instead of once per column.
+    op.execute(
+        """
+        ALTER TABLE users
+            ADD COLUMN address_line1 VARCHAR,
+            ADD COLUMN address_line2 VARCHAR,
+            ADD COLUMN city VARCHAR,
+            ADD COLUMN postal_code VARCHAR(10),
+            ADD COLUMN country VARCHAR DEFAULT 'France'
+        """
     )
 
 
 def downgrade() -> None:
-    op.drop_column("users", "country")
-    op.drop_column("users", "postal_code")
-    op.drop_column("users", "city")
-    op.drop_column("users", "address_line2")
-    op.drop_column("users", "address_line1")
+    op.execute(
+        """
+        ALTER TABLE users
+            DROP COLUMN country,
+            DROP COLUMN postal_code,
+            DROP COLUMN city,
+            DROP COLUMN address_line2,
+            DROP COLUMN address_line1
+        """
+    )
@@ -5,9 +5,6 @@ Revises: 008_auth_security
 Create Date: 2026-01-28
 """
 
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
 from alembic import op
 
 # revision identifiers
@@ -18,15 +15,25 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add identity fields for Smart Matching
-    op.add_column("users", sa.Column("nationality", sa.String(50), nullable=True))
-    op.add_column("users", sa.Column("languages", postgresql.JSON(), nullable=True))
-    op.add_column("users", sa.Column("gender", sa.String(20), nullable=True))
-    op.add_column("users", sa.Column("birth_date", sa.Date(), nullable=True))
+    # Add identity fields for Smart Matching, in a single ALTER TABLE
+    op.execute(
+        """
+        ALTER TABLE users
+            ADD COLUMN nationality VARCHAR(50),
+            ADD COLUMN languages JSON,
+            ADD COLUMN gender VARCHAR(20),
+            ADD COLUMN birth_date DATE
+        """
+    )
 
 
 def downgrade() -> None:
-    op.drop_column("users", "birth_date")
-    op.drop_column("users", "gender")
-    op.drop_column("users", "languages")
-    op.drop_column("users", "nationality")
+    op.execute(
+        """
+        ALTER TABLE users
+            DROP COLUMN birth_date,
+            DROP COLUMN gender,
+            DROP COLUMN languages,
+            DROP COLUMN nationality
+        """
+    )
@@ -0,0 +1,55 @@
+"""Maintain conversations.unread_count_* with a trigger on messages
+
+The per-party unread counters were bumped in Python
+(conv.unread_count_tenant += 1), a read-modify-write of the value loaded at
+the start of the request. Two messages sent concurrently into the same
+conversation both wrote N + 1, so the badge drifted below the real count.
+
+An AFTER INSERT trigger on messages now increments the recipient's counter
+in the same statement as the insert, as a single atomic UPDATE. A message
+from the landlord bumps the tenant's counter; anything else bumps the
+landlord's, matching the previous app logic. Mark-as-read still resets the
+reader's counter from the app.
+
+Idempotent: the function and trigger are created with OR REPLACE /
+DROP IF EXISTS.
+
+Revision ID: 0639b0ad75d8
+Revises: f289a8e4a008
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0639b0ad75d8"
+down_revision = "f289a8e4a008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_conversation_unread() RETURNS trigger AS $$
+        BEGIN
+            UPDATE conversations
+            SET unread_count_tenant = COALESCE(unread_count_tenant, 0)
+                    + CASE WHEN NEW.sender_id = landlord_id THEN 1 ELSE 0 END,
+                unread_count_landlord = COALESCE(unread_count_landlord, 0)
+                    + CASE WHEN NEW.sender_id = landlord_id THEN 0 ELSE 1 END
+            WHERE id = NEW.conversation_id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_messages_bump_unread ON messages")
+    op.execute(
+        "CREATE TRIGGER trg_messages_bump_unread AFTER INSERT ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION bump_conversation_unread()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_messages_bump_unread ON messages")
+    op.execute("DROP FUNCTION IF EXISTS bump_conversation_unread()")
@@ -0,0 +1,120 @@
+"""Rebuild the dispute enum types with the enums' values as labels
+
+a3da0984d64a created dispute_category_enum / dispute_status_enum from the
+member *names* (DAMAGE, OPEN, ...), and the model mapped them by name, so
+every row went through a name lookup on load. 5c1f57373f32 then reworked
+DisputeStatus (AWAITING_RESPONSE, CLOSED) without touching the type, so
+writing those statuses failed. The models now map by value like
+applications/notifications (092f76237873), and both types are rebuilt with
+the value labels:
+
+  category: DAMAGE -> damage, ... (lower-cased)
+  status:   OPEN -> open, EVIDENCE_NEEDED -> awaiting_response,
+            UNDER_REVIEW -> under_review, RESOLVED / DISMISSED -> closed
+
+Each type is rebuilt as <name>_new, the column is cast through the mapping,
+the old type dropped and the new one renamed. The ALTER rewrites disputes
+under ACCESS EXCLUSIVE. Idempotent: a type is only rebuilt while its labels
+differ from the target set. The downgrade maps closed back to RESOLVED.
+
+Revision ID: 0783157913f8
+Revises: 8a3a58818789
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0783157913f8"
+down_revision = "8a3a58818789"
+branch_labels = None
+depends_on = None
+
+
+_CATEGORY_NAMES = ["DAMAGE", "APPLIANCE_FAILURE", "SHARED_LIABILITY", "CLEANING", "OTHER"]
+_STATUS_NAMES = ["OPEN", "EVIDENCE_NEEDED", "UNDER_REVIEW", "RESOLVED", "DISMISSED"]
+_CATEGORY_VALUES = [name.lower() for name in _CATEGORY_NAMES]
+_STATUS_VALUES = ["open", "awaiting_response", "under_review", "closed"]
+
+# (column, enum type, {old label: new label}, new labels)
+_UPGRADE = [
+    (
+        "category",
+        "dispute_category_enum",
+        {name: name.lower() for name in _CATEGORY_NAMES},
+        _CATEGORY_VALUES,
+    ),
+    (
+        "status",
+        "dispute_status_enum",
+        {
+            "OPEN": "open",
+            "EVIDENCE_NEEDED": "awaiting_response",
+            "UNDER_REVIEW": "under_review",
+            "RESOLVED": "closed",
+            "DISMISSED": "closed",
+        },
+        _STATUS_VALUES,
+    ),
+]
+
+_DOWNGRADE = [
+    (
+        "category",
+        "dispute_category_enum",
+        {name.lower(): name for name in _CATEGORY_NAMES},
+        _CATEGORY_NAMES,
+    ),
+    (
+        "status",
+        "dispute_status_enum",
+        {
+            "open": "OPEN",
+            "awaiting_response": "EVIDENCE_NEEDED",
+            "under_review": "UNDER_REVIEW",
+            "closed": "RESOLVED",
+        },
+        _STATUS_NAMES,
+    ),
+]
+
+
+def _enum_labels(conn, type_name):
+    return [
+        row[0]
+        for row in conn.execute(
+            sa.text(
+                "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+                "WHERE t.typname = :name ORDER BY e.enumsortorder"
+            ),
+            {"name": type_name},
+        )
+    ]
+
+
+def _rebuild(conn, column, type_name, mapping, labels):
+    if _enum_labels(conn, type_name) == labels:
+        return
+    new_type = f"{type_name}_new"
+    quoted = ", ".join(f"'{label}'" for label in labels)
+    cases = " ".join(f"WHEN '{old}' THEN '{new}'" for old, new in mapping.items())
+    op.execute(f"DROP TYPE IF EXISTS {new_type}")
+    op.execute(f"CREATE TYPE {new_type} AS ENUM ({quoted})")
+    op.execute(
+        f"ALTER TABLE disputes ALTER COLUMN {column} TYPE {new_type} "
+        f"USING (CASE {column}::text {cases} ELSE {column}::text END)::{new_type}"
+    )
+    op.execute(f"DROP TYPE {type_name}")
+    op.execute(f"ALTER TYPE {new_type} RENAME TO {type_name}")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for column, type_name, mapping, labels in _UPGRADE:
+        _rebuild(conn, column, type_name, mapping, labels)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for column, type_name, mapping, labels in _DOWNGRADE:
+        _rebuild(conn, column, type_name, mapping, labels)
@@ -0,0 +1,100 @@
+"""Store applications.status and notifications.type as native enums
+
+Both columns were VARCHAR holding one of a small fixed set of labels
+(ApplicationStatus / NotificationType), repeated in full on every row and in
+every index entry. A native enum stores a 4-byte OID, so rows and the status
+indexes shrink and comparisons are integer compares. The app only ever
+writes the enums' values to these columns (lease creation moves an
+application to 'lease_created').
+
+documents.document_type is deliberately left as VARCHAR: it carries
+caller-supplied types outside DocumentType.
+
+The ALTERs rewrite both tables under ACCESS EXCLUSIVE (start.sh runs
+migrations with lock_timeout=5s, so a busy table fails fast rather than
+queueing traffic). Idempotent: a column is only altered while it is still a
+plain string type.
+
+Revision ID: 092f76237873
+Revises: 57516505933b
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "092f76237873"
+down_revision = "57516505933b"
+branch_labels = None
+depends_on = None
+
+
+application_status_enum = postgresql.ENUM(
+    "pending",
+    "reviewing",
+    "approved",
+    "rejected",
+    "withdrawn",
+    "lease_created",
+    name="application_status_enum",
+    create_type=False,
+)
+notification_type_enum = postgresql.ENUM(
+    "application",
+    "message",
+    "visit",
+    "match",
+    "verification",
+    "system",
+    "dispute",
+    "lease",
+    name="notification_type_enum",
+    create_type=False,
+)
+
+# (table, column, enum type, nullable)
+_COLUMNS = [
+    ("applications", "status", application_status_enum, False),
+    ("notifications", "type", notification_type_enum, False),
+]
+
+
+def _column_type(conn, table, column):
+    """Return the reflected SQLAlchemy type for a column, or None if absent."""
+    for col in sa.inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, column, enum_type, nullable in _COLUMNS:
+        enum_type.create(conn, checkfirst=True)
+        current = _column_type(conn, table, column)
+        # sa.Enum subclasses sa.String, so test for the enum first.
+        if current is None or isinstance(current, sa.Enum):
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::{enum_type.name}",
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for table, column, enum_type, nullable in _COLUMNS:
+        current = _column_type(conn, table, column)
+        if isinstance(current, sa.Enum):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::text",
+            )
+        enum_type.drop(conn, checkfirst=True)
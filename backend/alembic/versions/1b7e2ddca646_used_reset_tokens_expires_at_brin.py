@@ -0,0 +1,64 @@
+"""Swap the used_reset_tokens.expires_at btree for a BRIN index (concurrently)
+
+used_reset_tokens is append-only and rows arrive in roughly expires_at order
+(a token expires a fixed time after it is issued), so the heap is naturally
+clustered on that column. BRIN keeps one min/max summary per block range: a
+fraction of the btree's size, near-free on insert, and just as good for the
+only query on it, the range purge DELETE ... WHERE expires_at < now().
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on a live table. Idempotent and reversible.
+
+Revision ID: 1b7e2ddca646
+Revises: a8a7a4950060
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1b7e2ddca646"
+down_revision = "a8a7a4950060"
+branch_labels = None
+depends_on = None
+
+BRIN_INDEX = "ix_used_reset_tokens_expires_brin"
+BTREE_INDEX = "ix_used_reset_tokens_expires_at"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            BRIN_INDEX,
+            "used_reset_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            BTREE_INDEX,
+            table_name="used_reset_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            BTREE_INDEX,
+            "used_reset_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            BRIN_INDEX,
+            table_name="used_reset_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
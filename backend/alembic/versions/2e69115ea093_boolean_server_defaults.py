@@ -0,0 +1,42 @@
+"""Server defaults for the boolean flags on the hot insert paths
+
+messages.is_read, notifications.read, property_manager_access.is_active and
+feature_flags.is_enabled only had ORM-side defaults, so every INSERT carried
+the literal, and raw/bulk inserts left the column NULL (which the
+"read = false" / "is_read = false" partial indexes then miss). Postgres now
+supplies the default; the models omit the column from INSERT and read it
+back via RETURNING (eager_defaults).
+
+SET DEFAULT only touches the catalog; existing rows are not rewritten.
+
+Revision ID: 2e69115ea093
+Revises: de5275ef31b8
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "2e69115ea093"
+down_revision = "de5275ef31b8"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, default)
+_DEFAULTS = [
+    ("messages", "is_read", "false"),
+    ("notifications", "read", "false"),
+    ("property_manager_access", "is_active", "true"),
+    ("feature_flags", "is_enabled", "false"),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in _DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, _default in _DEFAULTS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,60 @@
+"""Add GIN indexes on properties JSONB filter columns (concurrently)
+
+The amenities search filter compiles to amenities @> '["parking"]', which
+sequentially scans every property without an index. GIN indexes turn the
+containment test into an index lookup:
+
+  * amenities, public_transport: default jsonb_ops, which also serves the
+    key-existence operators (?, ?|, ?&).
+  * accepted_guarantor_types: only ever matched by containment, so the
+    smaller/faster jsonb_path_ops operator class is enough.
+
+Created CONCURRENTLY so the operation does not take an ACCESS EXCLUSIVE lock
+on a live table. Idempotent (if_not_exists) and reversible (if_exists).
+
+Revision ID: 4270587c5ef9
+Revises: a3cb9ba7a9fc
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4270587c5ef9"
+down_revision = "a3cb9ba7a9fc"
+branch_labels = None
+depends_on = None
+
+
+# (index_name, column, operator class or None for the default jsonb_ops)
+_INDEXES = [
+    ("ix_properties_amenities_gin", "amenities", None),
+    ("ix_properties_public_transport_gin", "public_transport", None),
+    ("ix_properties_accepted_guarantor_types_gin", "accepted_guarantor_types", "jsonb_path_ops"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, column, opclass in _INDEXES:
+            op.create_index(
+                name,
+                "properties",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: opclass} if opclass else {},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _column, _opclass in _INDEXES:
+            op.drop_index(
+                name,
+                table_name="properties",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,55 @@
+"""Store document_extractions.file_hash as raw bytea
+
+The OCR cache is keyed by a SHA-256 of the uploaded file, stored as a
+64-character hex string. As the raw 32-byte digest the key is half the
+size, so the unique index that gates every extraction lookup is half the
+size too, and comparisons are memcmp instead of collation-aware text
+compares. Existing keys convert in place with decode(file_hash, 'hex');
+the unique index is rebuilt by the ALTER.
+
+Idempotent: the column is only altered while it is still a string type.
+
+Revision ID: 54f17f9aeac0
+Revises: 092f76237873
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "54f17f9aeac0"
+down_revision = "092f76237873"
+branch_labels = None
+depends_on = None
+
+
+def _column_type(conn, table, column):
+    """Return the reflected SQLAlchemy type for a column, or None if absent."""
+    for col in sa.inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def upgrade() -> None:
+    current = _column_type(op.get_bind(), "document_extractions", "file_hash")
+    if current is not None and isinstance(current, sa.String):
+        op.alter_column(
+            "document_extractions",
+            "file_hash",
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="decode(file_hash, 'hex')",
+        )
+
+
+def downgrade() -> None:
+    current = _column_type(op.get_bind(), "document_extractions", "file_hash")
+    if current is not None and isinstance(current, sa.LargeBinary):
+        op.alter_column(
+            "document_extractions",
+            "file_hash",
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using="encode(file_hash, 'hex')",
+        )
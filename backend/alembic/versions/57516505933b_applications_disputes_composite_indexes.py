@@ -0,0 +1,97 @@
+"""Composite indexes for the applications/disputes list paths (concurrently)
+
+Both tables only had single-column FK indexes, so the list endpoints had to
+sort after the index scan, and the pending-applications count had to
+recheck status on the heap:
+
+  * ix_applications_tenant_created (tenant_id, created_at DESC): "my
+    applications" feed in index order.
+  * ix_applications_property_status (property_id, status): landlord
+    pending counts (join on property_id AND status = 'pending').
+  * ix_disputes_lease_created (lease_id, created_at DESC): disputes by lease
+    in index order, and the per-lease daily rate limit (created_at >= ?).
+
+Each supersedes the single-column index on its leading column, which is
+dropped (tenant_id is also the prefix of uq_application_tenant_property).
+Notifications and messages already have their (owner, created_at) indexes.
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on live tables. Idempotent and reversible.
+
+Revision ID: 57516505933b
+Revises: a16dbce4749e
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "57516505933b"
+down_revision = "a16dbce4749e"
+branch_labels = None
+depends_on = None
+
+
+# (table, new index, columns, superseded single-column index, its column)
+_INDEXES = [
+    (
+        "applications",
+        "ix_applications_tenant_created",
+        ["tenant_id", sa.text("created_at DESC")],
+        "ix_applications_tenant_id",
+        "tenant_id",
+    ),
+    (
+        "applications",
+        "ix_applications_property_status",
+        ["property_id", "status"],
+        "ix_applications_property_id",
+        "property_id",
+    ),
+    (
+        "disputes",
+        "ix_disputes_lease_created",
+        ["lease_id", sa.text("created_at DESC")],
+        "ix_disputes_lease_id",
+        "lease_id",
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, name, columns, legacy_name, _legacy_column in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                legacy_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name, _columns, legacy_name, legacy_column in reversed(_INDEXES):
+            op.create_index(
+                legacy_name,
+                table,
+                [legacy_column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,29 @@
+"""Drop the updated_at trigger from visit_slots
+
+a3cb9ba7a9fc originally attached trg_visit_slots_updated_at to visit_slots,
+but that table has no updated_at column (b2baa825acf7 dropped it), so every
+UPDATE on a slot failed with 'record "new" has no field "updated_at"'.
+a3cb9ba7a9fc no longer creates the trigger; this revision removes it from
+databases that already ran the old version. IF EXISTS makes it a no-op
+otherwise.
+
+Revision ID: 5d0c7e9b1f42
+Revises: 67ecea650146
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d0c7e9b1f42"
+down_revision = "67ecea650146"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_visit_slots_updated_at ON visit_slots")
+
+
+def downgrade() -> None:
+    # The trigger was never valid on this table; nothing to restore.
+    pass
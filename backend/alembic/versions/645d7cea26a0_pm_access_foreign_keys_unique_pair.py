@@ -0,0 +1,97 @@
+"""Foreign keys and a unique (manager, landlord) pair on property_manager_access
+
+property_manager_id / landlord_id referenced users only by convention, and
+nothing stopped a second row for the same pair: request-access inserted a
+fresh row whenever the previous grant had been revoked, after which its own
+scalar_one_or_none() lookup raised. The endpoint now reactivates the
+existing row, and the table gets:
+
+  * users FKs (ON DELETE CASCADE - a grant is meaningless once either party
+    is gone; GDPR erasure anonymises rather than deletes, so this only fires
+    on a hard delete).
+  * uq_pm_access_pair UNIQUE (property_manager_id, landlord_id), whose index
+    supersedes the single-column property_manager_id index.
+
+Before the constraints are added, grants whose user no longer exists are
+deleted, and duplicate pairs are collapsed to one row (the active grant,
+else the most recent one). The table holds one row per grant, so the
+constraints are added in-transaction. Idempotent; downgrade restores the
+previous schema but not the removed duplicates.
+
+Revision ID: 645d7cea26a0
+Revises: e23a73320565
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "645d7cea26a0"
+down_revision = "e23a73320565"
+branch_labels = None
+depends_on = None
+
+
+_TABLE = "property_manager_access"
+_UNIQUE = "uq_pm_access_pair"
+_LEGACY_INDEX = "ix_property_manager_access_property_manager_id"
+# (constraint name, column)
+_FKS = [
+    ("property_manager_access_property_manager_id_fkey", "property_manager_id"),
+    ("property_manager_access_landlord_id_fkey", "landlord_id"),
+]
+
+
+def _constraint_names(conn):
+    insp = sa.inspect(conn)
+    names = {fk["name"] for fk in insp.get_foreign_keys(_TABLE)}
+    names.update(uc["name"] for uc in insp.get_unique_constraints(_TABLE))
+    return names
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    existing = _constraint_names(conn)
+
+    op.execute(
+        f"""
+        DELETE FROM {_TABLE} pma
+        WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = pma.property_manager_id)
+           OR NOT EXISTS (SELECT 1 FROM users u WHERE u.id = pma.landlord_id)
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM {_TABLE}
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY property_manager_id, landlord_id
+                    ORDER BY is_active DESC NULLS LAST, granted_at DESC NULLS LAST, id
+                ) AS rn
+                FROM {_TABLE}
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+
+    for name, column in _FKS:
+        if name not in existing:
+            op.create_foreign_key(name, _TABLE, "users", [column], ["id"], ondelete="CASCADE")
+    if _UNIQUE not in existing:
+        op.create_unique_constraint(_UNIQUE, _TABLE, ["property_manager_id", "landlord_id"])
+    # Leading column of the unique pair.
+    op.drop_index(_LEGACY_INDEX, table_name=_TABLE, if_exists=True)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    existing = _constraint_names(conn)
+
+    op.create_index(_LEGACY_INDEX, _TABLE, ["property_manager_id"], unique=False, if_not_exists=True)
+    if _UNIQUE in existing:
+        op.drop_constraint(_UNIQUE, _TABLE, type_="unique")
+    for name, _column in reversed(_FKS):
+        if name in existing:
+            op.drop_constraint(name, _TABLE, type_="foreignkey")
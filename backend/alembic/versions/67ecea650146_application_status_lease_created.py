@@ -0,0 +1,34 @@
+"""Add 'lease_created' to application_status_enum
+
+POST /leases/create moves the application to 'lease_created', but
+092f76237873 originally built the enum without that label, so on a database
+that already ran it every lease creation fails on flush. 092f76237873 now
+includes the label for fresh upgrades; this revision adds it where the type
+already exists. IF NOT EXISTS makes it a no-op in the fresh case.
+
+Postgres cannot drop a value from an enum type, so downgrade leaves it in
+place (harmless: nothing writes it once the app is rolled back).
+
+Revision ID: 67ecea650146
+Revises: 8413efd9be77
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "67ecea650146"
+down_revision = "8413efd9be77"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A new enum label cannot be used in the transaction that adds it.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TYPE application_status_enum ADD VALUE IF NOT EXISTS 'lease_created'"
+        )
+
+
+def downgrade() -> None:
+    pass
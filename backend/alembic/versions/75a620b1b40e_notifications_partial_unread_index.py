@@ -0,0 +1,71 @@
+"""Replace the notifications read indexes with a partial unread index (concurrently)
+
+010 indexed read on its own and (user_id, read). The boolean index is almost
+useless (it mostly holds read = true rows nobody queries), and the composite
+still has to sort for the unread feed. Every unread query — the unread feed,
+the badge count and mark-all-as-read — is user_id = ? AND read = false, so a
+partial (user_id, created_at DESC) WHERE read = false index serves them all
+while only holding the small unread slice of the table.
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on a live table. Idempotent and reversible.
+
+Revision ID: 75a620b1b40e
+Revises: 8eabc48dd00a
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "75a620b1b40e"
+down_revision = "8eabc48dd00a"
+branch_labels = None
+depends_on = None
+
+
+# Superseded by the partial index; restored on downgrade.
+_LEGACY_INDEXES = [
+    ("ix_notifications_read", ["read"]),
+    ("ix_notifications_user_read", ["user_id", "read"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_unread_by_user",
+            "notifications",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("read = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _columns in _LEGACY_INDEXES:
+            op.drop_index(
+                name,
+                table_name="notifications",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in _LEGACY_INDEXES:
+            op.create_index(
+                name,
+                "notifications",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_notifications_unread_by_user",
+            table_name="notifications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
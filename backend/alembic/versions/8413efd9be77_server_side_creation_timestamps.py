@@ -0,0 +1,55 @@
+"""Generate the remaining creation timestamps server-side
+
+team_members, team_member_properties, webhook_subscriptions,
+webhook_deliveries, users, verification_records and onboarding_responses
+still had their creation timestamp filled in by the ORM, i.e. built in Python
+and sent as a bind parameter on every INSERT. Give the columns Postgres
+defaults instead; the team and webhook-subscription mappers fetch the value
+back via RETURNING (eager_defaults) so their create endpoints no longer
+refresh after commit.
+
+The team and webhook columns are TIMESTAMPTZ (a3cb9ba7a9fc) and take now().
+The users-side tables are still naive and compared against naive UTC in the
+app, so they take now() AT TIME ZONE 'utc' (as e030340cdc6f did), and
+users.updated_at keeps its ORM onupdate hook.
+
+SET DEFAULT only touches the catalog; existing rows are not rewritten.
+
+Revision ID: 8413efd9be77
+Revises: 2e69115ea093
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8413efd9be77"
+down_revision = "2e69115ea093"
+branch_labels = None
+depends_on = None
+
+
+_NOW_DEFAULT = sa.text("now()")
+_UTC_NOW_DEFAULT = sa.text("(now() AT TIME ZONE 'utc')")
+
+# (table, column, server default)
+_COLUMNS = [
+    ("team_members", "created_at", _NOW_DEFAULT),
+    ("team_member_properties", "created_at", _NOW_DEFAULT),
+    ("webhook_subscriptions", "created_at", _NOW_DEFAULT),
+    ("webhook_deliveries", "created_at", _NOW_DEFAULT),
+    ("users", "created_at", _UTC_NOW_DEFAULT),
+    ("users", "updated_at", _UTC_NOW_DEFAULT),
+    ("verification_records", "created_at", _UTC_NOW_DEFAULT),
+    ("onboarding_responses", "completed_at", _UTC_NOW_DEFAULT),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in _COLUMNS:
+        op.alter_column(table, column, server_default=default)
+
+
+def downgrade() -> None:
+    for table, column, _default in reversed(_COLUMNS):
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,87 @@
+"""TIMESTAMPTZ for the application, document, dispute and notification tables
+
+a3cb9ba7a9fc moved the 003-006 tables to TIMESTAMPTZ. The remaining core
+tables still stored naive TIMESTAMP values, so the API mixed naive and
+aware datetimes and the app had to write them with naive_utcnow(). Every
+naive timestamp on these tables becomes TIMESTAMPTZ. Existing values are
+UTC (written via naive_utcnow / now() AT TIME ZONE 'utc' / now() on a UTC
+server), so they are converted AT TIME ZONE 'UTC'.
+
+The creation-time defaults added in e030340cdc6f computed naive UTC
+(now() AT TIME ZONE 'utc'). They are dropped before the type change and
+replaced with plain now().
+
+Each ALTER rewrites its table under ACCESS EXCLUSIVE (start.sh runs
+migrations with lock_timeout=5s). Idempotent: columns are only altered
+while they are still naive.
+
+Revision ID: 8a3a58818789
+Revises: 0639b0ad75d8
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8a3a58818789"
+down_revision = "0639b0ad75d8"
+branch_labels = None
+depends_on = None
+
+
+# Naive timestamp columns converted to TIMESTAMPTZ, per table.
+_TIMESTAMP_COLUMNS = {
+    "applications": ["created_at", "updated_at"],
+    "documents": ["created_at", "updated_at"],
+    "disputes": ["responded_at", "mediation_redirected_at", "created_at", "updated_at", "closed_at"],
+    "notifications": ["read_at", "created_at"],
+    "feedback": ["created_at"],
+    "feature_flags": ["created_at", "updated_at"],
+    "property_manager_access": ["granted_at", "revoked_at"],
+}
+
+# Columns whose server default (e030340cdc6f) computes naive UTC.
+_NAIVE_DEFAULTS = {
+    "disputes": "created_at",
+    "notifications": "created_at",
+    "feedback": "created_at",
+    "feature_flags": "created_at",
+    "property_manager_access": "granted_at",
+}
+
+
+def _columns_with_tz(conn, table, columns, timezone):
+    """Return the subset of ``columns`` on ``table`` whose timezone flag matches."""
+    reflected = {c["name"]: c["type"] for c in sa.inspect(conn).get_columns(table)}
+    return [
+        name
+        for name in columns
+        if isinstance(reflected.get(name), sa.DateTime)
+        and bool(reflected[name].timezone) is timezone
+    ]
+
+
+def _convert(timezone, default):
+    conn = op.get_bind()
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        for column in _columns_with_tz(conn, table, columns, not timezone):
+            has_default = _NAIVE_DEFAULTS.get(table) == column
+            if has_default:
+                op.alter_column(table, column, server_default=None)
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=timezone),
+                existing_nullable=True,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+            if has_default:
+                op.alter_column(table, column, server_default=sa.text(default))
+
+
+def upgrade() -> None:
+    _convert(timezone=True, default="now()")
+
+
+def downgrade() -> None:
+    _convert(timezone=False, default="(now() AT TIME ZONE 'utc')")
@@ -0,0 +1,64 @@
+"""Replace ix_notifications_user_id with a (user_id, created_at DESC) feed index (concurrently)
+
+010 built its notification indexes with plain CREATE INDEX inside the
+migration transaction, which is fine for the empty table it had just created
+but blocks writes on a populated one. Index changes on notifications are now
+made CONCURRENTLY from their own revisions.
+
+The feed query is user_id = ? ORDER BY created_at DESC LIMIT n. With only
+ix_notifications_user_id Postgres fetches every row for the user and sorts;
+(user_id, created_at DESC) returns the page in index order, and still serves
+plain user_id lookups (FK checks, deletes), so the single-column index goes.
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on a live table. Idempotent and reversible.
+
+Revision ID: 8eabc48dd00a
+Revises: 4270587c5ef9
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8eabc48dd00a"
+down_revision = "4270587c5ef9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_user_created",
+            "notifications",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_notifications_user_id",
+            table_name="notifications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_user_id",
+            "notifications",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_notifications_user_created",
+            table_name="notifications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
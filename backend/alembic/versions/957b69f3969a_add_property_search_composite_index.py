@@ -0,0 +1,48 @@
+"""Add composite (status, city, monthly_rent) index for property search (concurrently)
+
+The public search path always filters on status and usually narrows by city
+and a rent band. With only single-column indexes Postgres has to bitmap-AND
+ix_properties_status with ix_properties_city or fall back to the least
+selective one; a single composite btree serves the whole predicate in one
+scan. The standalone status/city indexes are kept — other queries still use
+them on their own.
+
+Created CONCURRENTLY so the operation does not take an ACCESS EXCLUSIVE lock
+on a live table. Idempotent (if_not_exists) and reversible (if_exists).
+
+Revision ID: 957b69f3969a
+Revises: b4d2f6a8c1e3
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "957b69f3969a"
+down_revision = "b4d2f6a8c1e3"
+branch_labels = None
+depends_on = None
+
+INDEX = "ix_properties_status_city_rent"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "properties",
+            ["status", "city", "monthly_rent"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX,
+            table_name="properties",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
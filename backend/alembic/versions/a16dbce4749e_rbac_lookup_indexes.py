@@ -0,0 +1,102 @@
+"""Add composite/partial indexes for the RBAC lookups (concurrently)
+
+The permission checks run on nearly every property request and filter on:
+
+- team_members: member_user_id = ? AND status = 'active', joined on
+  landlord_id. Partial (member_user_id, landlord_id) WHERE status = 'active'
+  holds only live memberships and answers the join from the index.
+- team_member_properties: team_member_id = ? AND property_id = ?, reading
+  permission_override. (team_member_id, property_id) INCLUDE
+  (permission_override) is index-only for both the single-property check and
+  the accessible-properties list, and supersedes the team_member_id index.
+- property_manager_access: property_manager_id = ? AND landlord_id = ? AND
+  is_active. Partial (property_manager_id, landlord_id) WHERE is_active.
+
+The grant index is not UNIQUE: nothing enforced that before, and a
+duplicate row would leave an INVALID index behind a failed CONCURRENTLY
+build.
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on live tables. Idempotent and reversible.
+
+Revision ID: a16dbce4749e
+Revises: 1b7e2ddca646
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a16dbce4749e"
+down_revision = "1b7e2ddca646"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_team_members_active_member",
+            "team_members",
+            ["member_user_id", "landlord_id"],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_team_member_properties_member_property",
+            "team_member_properties",
+            ["team_member_id", "property_id"],
+            unique=False,
+            postgresql_include=["permission_override"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Leading column of the composite above.
+        op.drop_index(
+            "ix_team_member_properties_team_member_id",
+            table_name="team_member_properties",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_pm_access_active_pair",
+            "property_manager_access",
+            ["property_manager_id", "landlord_id"],
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_pm_access_active_pair",
+            table_name="property_manager_access",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_team_member_properties_team_member_id",
+            "team_member_properties",
+            ["team_member_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_team_member_properties_member_property",
+            table_name="team_member_properties",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_team_members_active_member",
+            table_name="team_members",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,110 @@
+"""TIMESTAMPTZ for the 003-006 tables and DB-maintained updated_at
+
+The visits/leases, messaging, team and webhook tables mixed naive TIMESTAMP
+columns with the timezone-aware ones on leases, which forces implicit
+conversions when they are compared. (visit_slots has no created_at/updated_at;
+b2baa825acf7 dropped them.) Every naive timestamp on these
+tables becomes TIMESTAMPTZ; existing values are UTC (written via
+naive_utcnow / now() on a UTC server) and are converted AT TIME ZONE 'UTC'.
+
+updated_at on these tables only ever had a server default, so it was either
+stale or written by the app on every UPDATE. A BEFORE UPDATE trigger now
+keeps it current; the models declare it server-maintained instead of adding
+it to each UPDATE statement. The trigger function is plain PL/pgSQL (same
+behaviour as contrib's moddatetime) so no extension has to be installed.
+
+Idempotent: columns are only altered while still naive; the function and
+triggers are created with OR REPLACE / DROP IF EXISTS.
+
+Revision ID: a3cb9ba7a9fc
+Revises: baf3b3efce4d
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a3cb9ba7a9fc"
+down_revision = "baf3b3efce4d"
+branch_labels = None
+depends_on = None
+
+
+# Naive timestamp columns converted to TIMESTAMPTZ, per table.
+_TIMESTAMP_COLUMNS = {
+    "leases": ["created_at", "updated_at"],
+    "conversations": ["last_message_at", "created_at", "updated_at"],
+    "messages": ["read_at", "created_at"],
+    "team_members": ["invite_expires_at", "created_at", "accepted_at", "revoked_at"],
+    "team_member_properties": ["created_at"],
+    "webhook_subscriptions": ["last_triggered_at", "created_at", "updated_at"],
+    "webhook_deliveries": ["created_at", "delivered_at"],
+}
+
+# Tables whose updated_at is maintained by the set_updated_at trigger.
+_UPDATED_AT_TABLES = ["leases", "conversations", "webhook_subscriptions"]
+
+
+def _naive_columns(conn, table, columns):
+    """Return the subset of ``columns`` that exist on ``table`` and are naive."""
+    reflected = {c["name"]: c["type"] for c in sa.inspect(conn).get_columns(table)}
+    return [
+        name
+        for name in columns
+        if isinstance(reflected.get(name), sa.DateTime)
+        and not reflected[name].timezone
+    ]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        for column in _naive_columns(conn, table, columns):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=True,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in _UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in _UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    # leases timestamps were declared timezone-aware by the model before this
+    # revision, so only the columns this revision owns go back.
+    conn = op.get_bind()
+    for table, columns in _TIMESTAMP_COLUMNS.items():
+        if table == "leases":
+            continue
+        reflected = {c["name"]: c["type"] for c in sa.inspect(conn).get_columns(table)}
+        for column in columns:
+            current = reflected.get(column)
+            if isinstance(current, sa.DateTime) and current.timezone:
+                op.alter_column(
+                    table,
+                    column,
+                    type_=sa.DateTime(),
+                    existing_nullable=True,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
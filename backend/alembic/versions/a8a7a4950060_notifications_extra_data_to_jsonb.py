@@ -0,0 +1,55 @@
+"""Store notifications.extra_data as JSONB
+
+010 declared extra_data as VARCHAR holding serialized JSON, so every reader
+had to json.loads it and Postgres could not look inside it. As JSONB it is
+parsed once on write, asyncpg returns it as a dict, and containment filters
+(extra_data @> '{...}') become possible. No query filters on it yet, so no
+GIN index is added.
+
+Idempotent: the column is only altered while it is still a string type.
+
+Revision ID: a8a7a4950060
+Revises: c728377f0493
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "a8a7a4950060"
+down_revision = "c728377f0493"
+branch_labels = None
+depends_on = None
+
+
+def _column_type(conn, table, column):
+    """Return the reflected SQLAlchemy type for a column, or None if absent."""
+    for col in sa.inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def upgrade() -> None:
+    current = _column_type(op.get_bind(), "notifications", "extra_data")
+    if current is not None and isinstance(current, sa.String):
+        op.alter_column(
+            "notifications",
+            "extra_data",
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using="NULLIF(extra_data, '')::jsonb",
+        )
+
+
+def downgrade() -> None:
+    current = _column_type(op.get_bind(), "notifications", "extra_data")
+    if current is not None and not isinstance(current, sa.String):
+        op.alter_column(
+            "notifications",
+            "extra_data",
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using="extra_data::text",
+        )
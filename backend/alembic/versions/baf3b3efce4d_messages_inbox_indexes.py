@@ -0,0 +1,84 @@
+"""Replace single-column message indexes with inbox-shaped ones (concurrently)
+
+The inbox reads a thread as conversation_id = ? ORDER BY created_at, and the
+mark-read path updates conversation_id = ? AND is_read = false. 004 only gave
+us ix_messages_conversation_id and ix_messages_created_at, so every thread
+load sorted after the lookup and created_at on its own served no query.
+
+  * ix_messages_conversation_created (conversation_id, created_at) serves the
+    thread listing in index order and supersedes ix_messages_conversation_id.
+  * ix_messages_unread (conversation_id, created_at DESC) WHERE is_read = false
+    only holds unread rows, so unread lookups/counts stay small as history
+    grows.
+
+Created/dropped CONCURRENTLY so the operation does not take an ACCESS
+EXCLUSIVE lock on a live table. Idempotent and reversible.
+
+Revision ID: baf3b3efce4d
+Revises: c5c0ac579c57
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "baf3b3efce4d"
+down_revision = "c5c0ac579c57"
+branch_labels = None
+depends_on = None
+
+
+# Superseded by the composite index; restored on downgrade.
+_LEGACY_INDEXES = [
+    ("ix_messages_conversation_id", "conversation_id"),
+    ("ix_messages_created_at", "created_at"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_messages_conversation_created",
+            "messages",
+            ["conversation_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_messages_unread",
+            "messages",
+            ["conversation_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("is_read = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _column in _LEGACY_INDEXES:
+            op.drop_index(
+                name,
+                table_name="messages",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in _LEGACY_INDEXES:
+            op.create_index(
+                name,
+                "messages",
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name in ("ix_messages_unread", "ix_messages_conversation_created"):
+            op.drop_index(
+                name,
+                table_name="messages",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,69 @@
+"""Convert webhook counters from String to integer types
+
+webhook_subscriptions.failure_count and webhook_deliveries.status_code /
+duration_ms were created as VARCHAR, so every increment round-tripped through
+str(int(...)) and range filters (failure_count > 5) compared text. They only
+ever hold integers: failure_count and duration_ms become INTEGER, status_code
+(an HTTP status) becomes SMALLINT. failure_count also gets a real '0' server
+default; 006 only set a Python-side default.
+
+Idempotent: each column is only altered if it is still a string type.
+
+Revision ID: c5c0ac579c57
+Revises: 957b69f3969a
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c5c0ac579c57"
+down_revision = "957b69f3969a"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, target type, cast, server_default)
+_COLUMNS = [
+    ("webhook_subscriptions", "failure_count", sa.Integer(), "integer", "0"),
+    ("webhook_deliveries", "status_code", sa.SmallInteger(), "smallint", None),
+    ("webhook_deliveries", "duration_ms", sa.Integer(), "integer", None),
+]
+
+
+def _column_type(conn, table, column):
+    """Return the reflected SQLAlchemy type for a column, or None if absent."""
+    for col in sa.inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, column, type_, cast, server_default in _COLUMNS:
+        current = _column_type(conn, table, column)
+        if current is not None and isinstance(current, sa.String):
+            op.alter_column(
+                table,
+                column,
+                type_=type_,
+                existing_nullable=True,
+                server_default=server_default,
+                postgresql_using=f"NULLIF({column}, '')::{cast}",
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for table, column, _type, _cast, _default in _COLUMNS:
+        current = _column_type(conn, table, column)
+        if current is not None and not isinstance(current, sa.String):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(),
+                existing_nullable=True,
+                server_default=None,
+                postgresql_using=f"{column}::varchar",
+            )
@@ -0,0 +1,48 @@
+"""Index used_reset_tokens.expires_at for expiry purges (concurrently)
+
+008 only indexed token_hash, so purging spent tokens
+(DELETE FROM used_reset_tokens WHERE expires_at < now()) has to scan the
+whole table. A btree on expires_at turns it into a range scan.
+
+The matching (user_id, created_at DESC) index for notification pagination
+already exists as ix_notifications_user_created (8eabc48dd00a).
+
+Created CONCURRENTLY so the operation does not take an ACCESS EXCLUSIVE lock
+on a live table. Idempotent (if_not_exists) and reversible (if_exists).
+
+Revision ID: c728377f0493
+Revises: 75a620b1b40e
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c728377f0493"
+down_revision = "75a620b1b40e"
+branch_labels = None
+depends_on = None
+
+INDEX = "ix_used_reset_tokens_expires_at"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "used_reset_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX,
+            table_name="used_reset_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,67 @@
+"""Time-ordered UUIDv7 primary keys for messages, notifications and feedback
+
+These are the insert-heaviest tables, and their ids were random UUIDv4
+(uuid.uuid4 in the ORM, gen_random_uuid() since e030340cdc6f). A random key
+lands each insert on an arbitrary leaf of the primary-key btree, so inserts
+keep splitting pages and dirtying cold ones. UUIDv7 leads with a millisecond
+timestamp, so new keys append to the rightmost leaf. The column type stays
+uuid and existing ids are untouched.
+
+Postgres 15 has no built-in v7 generator. uuid_generate_v7() builds one in
+SQL: it takes the random bytes of gen_random_uuid(), overlays the 48-bit
+Unix-millisecond timestamp, and sets the version nibble to 7. The variant
+bits are already correct.
+
+SET DEFAULT only touches the catalog. Idempotent: CREATE OR REPLACE.
+
+Revision ID: de5275ef31b8
+Revises: 0783157913f8
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "de5275ef31b8"
+down_revision = "0783157913f8"
+branch_labels = None
+depends_on = None
+
+
+_TABLES = ["messages", "notifications", "feedback"]
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            placing substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    # messages had no server default before; the others used gen_random_uuid().
+    op.alter_column("messages", "id", server_default=None)
+    for table in _TABLES[1:]:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,51 @@
+"""Generate ids and creation timestamps server-side
+
+disputes, feedback, feature_flags, notifications and property_manager_access
+had their primary key (uuid4) and creation timestamp filled in by the ORM.
+Give the columns Postgres defaults instead so every insert path - ORM, bulk
+and raw SQL - gets them, and the ORM fetches both back via RETURNING
+(eager_defaults) rather than a follow-up SELECT.
+
+gen_random_uuid() is built in from Postgres 13. The timestamp columns are
+naive and compared against naive UTC in the app, so the default is
+now() AT TIME ZONE 'utc' rather than the session-local now().
+
+SET DEFAULT only touches the catalog; existing rows are not rewritten.
+
+Revision ID: e030340cdc6f
+Revises: 54f17f9aeac0
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e030340cdc6f"
+down_revision = "54f17f9aeac0"
+branch_labels = None
+depends_on = None
+
+
+_UUID_DEFAULT = sa.text("gen_random_uuid()")
+_UTC_NOW_DEFAULT = sa.text("(now() AT TIME ZONE 'utc')")
+
+# (table, creation timestamp column)
+_TABLES = [
+    ("disputes", "created_at"),
+    ("feedback", "created_at"),
+    ("feature_flags", "created_at"),
+    ("notifications", "created_at"),
+    ("property_manager_access", "granted_at"),
+]
+
+
+def upgrade() -> None:
+    for table, timestamp_column in _TABLES:
+        op.alter_column(table, "id", server_default=_UUID_DEFAULT)
+        op.alter_column(table, timestamp_column, server_default=_UTC_NOW_DEFAULT)
+
+
+def downgrade() -> None:
+    for table, timestamp_column in reversed(_TABLES):
+        op.alter_column(table, timestamp_column, server_default=None)
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,69 @@
+"""Store property_manager_access.management_fee_percentage as NUMERIC(5, 2)
+
+The fee was VARCHAR ("stored as string for flexibility"), so it could not be
+summed or compared in SQL and had to be parsed before any arithmetic.
+NUMERIC(5, 2) holds every percentage exactly, and the new CHECK keeps it
+within 0-100. Blank strings become NULL.
+
+The ALTER rewrites the table under ACCESS EXCLUSIVE; the table holds one row
+per manager/landlord grant. Idempotent: the column is only altered while it
+is still a string type, and the constraint is only added when missing.
+
+Revision ID: e23a73320565
+Revises: e030340cdc6f
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e23a73320565"
+down_revision = "e030340cdc6f"
+branch_labels = None
+depends_on = None
+
+
+_TABLE = "property_manager_access"
+_COLUMN = "management_fee_percentage"
+_CHECK = "ck_pm_access_fee_percentage"
+
+
+def _column_type(conn, table, column):
+    """Return the reflected SQLAlchemy type for a column, or None if absent."""
+    for col in sa.inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def _has_check(conn, table, name):
+    return any(c["name"] == name for c in sa.inspect(conn).get_check_constraints(table))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if isinstance(_column_type(conn, _TABLE, _COLUMN), sa.String):
+        op.alter_column(
+            _TABLE,
+            _COLUMN,
+            type_=sa.Numeric(5, 2),
+            existing_nullable=True,
+            postgresql_using=f"NULLIF(trim({_COLUMN}), '')::numeric(5,2)",
+        )
+    if not _has_check(conn, _TABLE, _CHECK):
+        op.create_check_constraint(_CHECK, _TABLE, f"{_COLUMN} BETWEEN 0 AND 100")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if _has_check(conn, _TABLE, _CHECK):
+        op.drop_constraint(_CHECK, _TABLE, type_="check")
+    current = _column_type(conn, _TABLE, _COLUMN)
+    if current is not None and not isinstance(current, sa.String):
+        op.alter_column(
+            _TABLE,
+            _COLUMN,
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using=f"{_COLUMN}::text",
+        )
@@ -6,8 +6,6 @@ Create Date: 2026-02-23 02:24:17.805979
 
 """
 
-import sqlalchemy as sa
-
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -18,17 +16,22 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Adding google_id and marketing consent columns to users table
-    op.add_column("users", sa.Column("google_id", sa.String(), nullable=True))
-    op.add_column(
-        "users",
-        sa.Column(
-            "marketing_consent", sa.Boolean(), server_default="false", nullable=False
-        ),
-    )
-    op.add_column(
-        "users", sa.Column("marketing_consent_at", sa.DateTime(), nullable=True)
+    # Adding google_id and marketing consent columns to users table, in a
+    # single ALTER TABLE. The constant false default is stored in the catalog
+    # (PostgreSQL 11+), so NOT NULL DEFAULT false does not rewrite the table;
+    # the only cost is the brief ACCESS EXCLUSIVE lock. Bound the wait for it
+    # so a long-running transaction makes the migration fail fast instead of
+    # queueing every users query behind it.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        """
+        ALTER TABLE users
+            ADD COLUMN google_id VARCHAR,
+            ADD COLUMN marketing_consent BOOLEAN DEFAULT false NOT NULL,
+            ADD COLUMN marketing_consent_at TIMESTAMP WITHOUT TIME ZONE
+        """
     )
+    op.execute("SET LOCAL lock_timeout TO DEFAULT")
 
     # Create the index for google_id
     op.create_index(op.f("ix_users_google_id"), "users", ["google_id"], unique=False)
@@ -39,6 +42,11 @@ def downgrade() -> None:
     op.drop_index(op.f("ix_users_google_id"), table_name="users")
 
     # Drop the columns
-    op.drop_column("users", "marketing_consent_at")
-    op.drop_column("users", "marketing_consent")
-    op.drop_column("users", "google_id")
+    op.execute(
+        """
+        ALTER TABLE users
+            DROP COLUMN marketing_consent_at,
+            DROP COLUMN marketing_consent,
+            DROP COLUMN google_id
+        """
+    )
@@ -0,0 +1,68 @@
+"""Add pg_trgm GIN indexes for the property location search (concurrently)
+
+The city filter on the property search compiles to
+
+    city ILIKE '%term%' OR postal_code ILIKE '%term%'
+        OR address_line1 ILIKE '%term%'
+
+A leading wildcard cannot use the btree indexes, so every search scanned
+all properties. Trigram GIN indexes (gin_trgm_ops) on the three columns
+let the planner answer each arm from an index and BitmapOr the results.
+
+title/description are only matched inside the colocation filter, OR'ed
+with a cast of amenities to text that no index can serve, and
+feedback.message is never searched. Indexing them would only add write
+cost.
+
+pg_trgm is a trusted extension (Postgres 13+), so the database owner can
+create it. Indexes are created CONCURRENTLY so the operation does not take
+an ACCESS EXCLUSIVE lock on a live table. Idempotent and reversible; the
+extension is left installed on downgrade.
+
+Revision ID: f289a8e4a008
+Revises: 645d7cea26a0
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f289a8e4a008"
+down_revision = "645d7cea26a0"
+branch_labels = None
+depends_on = None
+
+
+# (index_name, column)
+_INDEXES = [
+    ("ix_properties_city_trgm", "city"),
+    ("ix_properties_postal_code_trgm", "postal_code"),
+    ("ix_properties_address_line1_trgm", "address_line1"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, column in _INDEXES:
+            op.create_index(
+                name,
+                "properties",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _column in _INDEXES:
+            op.drop_index(
+                name,
+                table_name="properties",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
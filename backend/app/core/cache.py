@@ -3,15 +3,50 @@ Redis Caching Layer - Netflix Style
 Provides distributed caching with automatic invalidation and TTL management.
 """
 
+import asyncio
 import hashlib
+import inspect
 import json
 import logging
 import os
+import time
+import zlib
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Keys per SCAN page / DEL call when invalidating by pattern.
+_SCAN_BATCH = 500
+
+# Values are stored as bytes with a one-byte tag: b"r" + raw JSON, or b"z" +
+# deflated JSON once the payload is big enough for compression to pay for
+# itself. Untagged values are legacy JSON strings written before tagging.
+_COMPRESS_MIN_BYTES = 1024
+_TAG_RAW = b"r"
+_TAG_ZLIB = b"z"
+
+# In-process L1 in front of Redis for cached(). Short TTL bounds staleness if
+# a cross-process invalidation message is missed.
+_L1_MAXSIZE = 4096
+_L1_TTL_SECONDS = 30
+# Pub/sub channel carrying L1 evictions between processes. Messages are
+# b"k:<key>" (one key) or b"p:<prefix>" (every key under a prefix).
+_INVALIDATE_CHANNEL = "cache-invalidate"
+# Listener reconnect backoff after the subscription drops (seconds).
+_LISTENER_BACKOFF_MIN = 1.0
+_LISTENER_BACKOFF_MAX = 30.0
+_MISSING = object()
+# Single-flight result meaning "the computing task was cancelled; retry".
+_ABANDONED = object()
+
+# Parameters that carry request-scoped plumbing rather than cache identity;
+# cached() leaves them out of the key.
+_UNKEYED_PARAMS = frozenset({"self", "db", "session", "request"})
+
 # Optional Redis import - graceful fallback if not installed
 try:
     from redis.asyncio import Redis as AsyncRedis
@@ -28,6 +63,47 @@ except ImportError:
         REDIS_AVAILABLE = False
 
 
+class _LocalCache:
+    """Small in-process TTL + LRU map used as the L1 tier of cached().
+
+    Only touched from the event loop thread and never across an await, so
+    it needs no lock. cached() stores encoded JSON here, not live objects,
+    so callers can't mutate each other's hits.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def pop_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
 class CacheLayer:
     """
     Netflix-style caching layer with:
@@ -36,6 +112,10 @@ class CacheLayer:
     - TTL management
     - Cache invalidation
     - Graceful degradation
+    - In-process L1 (TTL/LRU) in front of Redis for cached(), kept coherent
+      across processes over Redis pub/sub
+    - Single-flight misses: concurrent callers missing the same key share one
+      computation instead of stampeding the database
 
     Uses redis.asyncio so all I/O is non-blocking and safe inside an async
     event loop (the previous sync redis.Redis client would block the loop).
@@ -43,10 +123,16 @@ class CacheLayer:
 
     def __init__(self):
         self.redis_client: Optional[AsyncRedis] = None  # type: ignore
+        # Dedicated connection for the invalidation subscription (see _connect)
+        self._pubsub_client: Optional[AsyncRedis] = None  # type: ignore
         # Connection is deferred to first use (or explicit connect call)
         # because __init__ cannot be async. Call await cache.connect() on
         # startup, or let the first operation lazily connect.
         self._connected = False
+        self._local = _LocalCache(_L1_MAXSIZE, _L1_TTL_SECONDS)
+        self._listener: Optional[asyncio.Task] = None
+        # cache_key -> future of the one in-flight computation for that key
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def connect(self):
         """Async connect to Redis. Call once from app startup."""
@@ -78,14 +164,30 @@ class CacheLayer:
                 import asyncio
                 client = AsyncRedis.from_url(
                     redis_url,
-                    decode_responses=True,
+                    # Values are tagged bytes (see _encode); skip the
+                    # per-reply UTF-8 decode.
+                    decode_responses=False,
                     socket_timeout=5,
                     socket_connect_timeout=5,
+                    socket_keepalive=True,
+                    max_connections=100,
                     **ssl_kwargs,
                 )
                 await client.ping()
                 self.redis_client = client
                 self._connected = True
+                # The subscription sits idle between invalidations, so it gets
+                # its own connection without the 5s read timeout (an idle
+                # listen() would otherwise time out and end the listener).
+                self._pubsub_client = AsyncRedis.from_url(
+                    redis_url,
+                    decode_responses=False,
+                    socket_timeout=None,
+                    socket_connect_timeout=5,
+                    socket_keepalive=True,
+                    **ssl_kwargs,
+                )
+                self._listener = asyncio.create_task(self._listen_for_invalidations())
                 logger.info("✅ Redis cache connected (async)")
                 return
             except Exception as e:
@@ -114,11 +216,154 @@ class CacheLayer:
                     logger.error(f"⚠️ Redis connection failed: {e}. Running without cache.")
                 return
 
+    @staticmethod
+    def _arg_hash(args: tuple, kwargs: dict) -> str:
+        """Hash function arguments for a cache key.
+
+        Runs on every cached call, so it avoids json.dumps (the dominant cost
+        of the old md5 key): repr() of the arguments is C-level and stable for
+        the primitive values callers pass, and blake2b with an 8-byte digest
+        is a C hash that beats md5 on short inputs.
+        """
+        key_data = repr((args, sorted(kwargs.items()))).encode()
+        return hashlib.blake2b(key_data, digest_size=8).hexdigest()
+
     def _make_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate cache key from function arguments"""
-        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
-        key_hash = hashlib.md5(key_data.encode()).hexdigest()[:12]
-        return f"{prefix}:{key_hash}"
+        return f"{prefix}:{self._arg_hash(args, kwargs)}"
+
+    @classmethod
+    def _key_builder(cls, func: Callable) -> Callable[[tuple, dict], str]:
+        """Build a per-function argument hasher for cached().
+
+        The signature is inspected once at decoration time. The returned
+        builder normalises each call to the function's keyed parameters in
+        declaration order (defaults filled in), so f("paris") and
+        f(city="paris") share a key, and db sessions/requests are never hashed.
+        Functions taking *args/**kwargs fall back to hashing the raw call.
+        """
+        params = list(inspect.signature(func).parameters.values())
+        if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params):
+            return cls._arg_hash
+
+        positional = tuple(
+            p.name for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+        )
+        keyed = tuple(
+            (p.name, None if p.default is p.empty else p.default)
+            for p in params
+            if p.name not in _UNKEYED_PARAMS
+        )
+
+        def build(args: tuple, kwargs: dict) -> str:
+            bound = dict(zip(positional, args))
+            if kwargs:
+                bound.update(kwargs)
+            values = tuple(bound.get(name, default) for name, default in keyed)
+            return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+
+        return build
+
+    async def close(self):
+        """Stop the invalidation listener and close the Redis connections.
+        Call once from app shutdown."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        for client in (self._pubsub_client, self.redis_client):
+            if client is not None:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.warning(f"Cache close error: {e}")
+        self._pubsub_client = self.redis_client = None
+        self._connected = False
+
+    async def _listen_for_invalidations(self):
+        """Evict L1 entries announced by other processes on the pub/sub channel.
+
+        Runs until cancelled. If the subscription drops it resubscribes with
+        capped exponential backoff, and clears L1 first: messages sent while
+        disconnected are lost, so any local entry may be stale.
+        """
+        backoff = _LISTENER_BACKOFF_MIN
+        while True:
+            pubsub = self._pubsub_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(_INVALIDATE_CHANNEL)
+                backoff = _LISTENER_BACKOFF_MIN
+                async for message in pubsub.listen():
+                    self._evict_local(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Cache invalidation listener dropped: {e}; resubscribing in {backoff:.0f}s"
+                )
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            self._local.clear()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _LISTENER_BACKOFF_MAX)
+
+    def _evict_local(self, data) -> None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        if not isinstance(data, str) or len(data) < 2:
+            return
+        kind, target = data[:2], data[2:]
+        if kind == "k:":
+            self._local.pop(target)
+        elif kind == "p:":
+            self._local.pop_prefix(target)
+
+    async def _publish_invalidation(self, message: str) -> None:
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.publish(_INVALIDATE_CHANNEL, message)
+        except Exception as e:
+            logger.error(f"Cache publish error: {e}")
+
+    async def invalidate_local(self, key: str) -> None:
+        """Evict ``key`` from the L1 tier in this and every other process."""
+        self._local.pop(key)
+        await self._publish_invalidation(f"k:{key}")
+
+    async def invalidate_local_prefix(self, prefix: str) -> None:
+        """Evict every L1 key starting with ``prefix``, in every process."""
+        self._local.pop_prefix(prefix)
+        await self._publish_invalidation(f"p:{prefix}")
+
+    @staticmethod
+    def _encode_local(value: Any) -> bytes:
+        """Serialize a value for the L1 tier (same JSON as Redis, untagged)."""
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a value for storage (orjson, deflated when large)."""
+        raw = orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+        if len(raw) > _COMPRESS_MIN_BYTES:
+            return _TAG_ZLIB + zlib.compress(raw, 1)
+        return _TAG_RAW + raw
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        """Inverse of _encode; also reads untagged legacy JSON values."""
+        tag = payload[:1]
+        if tag == _TAG_ZLIB:
+            return orjson.loads(zlib.decompress(payload[1:]))
+        if tag == _TAG_RAW:
+            return orjson.loads(payload[1:])
+        return json.loads(payload)
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
@@ -127,17 +372,34 @@ class CacheLayer:
         try:
             value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return self._decode(value)
         except Exception as e:
             logger.error(f"Cache get error: {e}")
         return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip (pipelined GETs).
+
+        Returns a list aligned with ``keys``; misses are None.
+        """
+        if not self.redis_client or not keys:
+            return [None] * len(keys)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                values = await pipe.execute()
+            return [self._decode(v) if v else None for v in values]
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+        return [None] * len(keys)
+
     async def set(self, key: str, value: Any, ttl: int = 300) -> bool:
         """Set value in cache with TTL (default 5 minutes)"""
         if not self.redis_client:
             return False
         try:
-            await self.redis_client.setex(key, ttl, json.dumps(value, default=str))
+            await self.redis_client.setex(key, ttl, self._encode(value))
             return True
         except Exception as e:
             logger.error(f"Cache set error: {e}")
@@ -155,16 +417,65 @@ class CacheLayer:
             return False
 
     async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching pattern"""
+        """Invalidate all keys matching pattern.
+
+        Walks the keyspace with SCAN (never the blocking KEYS) and deletes in
+        pipelined chunks. Prefer invalidate_group() for cached() prefixes —
+        it is a single INCR regardless of how many entries the group holds.
+        """
         if not self.redis_client:
             return 0
+        deleted = 0
+        try:
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=_SCAN_BATCH):
+                batch.append(key)
+                if len(batch) >= _SCAN_BATCH:
+                    deleted += await self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.delete(*batch)
+        except Exception as e:
+            logger.error(f"Cache invalidate error: {e}")
+        return deleted
+
+    async def _current_rev(self, group: str) -> str:
+        """Current generation of a key group (see invalidate_group).
+
+        Seeded with the current time in ms rather than 0 so that, if the rev
+        key is ever evicted, new keys can't collide with entries written
+        under an older generation.
+        """
+        if not self.redis_client:
+            return "0"
+        rev_key = f"rev:{group}"
+        try:
+            rev = await self.redis_client.get(rev_key)
+            if rev is None:
+                seed = str(int(time.time() * 1000))
+                if await self.redis_client.set(rev_key, seed, nx=True):
+                    return seed
+                rev = await self.redis_client.get(rev_key)
+            return rev.decode() if isinstance(rev, bytes) else str(rev)
+        except Exception as e:
+            logger.error(f"Cache rev error: {e}")
+            return "0"
+
+    async def invalidate_group(self, group: str) -> bool:
+        """Invalidate every cached() entry under ``group`` in O(1).
+
+        Keys embed the group's generation, so bumping it orphans all current
+        entries at once; they age out through their own TTL.
+        """
+        await self.invalidate_local_prefix(f"{group}:")
+        if not self.redis_client:
+            return False
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                return await self.redis_client.delete(*keys)
+            await self.redis_client.incr(f"rev:{group}")
+            return True
         except Exception as e:
             logger.error(f"Cache invalidate error: {e}")
-        return 0
+            return False
 
     async def incr_with_expire(self, key: str, ttl: int) -> int:
         """Atomically increment a counter and set TTL on first write. Returns new count."""
@@ -191,24 +502,61 @@ class CacheLayer:
         """
 
         def decorator(func: Callable):
+            key_for = self._key_builder(func)
+
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                # Generate cache key
-                cache_key = self._make_key(prefix, *args, **kwargs)
+                arg_hash = key_for(args, kwargs)
+                local_key = f"{prefix}:{arg_hash}"
+
+                # L1 first: no network round trip for the hot working set.
+                # Decoded per hit so each caller gets its own object.
+                local_value = self._local.get(local_key, _MISSING)
+                if local_value is not _MISSING:
+                    return orjson.loads(local_value)
+
+                # Redis key is scoped to the prefix's current generation
+                rev = await self._current_rev(prefix)
+                cache_key = f"{prefix}:v{rev}:{arg_hash}"
 
-                # Try cache first
                 cached_value = await self.get(cache_key)
                 if cached_value is not None:
+                    self._local.set(local_key, self._encode_local(cached_value))
                     return cached_value
 
-                # Execute function
-                result = await func(*args, **kwargs)
-
-                # Cache result
-                if result is not None:
-                    await self.set(cache_key, result, ttl)
-
-                return result
+                # Another task is already computing this key: share its result
+                # (as encoded JSON, so every waiter decodes its own copy). If
+                # that task is cancelled, the waiters go round again and one
+                # of them computes.
+                while (pending := self._inflight.get(cache_key)) is not None:
+                    shared = await asyncio.shield(pending)
+                    if shared is not _ABANDONED:
+                        return None if shared is None else orjson.loads(shared)
+
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[cache_key] = future
+                try:
+                    result = await func(*args, **kwargs)
+                    payload = None
+                    if result is not None:
+                        payload = self._encode_local(result)
+                        self._local.set(local_key, payload)
+                        await self.set(cache_key, result, ttl)
+                except Exception as e:
+                    future.set_exception(e)
+                    # Waiters re-raise it; don't warn when nobody was waiting.
+                    future.exception()
+                    raise
+                except BaseException:
+                    # This caller was cancelled (e.g. client disconnect); that
+                    # says nothing about the waiters' requests.
+                    future.set_result(_ABANDONED)
+                    raise
+                else:
+                    future.set_result(payload)
+                    return result
+                finally:
+                    del self._inflight[cache_key]
 
             return wrapper
 
@@ -238,9 +586,11 @@ async def get_cached_property(property_id: str):
 async def invalidate_property_cache(property_id: str):
     """Invalidate property cache after updates"""
     await cache.delete(f"property:{property_id}")
-    await cache.invalidate_pattern(f"properties:*")  # Invalidate listings
+    await cache.invalidate_local(f"property:{property_id}")
+    await cache.invalidate_group("properties")  # Invalidate listings
 
 
 async def invalidate_user_cache(user_id: str):
     """Invalidate user-related caches"""
+    await cache.invalidate_local_prefix(f"user:{user_id}:")
     await cache.invalidate_pattern(f"user:{user_id}:*")
@@ -6,6 +6,7 @@ Prevents cascade failures by failing fast when external services are down.
 import asyncio
 import inspect
 import logging
+import random
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -21,7 +22,7 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """
     Netflix Hystrix-style circuit breaker.
@@ -46,40 +47,67 @@ class CircuitBreaker:
     state: CircuitState = field(default=CircuitState.CLOSED)
     failure_count: int = field(default=0)
     success_count: int = field(default=0)
-    last_failure_time: float = field(default=0.0)
+    last_failure_time: float = field(default=0.0)  # wall clock, for reporting
     half_open_calls: int = field(default=0)
+    # Bumped on every OPEN -> HALF_OPEN transition, so a probe can tell
+    # whether the slot it claimed still belongs to the current recovery test
+    half_open_epoch: int = field(default=0)
+    # time.monotonic() deadline after which an OPEN circuit may be probed
+    _open_until: float = field(default=0.0, repr=False)
 
     def _should_allow_request(self) -> bool:
-        """Check if request should be allowed based on current state"""
-        if self.state == CircuitState.CLOSED:
+        """Check if request should be allowed based on current state.
+
+        Runs synchronously on the event loop, so each check-and-update below
+        is atomic with respect to other tasks: exactly one caller performs
+        the OPEN -> HALF_OPEN transition, and half-open probe slots are
+        claimed at admission rather than when a probe finishes, so a burst
+        can never let more than half_open_max_calls through. A cancelled
+        probe returns its slot (see _release_probe).
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
             return True
 
-        if self.state == CircuitState.OPEN:
+        if state is CircuitState.OPEN:
             # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self._transition_to_half_open()
-                return True
-            return False
-
-        if self.state == CircuitState.HALF_OPEN:
-            # Allow limited calls in half-open state
-            if self.half_open_calls < self.half_open_max_calls:
-                return True
-            return False
+            if time.monotonic() < self._open_until:
+                return False
+            self._transition_to_half_open()
 
+        # HALF_OPEN: claim one of the limited probe slots
+        if self.half_open_calls < self.half_open_max_calls:
+            self.half_open_calls += 1
+            return True
         return False
 
     def _transition_to_half_open(self):
         """Transition to half-open state"""
         self.state = CircuitState.HALF_OPEN
         self.half_open_calls = 0
+        self.success_count = 0
+        self.half_open_epoch += 1
         logger.warning("Circuit '%s' transitioning to HALF_OPEN", self.name)
 
+    def _trip(self):
+        """Open the circuit until the recovery timeout elapses"""
+        self.state = CircuitState.OPEN
+        self._open_until = time.monotonic() + self.recovery_timeout
+
+    def _release_probe(self, epoch: int):
+        """Give back a half-open slot whose probe ended without a verdict
+        (cancelled), so the recovery test can still complete."""
+        if (
+            self.state is CircuitState.HALF_OPEN
+            and self.half_open_epoch == epoch
+            and self.half_open_calls > 0
+        ):
+            self.half_open_calls -= 1
+
     def _record_success(self):
         """Record successful call"""
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.HALF_OPEN:
             self.success_count += 1
-            self.half_open_calls += 1
 
             # If enough successes, close the circuit
             if self.success_count >= self.half_open_max_calls:
@@ -96,15 +124,15 @@ class CircuitBreaker:
         self.failure_count += 1
         self.last_failure_time = time.time()
 
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.HALF_OPEN:
             # Failed during recovery test, reopen
-            self.state = CircuitState.OPEN
+            self._trip()
             self.success_count = 0
             logger.error("Circuit '%s' reopened (recovery failed)", self.name)
 
-        elif self.state == CircuitState.CLOSED:
+        elif self.state is CircuitState.CLOSED:
             if self.failure_count >= self.failure_threshold:
-                self.state = CircuitState.OPEN
+                self._trip()
                 logger.error("Circuit '%s' OPEN (threshold reached)", self.name)
 
 
@@ -120,9 +148,10 @@ _circuit_breakers: dict[str, CircuitBreaker] = {}
 
 def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
     """Get or create a circuit breaker by name"""
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(name=name, **kwargs)
-    return _circuit_breakers[name]
+    cb = _circuit_breakers.get(name)
+    if cb is None:
+        cb = _circuit_breakers[name] = CircuitBreaker(name=name, **kwargs)
+    return cb
 
 
 def circuit_breaker(
@@ -147,14 +176,17 @@ def circuit_breaker(
     """
 
     def decorator(func: Callable):
+        # Registered once at decoration (import) time and bound into the
+        # closure, so calls skip the registry lookup and can never race to
+        # create competing breakers for the same name.
+        cb = get_circuit_breaker(
+            name,
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cb = get_circuit_breaker(
-                name,
-                failure_threshold=failure_threshold,
-                recovery_timeout=recovery_timeout,
-            )
-
             if not cb._should_allow_request():
                 if fallback:
                     return (
@@ -163,16 +195,22 @@ def circuit_breaker(
                         else fallback(*args, **kwargs)
                     )
                 raise CircuitBreakerError(
-                    f"Circuit '{name}' is OPEN. Service unavailable."
+                    f"Circuit '{name}' is {cb.state.name}. Service unavailable."
                 )
 
+            epoch = cb.half_open_epoch
             try:
                 result = await func(*args, **kwargs)
-                cb._record_success()
-                return result
-            except Exception as e:
+            except Exception:
                 cb._record_failure()
                 raise
+            except BaseException:
+                # Cancelled (or interpreter exit): not a verdict on the
+                # service, but a half-open slot must not leak.
+                cb._release_probe(epoch)
+                raise
+            cb._record_success()
+            return result
 
         return wrapper
 
@@ -188,30 +226,33 @@ def with_retry(
     """
     Decorator for exponential backoff retry.
 
+    Each sleep is drawn uniformly from [delay/2, delay] so callers that failed
+    together don't retry in lock-step against the same recovering service.
+
     Usage:
         @with_retry(max_attempts=3)
         async def flaky_operation():
             return await external_api.call()
     """
+    # Backoff before each retry, computed once; None marks the final attempt.
+    schedule = tuple(
+        min(initial_delay * exponential_base**i, max_delay)
+        for i in range(max_attempts - 1)
+    ) + (None,)
 
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
+            if max_attempts < 1:
+                raise ValueError("max_attempts must be >= 1")
 
-            for attempt in range(max_attempts):
+            for delay in schedule:
                 try:
                     return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        await asyncio.sleep(min(delay, max_delay))
-                        delay *= exponential_base
-
-            if last_exception is None:
-                raise ValueError("max_attempts must be >= 1")
-            raise last_exception
+                except Exception:
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(random.uniform(delay / 2, delay))
 
         return wrapper
 
@@ -13,6 +13,16 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Argon2id password hashing cost. Login latency is dominated by one hash,
+    # so tune these against the hash time logged at startup when
+    # LOG_PASSWORD_HASH_COST is on (target roughly 150-250 ms on production
+    # hardware). Defaults match the parameters of existing hashes; changing
+    # them re-hashes each user on their next login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    # Off by default: the benchmark is a full hash (64 MiB) per process boot.
+    LOG_PASSWORD_HASH_COST: bool = False
 
     # Redis Cache
     REDIS_URL: Optional[str] = None
@@ -51,6 +61,9 @@ class Settings(BaseSettings):
 
     # GDPR & Privacy
     MASTER_ENCRYPTION_KEY: Optional[str] = None
+    # Nightly sweep deletes READ notifications older than this many days
+    # (unread ones are never swept). 0 disables the sweep.
+    NOTIFICATION_RETENTION_DAYS: int = 0
 
     # Trust Layer — Ed25519 credential signing key (hex-encoded 32-byte seed).
     # If absent (dev), an ephemeral key is generated. MUST be set in production.
@@ -1,5 +1,6 @@
 import os
 
+import orjson
 from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
                                     create_async_engine)
 from sqlalchemy.orm import declarative_base
@@ -11,6 +12,16 @@ from app.core.config import settings
 # Adjust these based on your database limits
 POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
 MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+# Prepared statements cached per connection (asyncpg + SQLAlchemy's adapter).
+# Set to 0 when connecting through PgBouncer in transaction pooling mode.
+STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+
+
+def _json_dumps(value) -> str:
+    """JSON/JSONB bind serializer. orjson is several times faster than the
+    stdlib encoder; OPT_NON_STR_KEYS keeps json.dumps' int-key coercion."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Render provides `postgres://` but we need `postgresql+asyncpg://`
 url = settings.DATABASE_URL
@@ -30,6 +41,23 @@ engine = create_async_engine(
     pool_timeout=30,  # Wait for connection before error
     pool_recycle=1800,  # Recycle connections every 30 min
     pool_pre_ping=True,  # Health check connections
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+    # Sessions always end with commit/rollback + close (see get_db), so the
+    # pool's extra ROLLBACK on check-in is a wasted round trip.
+    pool_reset_on_return=None,
+    # Compiled-SQL cache entries per engine (SQLAlchemy default 500). Each
+    # distinct statement shape takes an entry; headroom avoids evicting and
+    # recompiling hot queries.
+    query_cache_size=1200,
+    # JSON/JSONB columns (asyncpg codecs are registered by the dialect)
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        # Short OLTP queries: JIT compile time exceeds any execution gain.
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create session factory
@@ -4,35 +4,13 @@ from fastapi import HTTPException, status
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache
 from app.models.property_manager import PropertyManagerAccess
 from app.models.user import User, UserRole
 
-
-async def check_permission(
-    user: User,
-    action: str,
-    resource_owner_id: Optional[str] = None,
-    db: Optional[AsyncSession] = None,
-) -> bool:
-    """
-    Check if user has permission to perform action.
-
-    Args:
-        user: Current user
-        action: Action to perform (e.g., 'create_property', 'approve_application')
-        resource_owner_id: ID of the landlord who owns the resource (for property manager checks)
-        db: Database session (required for property manager access checks)
-
-    Returns:
-        True if user has permission, raises HTTPException otherwise
-    """
-
-    # Admin can do anything
-    if user.role == UserRole.ADMIN:
-        return True
-
-    # Landlord permissions
-    landlord_actions = [
+# Landlord permissions
+LANDLORD_ACTIONS = frozenset(
+    {
         "create_property",
         "edit_property",
         "delete_property",
@@ -45,47 +23,44 @@ async def check_permission(
         "view_analytics",
         "view_comps",
         "view_churn",
-    ]
+    }
+)
 
-    # Tenant permissions
-    tenant_actions = [
+# Tenant permissions
+TENANT_ACTIONS = frozenset(
+    {
         "search_properties",
         "apply_to_property",
         "sign_lease_tenant",
         "pay_rent",
         "view_own_applications",
         "view_own_lease",
-    ]
+    }
+)
 
-    # Property Manager has ALL landlord permissions
-    property_manager_actions = landlord_actions + ["manage_multiple_landlords"]
+# Property Manager has ALL landlord permissions
+PROPERTY_MANAGER_ACTIONS = LANDLORD_ACTIONS | {"manage_multiple_landlords"}
 
-    # Check role-based permissions
-    if user.role == UserRole.LANDLORD:
-        if action not in landlord_actions:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Landlords cannot perform action: {action}",
-            )
-        return True
+# Property manager access is checked on every PM-authorized request but only
+# changes on grant/revoke, which invalidate the cached answer explicitly.
+PM_ACCESS_CACHE_TTL = 30
 
-    elif user.role == UserRole.TENANT:
-        if action not in tenant_actions:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Tenants cannot perform action: {action}",
-            )
-        return True
+def _make_role_checker(allowed: frozenset, label: str, checks_pm_access: bool):
+    """Build the permission check for one role, with its action set, 403
+    label and property-manager branch bound once instead of re-dispatched on
+    every call."""
 
-    elif user.role == UserRole.PROPERTY_MANAGER:
-        if action not in property_manager_actions:
+    async def _check(
+        user: User, action: str, resource_owner_id: Optional[str], db: Optional[AsyncSession]
+    ) -> bool:
+        if action not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Property Managers cannot perform action: {action}",
+                detail=f"{label} cannot perform action: {action}",
             )
 
         # For property manager, check if they have access to this landlord's properties
-        if action in landlord_actions and resource_owner_id and db:
+        if checks_pm_access and action in LANDLORD_ACTIONS and resource_owner_id and db:
             access = await check_property_manager_access(
                 property_manager_id=str(user.id), landlord_id=resource_owner_id, db=db
             )
@@ -97,9 +72,47 @@ async def check_permission(
 
         return True
 
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
-    )
+    return _check
+
+
+_ROLE_CHECKERS = {
+    UserRole.LANDLORD: _make_role_checker(LANDLORD_ACTIONS, "Landlords", False),
+    UserRole.TENANT: _make_role_checker(TENANT_ACTIONS, "Tenants", False),
+    UserRole.PROPERTY_MANAGER: _make_role_checker(
+        PROPERTY_MANAGER_ACTIONS, "Property Managers", True
+    ),
+}
+
+
+async def check_permission(
+    user: User,
+    action: str,
+    resource_owner_id: Optional[str] = None,
+    db: Optional[AsyncSession] = None,
+) -> bool:
+    """
+    Check if user has permission to perform action.
+
+    Args:
+        user: Current user
+        action: Action to perform (e.g., 'create_property', 'approve_application')
+        resource_owner_id: ID of the landlord who owns the resource (for property manager checks)
+        db: Database session (required for property manager access checks)
+
+    Returns:
+        True if user has permission, raises HTTPException otherwise
+    """
+
+    # Admin can do anything
+    if user.role == UserRole.ADMIN:
+        return True
+
+    checker = _ROLE_CHECKERS.get(user.role)
+    if checker is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions"
+        )
+    return await checker(user, action, resource_owner_id, db)
 
 
 async def check_property_manager_access(
@@ -107,7 +120,14 @@ async def check_property_manager_access(
 ) -> bool:
     """
     Check if property manager has active access to landlord's properties.
+
+    Answers (including "no access") are cached for PM_ACCESS_CACHE_TTL seconds.
     """
+    key = _pm_access_key(property_manager_id, landlord_id)
+    cached = await cache.get(key)
+    if cached is not None:
+        return cached
+
     result = await db.execute(
         select(PropertyManagerAccess).where(
             PropertyManagerAccess.property_manager_id == property_manager_id,
@@ -115,8 +135,18 @@ async def check_property_manager_access(
             PropertyManagerAccess.is_active == True,
         )
     )
-    access = result.scalar_one_or_none()
-    return access is not None
+    has_access = result.scalar_one_or_none() is not None
+    await cache.set(key, has_access, ttl=PM_ACCESS_CACHE_TTL)
+    return has_access
+
+
+async def invalidate_property_manager_access(property_manager_id, landlord_id) -> None:
+    """Drop the cached access answer after a grant or revoke."""
+    await cache.delete(_pm_access_key(property_manager_id, landlord_id))
+
+
+def _pm_access_key(property_manager_id, landlord_id) -> str:
+    return f"pma:{property_manager_id}:{landlord_id}"
 
 
 async def can_manage_property(
@@ -7,6 +7,11 @@ import html
 import re
 from typing import Optional
 
+# Compiled once; sanitize_html runs on every user-provided text field.
+_TAG_RE = re.compile(r"<[^>]+>")
+_JS_RE = re.compile(r"javascript:", re.IGNORECASE)
+_ON_EVENT_RE = re.compile(r"on\w+\s*=", re.IGNORECASE)
+
 
 def sanitize_html(text: Optional[str]) -> Optional[str]:
     """
@@ -19,12 +24,24 @@ def sanitize_html(text: Optional[str]) -> Optional[str]:
     # Unescape any existing HTML entities (e.g. &#x27; -> ', &amp; -> &)
     clean = html.unescape(str(text))
 
+    # Every pattern below needs one of these characters; plain text (the
+    # common case) skips the regex work entirely.
+    if "<" not in clean and ":" not in clean and "=" not in clean:
+        return clean.strip()
+
+    # The passes must stay separate and in this order: each one can splice
+    # a vector together for the next ("java<b>script:", "onjavascript:click=").
+    # A pass only runs when its trigger character survived the previous one.
+
     # Strip all HTML tags
-    clean = re.sub(r"<[^>]+>", "", clean)
+    if "<" in clean:
+        clean = _TAG_RE.sub("", clean)
 
     # Remove common XSS vectors
-    clean = re.sub(r"javascript:", "", clean, flags=re.IGNORECASE)
-    clean = re.sub(r"on\w+\s*=", "", clean, flags=re.IGNORECASE)
+    if ":" in clean:
+        clean = _JS_RE.sub("", clean)
+    if "=" in clean:
+        clean = _ON_EVENT_RE.sub("", clean)
 
     return clean.strip()
 
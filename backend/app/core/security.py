@@ -1,33 +1,93 @@
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jwt import PyJWTError
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing - using argon2 instead of bcrypt for better compatibility
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+def _build_jwt_key():
+    """Prepare the JWT signing key once instead of on every encode/decode.
+
+    Given a plain string, PyJWT's HMAC prepare_key re-encodes it and re-runs
+    its PEM/SSH/JWK key-confusion checks on each call. A PyJWK is already
+    prepared, so those checks happen here, once. Non-HMAC algorithms keep
+    the raw secret.
+    """
+    if not settings.ALGORITHM.startswith("HS"):
+        return settings.SECRET_KEY
+    k = base64.urlsafe_b64encode(settings.SECRET_KEY.encode()).rstrip(b"=").decode()
+    return jwt.PyJWK({"kty": "oct", "k": k}, algorithm=settings.ALGORITHM)
+
+
+_JWT_KEY = _build_jwt_key()
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+
+# verify_token cache: blake2b(token) -> (expires_at, payload)
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_CACHE_TTL = 60  # seconds
+_token_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+
+# Password hashing - Argon2id via argon2-cffi directly (no passlib dispatch
+# layer). Hashes are standard PHC strings, so ones written by passlib's
+# argon2 handler verify unchanged.
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storing using Argon2."""
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
+
+
+@lru_cache(maxsize=1)
+def benchmark_password_hash() -> float:
+    """Seconds taken by one hash with the configured parameters.
+
+    Measured once per process; the parameters are fixed at import.
+    """
+    start = time.perf_counter()
+    _password_hasher.hash("benchmark-password")
+    return time.perf_counter() - start
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if the hash was made with different Argon2 parameters than now."""
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
+    # exp is encoded as integer seconds anyway; build it directly from the
+    # epoch clock rather than via an aware datetime PyJWT has to convert.
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    expire = int(time.time()) + lifetime
 
     # Preserve a caller-supplied "type" (e.g. "password_reset",
     # "email_verification", "email_change"); only default to "access" when none
@@ -36,29 +96,48 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     # into valid Bearer credentials (token confusion).
     to_encode.setdefault("type", "access")
     to_encode["exp"] = expire
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
 def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token"""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
 def verify_token(token: str) -> Optional[dict]:
-    """Verify and decode JWT token"""
+    """Verify and decode JWT token.
+
+    Successfully verified payloads are kept in a small in-process LRU keyed by
+    a hash of the token (raw tokens are never stored), until the token's own
+    exp or _TOKEN_CACHE_TTL, whichever comes first. The same access token is
+    presented on every request of a session, so most calls skip the HMAC
+    check and JSON decode. Failures are not cached.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    entry = _token_cache.get(key)
+    if entry is not None:
+        expires_at, payload = entry
+        if expires_at > now:
+            _token_cache.move_to_end(key)
+            return dict(payload)
+        del _token_cache[key]
+
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        return payload
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except PyJWTError:
         return None
+
+    exp = payload.get("exp")
+    expires_at = now + _TOKEN_CACHE_TTL
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    _token_cache[key] = (expires_at, payload)
+    if len(_token_cache) > _TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
+    return dict(payload)
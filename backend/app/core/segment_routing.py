@@ -3,7 +3,7 @@ Segment-based routing configuration.
 Defines features, dashboards, and quick actions for each customer segment.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -292,6 +292,24 @@ SEGMENT_CONFIGS: Dict[str, SegmentConfig] = {
 FROZEN_AGENCY_FEATURES = {"team", "bulk_import", "webhooks", "api_access", "white_label"}
 FROZEN_AGENCY_ACTION_IDS = {"team", "bulk", "webhooks"}
 
+# Membership tables for has_feature, built once: feature checks are set
+# lookups instead of list scans.
+_COMMON_FEATURE_SET = frozenset(COMMON_FEATURES)
+_SEGMENT_FEATURE_SETS: Dict[str, frozenset] = {
+    key: frozenset(config.features) for key, config in SEGMENT_CONFIGS.items()
+}
+
+# get_all_features results per segment, with and without the agency freeze.
+# Tuples, so callers cannot mutate the shared value.
+_FULL_FEATURES: Dict[str, Tuple[str, ...]] = {
+    key: tuple(get_full_features(config.features))
+    for key, config in SEGMENT_CONFIGS.items()
+}
+_FULL_FEATURES_FROZEN: Dict[str, Tuple[str, ...]] = {
+    key: tuple(f for f in features if f not in FROZEN_AGENCY_FEATURES)
+    for key, features in _FULL_FEATURES.items()
+}
+
 
 def _apply_agency_freeze(config: SegmentConfig) -> SegmentConfig:
     from app.core.config import settings
@@ -335,14 +353,26 @@ def get_redirect_path(segment: Optional[str], role: str) -> str:
 def has_feature(segment: Optional[str], feature: str) -> bool:
     """Check if a segment has access to a specific feature (includes common features)"""
     # Common features are available to everyone
-    if feature in COMMON_FEATURES:
+    if feature in _COMMON_FEATURE_SET:
         return True
 
-    config = get_segment_config(segment)
-    return feature in config.features
+    if feature in FROZEN_AGENCY_FEATURES:
+        from app.core.config import settings
 
+        if not settings.ENABLE_AGENCY_TOOLING:
+            return False
 
-def get_all_features(segment: Optional[str], role: Optional[str] = None) -> List[str]:
+    features = _SEGMENT_FEATURE_SETS.get(segment) or _SEGMENT_FEATURE_SETS["D1"]
+    return feature in features
+
+
+def get_all_features(segment: Optional[str], role: Optional[str] = None) -> Tuple[str, ...]:
     """Get all features for a segment (common + segment-specific)"""
-    config = get_segment_config(segment, role=role)
-    return get_full_features(config.features)
+    from app.core.config import settings
+
+    table = _FULL_FEATURES if settings.ENABLE_AGENCY_TOOLING else _FULL_FEATURES_FROZEN
+    if segment in table:
+        return table[segment]
+    if role in ["landlord", "property_manager"]:
+        return table["S1"]
+    return table["D1"]
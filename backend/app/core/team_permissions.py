@@ -6,15 +6,21 @@ Used to check if a user has access to a property based on team membership.
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, func, or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.property import Property
-from app.models.team import (InviteStatus, PermissionLevel, TeamMember,
-                             TeamMemberProperty)
+from app.models.team import (PERMISSION_RANK, InviteStatus, PermissionLevel,
+                             TeamMember, TeamMemberProperty)
 from app.models.user import User
 
 
+# Key in AsyncSession.info for the per-session permission memo. A session is
+# scoped to one request (get_db), so this memoizes per request with nothing to
+# set up or tear down.
+_PERMISSION_MEMO_KEY = "effective_permissions"
+
+
 async def get_effective_permission(
     db: AsyncSession, user_id: UUID, property_id: UUID
 ) -> Optional[PermissionLevel]:
@@ -25,47 +31,63 @@ async def get_effective_permission(
     Checks:
     1. Is user the property owner? → FULL_ACCESS
     2. Is user a team member with access to this property? → Their permission level
+
+    Memoized on the session, so an endpoint combining several can_* checks
+    for the same property queries once.
     """
-    # Check if user is property owner
-    prop = (
-        await db.execute(select(Property).where(Property.id == property_id))
-    ).scalar_one_or_none()
+    memo = db.info.setdefault(_PERMISSION_MEMO_KEY, {})
+    key = (user_id, property_id)
+    if key not in memo:
+        memo[key] = await _load_effective_permission(db, user_id, property_id)
+    return memo[key]
 
-    if prop and prop.landlord_id == user_id:
-        return PermissionLevel.FULL_ACCESS
 
-    # Check team membership
-    team_member = (
+async def _load_effective_permission(
+    db: AsyncSession, user_id: UUID, property_id: UUID
+) -> Optional[PermissionLevel]:
+    # One round trip: the property's owner, plus the user's active membership
+    # in that owner's team and its grant for this property, if any.
+    row = (
         await db.execute(
-            select(TeamMember).where(
+            select(
+                Property.landlord_id,
+                TeamMember.permission_level,
+                TeamMemberProperty.id,
+                TeamMemberProperty.permission_override,
+            )
+            .select_from(Property)
+            .outerjoin(
+                TeamMember,
                 and_(
+                    TeamMember.landlord_id == Property.landlord_id,
                     TeamMember.member_user_id == user_id,
                     TeamMember.status == InviteStatus.ACTIVE,
-                )
+                ),
             )
+            .outerjoin(
+                TeamMemberProperty,
+                and_(
+                    TeamMemberProperty.team_member_id == TeamMember.id,
+                    TeamMemberProperty.property_id == Property.id,
+                ),
+            )
+            .where(Property.id == property_id)
         )
-    ).scalar_one_or_none()
+    ).first()
 
-    if not team_member:
+    if row is None:
         return None
 
-    # Check if they have access to this specific property
-    property_access = (
-        await db.execute(
-            select(TeamMemberProperty).where(
-                and_(
-                    TeamMemberProperty.team_member_id == team_member.id,
-                    TeamMemberProperty.property_id == property_id,
-                )
-            )
-        )
-    ).scalar_one_or_none()
+    landlord_id, permission_level, property_access_id, permission_override = row
+    if landlord_id == user_id:
+        return PermissionLevel.FULL_ACCESS
 
-    if not property_access:
+    # Not a team member with access to this specific property
+    if property_access_id is None:
         return None
 
     # Return override if set, otherwise default permission
-    return property_access.permission_override or team_member.permission_level
+    return permission_override or permission_level
 
 
 async def can_view_property(db: AsyncSession, user_id: UUID, property_id: UUID) -> bool:
@@ -77,7 +99,7 @@ async def can_view_property(db: AsyncSession, user_id: UUID, property_id: UUID)
 async def can_manage_visits(db: AsyncSession, user_id: UUID, property_id: UUID) -> bool:
     """Check if user can manage visits (manage_visits or full_access)."""
     permission = await get_effective_permission(db, user_id, property_id)
-    return permission in [PermissionLevel.MANAGE_VISITS, PermissionLevel.FULL_ACCESS]
+    return permission_meets_minimum(permission, PermissionLevel.MANAGE_VISITS)
 
 
 async def can_edit_property(db: AsyncSession, user_id: UUID, property_id: UUID) -> bool:
@@ -99,53 +121,50 @@ async def get_accessible_properties(
     Returns:
         List of property UUIDs
     """
-    property_ids = []
-
-    # Get properties user owns
-    owned = await db.execute(select(Property.id).where(Property.landlord_id == user_id))
-    property_ids.extend([row[0] for row in owned.fetchall()])
-
-    # Get properties through team membership
-    team_member = (
-        await db.execute(
-            select(TeamMember).where(
-                and_(
-                    TeamMember.member_user_id == user_id,
-                    TeamMember.status == InviteStatus.ACTIVE,
-                )
-            )
+    # Owned properties and team grants in one round trip; UNION dedups.
+    owned = select(Property.id).where(Property.landlord_id == user_id)
+    team = (
+        select(TeamMemberProperty.property_id)
+        .join(TeamMember, TeamMember.id == TeamMemberProperty.team_member_id)
+        .where(
+            TeamMember.member_user_id == user_id,
+            TeamMember.status == InviteStatus.ACTIVE,
         )
-    ).scalar_one_or_none()
-
-    if team_member:
-        access_query = select(TeamMemberProperty).where(
-            TeamMemberProperty.team_member_id == team_member.id
+    )
+
+    # Check permission level if filter specified
+    if min_permission:
+        # Typed as permission_level so the IN list binds the enum's DB values.
+        effective = func.coalesce(
+            TeamMemberProperty.permission_override,
+            TeamMember.permission_level,
+            type_=TeamMember.permission_level.type,
         )
+        team = team.where(effective.in_(_levels_at_least(min_permission)))
 
-        accesses = (await db.execute(access_query)).scalars().all()
+    result = await db.execute(union(owned, team))
+    return [row[0] for row in result.all()]
 
-        for access in accesses:
-            # Check permission level if filter specified
-            if min_permission:
-                effective = access.permission_override or team_member.permission_level
-                if not _permission_meets_minimum(effective, min_permission):
-                    continue
 
-            property_ids.append(access.property_id)
+def permission_meets_minimum(
+    permission: Optional[PermissionLevel], minimum: PermissionLevel
+) -> bool:
+    """Whether a (possibly absent) permission level is at least the minimum."""
+    return permission is not None and PERMISSION_RANK[permission] >= PERMISSION_RANK[minimum]
 
-    return list(set(property_ids))  # Deduplicate
 
+# minimum -> every level that meets it, for SQL IN filters
+_LEVELS_AT_LEAST = {
+    minimum: tuple(
+        level for level in PermissionLevel if permission_meets_minimum(level, minimum)
+    )
+    for minimum in PermissionLevel
+}
 
-def _permission_meets_minimum(
-    permission: PermissionLevel, minimum: PermissionLevel
-) -> bool:
-    """Check if a permission level meets the minimum required."""
-    levels = [
-        PermissionLevel.VIEW_ONLY,
-        PermissionLevel.MANAGE_VISITS,
-        PermissionLevel.FULL_ACCESS,
-    ]
-    return levels.index(permission) >= levels.index(minimum)
+
+def _levels_at_least(minimum: PermissionLevel) -> tuple:
+    """Permission levels that meet the minimum required."""
+    return _LEVELS_AT_LEAST[minimum]
 
 
 async def get_team_landlord_id(db: AsyncSession, user_id: UUID) -> Optional[UUID]:
@@ -153,9 +172,9 @@ async def get_team_landlord_id(db: AsyncSession, user_id: UUID) -> Optional[UUID
     If user is a team member, get their landlord's ID.
     Returns None if user is not a team member.
     """
-    team_member = (
+    return (
         await db.execute(
-            select(TeamMember).where(
+            select(TeamMember.landlord_id).where(
                 and_(
                     TeamMember.member_user_id == user_id,
                     TeamMember.status == InviteStatus.ACTIVE,
@@ -163,5 +182,3 @@ async def get_team_landlord_id(db: AsyncSession, user_id: UUID) -> Optional[UUID
             )
         )
     ).scalar_one_or_none()
-
-    return team_member.landlord_id if team_member else None
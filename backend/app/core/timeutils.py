@@ -2,10 +2,12 @@
 Central UTC time helpers.
 
 `datetime.utcnow()` is deprecated in Python 3.12 and returns a *naive* value.
-Most of Roomivo's timestamp columns are still timezone-naive (`TIMESTAMP` /
+Many of Roomivo's timestamp columns are still timezone-naive (`TIMESTAMP` /
 `DateTime` without `timezone=True`), so `naive_utcnow()` is the behaviour-
 preserving, non-deprecated drop-in for those. Use `utcnow()` (timezone-aware)
-for standalone values and for the timezone-aware columns (visits/leases).
+for standalone values and for the timezone-aware columns (visits/leases,
+messaging, team, webhooks, applications/documents, disputes, notifications,
+feedback, feature flags, property-manager access).
 
 Migrating the remaining naive columns to `DateTime(timezone=True)` and then
 switching their call sites to `utcnow()` is the documented follow-up.
@@ -1,12 +1,21 @@
+import asyncio
+import importlib
 import logging
 import os
+import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.core.cache import cache
+from app.core.circuit_breaker import get_circuit_health
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.gemini_quota import get_usage as get_gemini_usage
 
 logger = logging.getLogger(__name__)
 import app.models
@@ -91,9 +100,14 @@ if RATE_LIMITING_ENABLED:
 # ------------------------------------------------------------------
 # CORS middleware (standard layer)
 # ------------------------------------------------------------------
+# Settings.ALLOWED_ORIGINS rebuilds its list from the environment on every
+# access; resolve it once. CORSMiddleware only does `in` checks on
+# allow_origins, so a frozenset makes its per-request origin test O(1).
+ALLOWED_ORIGIN_SET = frozenset(settings.ALLOWED_ORIGINS)
+
 fastapi_app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origins=ALLOWED_ORIGIN_SET,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "Accept", "Origin", "X-Requested-With"],
@@ -177,29 +191,32 @@ async def add_security_headers(request: Request, call_next):
 # ------------------------------------------------------------------
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-@fastapi_app.exception_handler(StarletteHTTPException)
-async def http_exception_handler(request: Request, exc: StarletteHTTPException):
-    from app.core.config import settings
+def _error_response_headers(request: Request) -> dict:
+    """CORS + isolation headers for error responses built by the handlers
+    below, so the browser can read them even when CORSMiddleware is bypassed."""
     origin = request.headers.get("origin")
-    allow_origin = "*"
-    if origin and origin in settings.ALLOWED_ORIGINS:
+    if origin and origin in ALLOWED_ORIGIN_SET:
         allow_origin = origin
     elif settings.ENVIRONMENT == "production":
         allow_origin = "https://roomivo.eu"
     else:
         allow_origin = "http://localhost:3000"
+    return {
+        "Access-Control-Allow-Origin": allow_origin,
+        "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+        "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With, Accept, Language",
+        "Access-Control-Allow-Credentials": "true",
+        "Cross-Origin-Opener-Policy": "same-origin-allow-popups",
+        "Cross-Origin-Resource-Policy": "cross-origin",
+    }
+
 
+@fastapi_app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
-        headers={
-            "Access-Control-Allow-Origin": allow_origin,
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With, Accept, Language",
-            "Access-Control-Allow-Credentials": "true",
-            "Cross-Origin-Opener-Policy": "same-origin-allow-popups",
-            "Cross-Origin-Resource-Policy": "cross-origin",
-        }
+        headers=_error_response_headers(request),
     )
 
 
@@ -210,18 +227,6 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True,
     )
     
-    # Manually add CORS headers to the error response to prevent "Network Error" in browser
-    # when the standard CORSMiddleware is bypassed or fails.
-    from app.core.config import settings
-    origin = request.headers.get("origin")
-    allow_origin = "*"
-    if origin and origin in settings.ALLOWED_ORIGINS:
-        allow_origin = origin
-    elif settings.ENVIRONMENT == "production":
-        allow_origin = "https://roomivo.eu"
-    else:
-        allow_origin = "http://localhost:3000"
-
     content = {"detail": "Internal server error"}
     if settings.ENVIRONMENT != "production":
         content["detail"] = f"Server error: {type(exc).__name__}"
@@ -230,23 +235,52 @@ async def global_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
         status_code=500,
         content=content,
-        headers={
-            "Access-Control-Allow-Origin": allow_origin,
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With, Accept, Language",
-            "Access-Control-Allow-Credentials": "true",
-            "Cross-Origin-Opener-Policy": "same-origin-allow-popups",
-            "Cross-Origin-Resource-Policy": "cross-origin",
-        }
+        # Manually add CORS headers to the error response to prevent "Network
+        # Error" in browser when the standard CORSMiddleware is bypassed.
+        headers=_error_response_headers(request),
     )
 
 
 @fastapi_app.on_event("startup")
 async def startup_event():
     """Connect to Redis asynchronously on startup."""
-    from app.core.cache import cache
     await cache.connect()
 
+    # Log the real cost of one password hash so ARGON2_* can be tuned to
+    # the login latency budget on this hardware. Opt-in, off the startup path.
+    if not settings.LOG_PASSWORD_HASH_COST:
+        return
+    from app.core.security import benchmark_password_hash
+
+    async def _log_password_hash_cost():
+        try:
+            elapsed = await asyncio.to_thread(benchmark_password_hash)
+        except Exception:
+            logger.exception("Argon2 hash benchmark failed")
+            return
+        logger.info(
+            "Argon2 hash time %.0f ms (t=%d, m=%d KiB, p=%d)",
+            elapsed * 1000,
+            settings.ARGON2_TIME_COST,
+            settings.ARGON2_MEMORY_COST,
+            settings.ARGON2_PARALLELISM,
+        )
+
+    # Held on app state so it can't be garbage-collected mid-run.
+    fastapi_app.state.password_hash_benchmark = asyncio.create_task(
+        _log_password_hash_cost()
+    )
+
+
+@fastapi_app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background startup work, the cache invalidation listener and Redis."""
+    benchmark = getattr(fastapi_app.state, "password_hash_benchmark", None)
+    if benchmark is not None:
+        benchmark.cancel()
+        await asyncio.gather(benchmark, return_exceptions=True)
+    await cache.close()
+
 
 @fastapi_app.get("/diagnostic-check")
 async def diagnostic_check():
@@ -255,82 +289,54 @@ async def diagnostic_check():
 # ------------------------------------------------------------------
 # Include all routers
 # ------------------------------------------------------------------
-from app.routers import (auth, credentials, location, onboarding, properties,
-                         property_manager, verification)
+# Declarative (module, agency_only, include_router kwargs) table, in mount
+# order. Modules are imported only when mounted, so frozen agency routers
+# (and the models/clients they pull in) stay out of the cold-start import
+# graph entirely.
+_ROUTERS = (
+    ("app.routers.properties", False, {}),
+    ("app.routers.auth", False, {}),
+    ("app.routers.property_manager", True, {}),
+    ("app.routers.onboarding", False, {}),
+    ("app.routers.verification", False, {}),
+    ("app.routers.location", False, {}),
+    ("app.routers.credentials", False, {}),
+    ("app.routers.webhooks", False, {}),
+    ("app.routers.visits", False, {}),
+    ("app.routers.messages", False, {}),
+    ("app.routers.team", True, {}),
+    ("app.routers.bulk", True, {}),
+    ("app.routers.stats", False, {}),
+    ("app.routers.erp_webhooks", True, {}),
+    ("app.routers.documents", False, {}),
+    ("app.api.v1.endpoints.dossiers", False, {"prefix": "/dossiers", "tags": ["dossiers"]}),
+    ("app.routers.applications", False, {}),
+    ("app.routers.notifications", False, {}),
+    ("app.routers.leases", False, {}),
+    ("app.routers.esign", False, {}),
+    ("app.routers.inventory", False, {}),
+    ("app.routers.dispute", False, {}),
+    ("app.routers.admin", False, {}),
+    ("app.routers.media", False, {}),
+    ("app.routers.feedback", False, {}),
+    ("app.routers.gdpr", False, {}),
+)
 
 api_v1_router = fastapi.routing.APIRouter(prefix="/api/v1")
-api_v1_router.include_router(properties.router)
-api_v1_router.include_router(auth.router)
-if settings.ENABLE_AGENCY_TOOLING:  # FREEZE 2026-07-04: agency tooling
-    api_v1_router.include_router(property_manager.router)
-api_v1_router.include_router(onboarding.router)
-api_v1_router.include_router(verification.router)
-api_v1_router.include_router(location.router)
-api_v1_router.include_router(credentials.router)
-from app.routers import webhooks
-api_v1_router.include_router(webhooks.router)
-
-from app.routers import visits
-api_v1_router.include_router(visits.router)
-
-from app.routers import messages
-api_v1_router.include_router(messages.router)
-
-from app.routers import team
-
-if settings.ENABLE_AGENCY_TOOLING:  # FREEZE 2026-07-04: agency tooling
-    api_v1_router.include_router(team.router)
-
-from app.routers import bulk, stats
-
-if settings.ENABLE_AGENCY_TOOLING:  # FREEZE 2026-07-04: agency tooling
-    api_v1_router.include_router(bulk.router)
-api_v1_router.include_router(stats.router)
-
-from app.routers import erp_webhooks
-
-if settings.ENABLE_AGENCY_TOOLING:  # FREEZE 2026-07-04: agency tooling
-    api_v1_router.include_router(erp_webhooks.router)
-
-from app.routers import documents
-api_v1_router.include_router(documents.router)
-
-from app.api.v1.endpoints import dossiers
-api_v1_router.include_router(dossiers.router, prefix="/dossiers", tags=["dossiers"])
-
-from app.routers import applications
-api_v1_router.include_router(applications.router)
-
-from app.routers import notifications
-api_v1_router.include_router(notifications.router)
-
-from app.routers import leases
-api_v1_router.include_router(leases.router)
-
-from app.routers import esign
-api_v1_router.include_router(esign.router)
-
-from app.routers import inventory
-api_v1_router.include_router(inventory.router)
-
-from app.routers import dispute
-api_v1_router.include_router(dispute.router)
-
-from app.routers import admin
-api_v1_router.include_router(admin.router)
-
-from app.routers import media
-api_v1_router.include_router(media.router)
-
-from app.routers import feedback
-api_v1_router.include_router(feedback.router)
-
-
-from app.routers import gdpr
-api_v1_router.include_router(gdpr.router)
+for _module_path, _agency_only, _include_kwargs in _ROUTERS:
+    if _agency_only and not settings.ENABLE_AGENCY_TOOLING:  # FREEZE 2026-07-04: agency tooling
+        continue
+    api_v1_router.include_router(
+        importlib.import_module(_module_path).router, **_include_kwargs
+    )
 
 fastapi_app.include_router(api_v1_router)
 
+# Every model is imported by now; configure all mappers once at boot rather
+# than on the first query of the first request each worker serves (and fail
+# the deploy, not a request, if a relationship is misdeclared).
+configure_mappers()
+
 
 # ------------------------------------------------------------------
 # Compatibility routes
@@ -347,14 +353,19 @@ async def users_me_compatibility(request: Request):
 # ------------------------------------------------------------------
 # Health & root
 # ------------------------------------------------------------------
+# Load-balancer probes hit /health every few seconds; serve a response that
+# is at most this old instead of re-pinging the DB and Redis on every probe.
+_HEALTH_CACHE_TTL = 2.0
+_health_cache: tuple[float, dict] | None = None
+
+
 @fastapi_app.get("/health")
 async def health_check():
     """Enhanced health check for Render with timing and partial failure detection"""
-    import time
-    from sqlalchemy import text
-    from app.core.cache import cache
-    from app.core.circuit_breaker import get_circuit_health
-    from app.core.database import AsyncSessionLocal
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and _health_cache[0] > now:
+        return _health_cache[1]
 
     status = {"status": "ok", "timestamp": time.time(), "checks": {}}
     start_total = time.time()
@@ -387,13 +398,13 @@ async def health_check():
 
     # 4. Gemini quota
     try:
-        from app.core.gemini_quota import get_usage
-        status["checks"]["gemini_quota"] = await get_usage()
+        status["checks"]["gemini_quota"] = await get_gemini_usage()
     except Exception:
         pass
 
     status["total_latency"] = time.time() - start_total
 
+    _health_cache = (time.monotonic() + _HEALTH_CACHE_TTL, status)
     return status
 
 
@@ -404,8 +415,7 @@ async def root():
 
 
 # Static file serving for local development
-import os as _os
-if _os.path.isdir("uploads"):
+if os.path.isdir("uploads"):
     from fastapi.staticfiles import StaticFiles
     fastapi_app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
@@ -443,7 +453,11 @@ class CORSSafetyNet:
                     from app.core.config import settings
                     allowed_origins = settings.ALLOWED_ORIGINS
                 except Exception:
-                    allowed_origins = ["https://roomivo.eu", "https://www.roomivo.eu", "http://localhost:3000"]
+                    allowed_origins = [
+                        "https://roomivo.eu",
+                        "https://www.roomivo.eu",
+                        "https://roomivo-frontend-0jyi.onrender.com",
+                    ]
                 
                 # Default to the first allowed production origin if not found or untrusted
                 # fallback index 0 is typically https://roomivo.eu in production
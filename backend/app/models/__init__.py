@@ -11,3 +11,5 @@ from app.models.inventory import Inventory, InventoryItem
 from app.models.dispute import Dispute
 from app.models.biometric_consent import BiometricConsent
 from app.models.dossier import TrustDossier, DossierShareLink
+from app.models.feedback import Feedback
+from app.models.webhook_subscriptions import WebhookSubscription, WebhookDelivery
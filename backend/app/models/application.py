@@ -5,7 +5,9 @@ Application model for rental candidatures.
 import enum
 import uuid
 
-from sqlalchemy import TIMESTAMP, Column, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import TIMESTAMP, Column
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Index, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -19,6 +21,7 @@ class ApplicationStatus(str, enum.Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
     WITHDRAWN = "withdrawn"
+    LEASE_CREATED = "lease_created"
 
 
 class Application(Base):
@@ -27,28 +30,40 @@ class Application(Base):
         # A tenant may apply to a given property only once. DB-enforced so the
         # app-level pre-check can't be defeated by a concurrent double-submit.
         UniqueConstraint("tenant_id", "property_id", name="uq_application_tenant_property"),
+        # "My applications": tenant_id = ? ORDER BY created_at DESC
+        Index("ix_applications_tenant_created", "tenant_id", text("created_at DESC")),
+        # Landlord pending counts: property_id = ? AND status = ?
+        Index("ix_applications_property_status", "property_id", "status"),
     )
+    # Fetch server-side created_at/updated_at via INSERT ... RETURNING so a new
+    # application can be returned without a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Links
-    tenant_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
-    )
-    property_id = Column(
-        UUID(as_uuid=True), ForeignKey("properties.id"), nullable=False, index=True
-    )
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    property_id = Column(UUID(as_uuid=True), ForeignKey("properties.id"), nullable=False)
 
     # Data
-    status = Column(String, default="pending", nullable=False, index=True)
+    status = Column(
+        SQLEnum(
+            ApplicationStatus,
+            name="application_status_enum",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        default=ApplicationStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
     cover_letter = Column(Text, nullable=True)
 
     # Snapshot of profile/docs at time of application (optional, for immutability)
     snapshot_data = Column(JSONB, nullable=True)
 
     # Timestamps
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     tenant = relationship("User", back_populates="applications")
@@ -1,11 +1,10 @@
 import enum
-import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Numeric, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -29,13 +28,17 @@ class DisputeStatus(str, enum.Enum):
 
 class Dispute(Base):
     __tablename__ = "disputes"
+    __table_args__ = (
+        # Disputes by lease, newest first; also the per-lease daily rate limit
+        Index("ix_disputes_lease_created", "lease_id", text("created_at DESC")),
+    )
+    # id / created_at are generated by Postgres; RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
 
     # Context
-    lease_id = Column(
-        UUID(as_uuid=True), ForeignKey("leases.id"), nullable=False, index=True
-    )
+    lease_id = Column(UUID(as_uuid=True), ForeignKey("leases.id"), nullable=False)
     inventory_id = Column(
         UUID(as_uuid=True), ForeignKey("inventories.id"), nullable=True
     )  # Linked to Move-Out Inventory
@@ -48,10 +51,19 @@ class Dispute(Base):
     )  # Optional (e.g. "General" issue)
 
     category = Column(
-        SQLEnum(DisputeCategory, name="dispute_category_enum"), nullable=False
+        SQLEnum(
+            DisputeCategory,
+            name="dispute_category_enum",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
     )
     status = Column(
-        SQLEnum(DisputeStatus, name="dispute_status_enum"),
+        SQLEnum(
+            DisputeStatus,
+            name="dispute_status_enum",
+            values_callable=lambda x: [e.value for e in x],
+        ),
         default=DisputeStatus.OPEN,
         nullable=False,
     )
@@ -65,7 +77,7 @@ class Dispute(Base):
     # Counter-evidence — accused party's response
     response_description = Column(Text, nullable=True)
     response_evidence_urls = Column(JSONB, default=list, nullable=False, server_default="[]")
-    responded_at = Column(DateTime, nullable=True)
+    responded_at = Column(DateTime(timezone=True), nullable=True)
 
     # Financial context
     amount_claimed = Column(Numeric(10, 2), nullable=True)
@@ -73,15 +85,15 @@ class Dispute(Base):
     # Facilitation (Roomivo is NOT a mediator — observations only)
     admin_observations = Column(Text, nullable=True)
     mediation_redirect_url = Column(String, nullable=True)
-    mediation_redirected_at = Column(DateTime, nullable=True)
+    mediation_redirected_at = Column(DateTime(timezone=True), nullable=True)
 
     # Geo-verification metadata
     location_verified = Column(String, nullable=True)  # "verified", "unverified", "denied"
     report_distance_meters = Column(Float, nullable=True)
 
-    created_at = Column(DateTime, default=naive_utcnow)
-    updated_at = Column(DateTime, default=naive_utcnow, onupdate=naive_utcnow)
-    closed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    closed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     lease = relationship("Lease", back_populates="disputes")
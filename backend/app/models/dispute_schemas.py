@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.dispute import DisputeCategory, DisputeStatus
 
@@ -43,8 +43,7 @@ class DisputeResponse(BaseModel):
     updated_at: Optional[datetime] = None
     closed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DisputeAddEvidence(BaseModel):
@@ -7,7 +7,7 @@ import uuid
 
 from sqlalchemy import TIMESTAMP, Boolean, Column
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Integer, LargeBinary, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -82,17 +82,17 @@ class Document(Base):
     verification_data = Column(JSONB)  # Store API confidence scores etc.
 
     # Metadata
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", backref="documents")
+    user = relationship("User", back_populates="documents")
 
 
 class DocumentExtraction(Base):
     __tablename__ = "document_extractions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    file_hash = Column(String, unique=True, index=True, nullable=False)
+    file_hash = Column(LargeBinary(32), unique=True, index=True, nullable=False)  # raw SHA-256
     extraction_data = Column(JSONB, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -1,8 +1,7 @@
-import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -10,10 +9,12 @@ from app.core.database import Base
 
 class FeatureFlag(Base):
     __tablename__ = "feature_flags"
+    # id / created_at / is_enabled are server defaults; RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name = Column(String, unique=True, index=True, nullable=False)
-    is_enabled = Column(Boolean, default=False, nullable=False)
+    is_enabled = Column(Boolean, server_default=text("false"), nullable=False)
     description = Column(String, nullable=True)
-    created_at = Column(DateTime, default=naive_utcnow)
-    updated_at = Column(DateTime, default=naive_utcnow, onupdate=naive_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
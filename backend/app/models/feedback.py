@@ -1,8 +1,6 @@
-import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -11,15 +9,17 @@ from app.core.database import Base
 
 class Feedback(Base):
     __tablename__ = "feedback"
+    # id / created_at are generated by Postgres; RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
     user_id = Column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )  # Optional: Anonymous feedback
     category = Column(String, nullable=False)  # e.g. "bug", "feature", "ux"
     message = Column(Text, nullable=False)
     rating = Column(Integer, nullable=True)  # 1-5 stars
-    created_at = Column(DateTime, default=naive_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user = relationship("User", backref="feedback_submissions")
+    user = relationship("User", back_populates="feedback_submissions")
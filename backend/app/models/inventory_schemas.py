@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, SerializeAsAny
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny
 
 from app.models.inventory import InventoryStatus, InventoryType, ItemCondition
 
@@ -28,8 +28,7 @@ class InventoryItemResponse(InventoryItemBase):
     id: UUID
     inventory_id: UUID
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # --- Inventory Schemas ---
@@ -66,5 +65,4 @@ class InventoryResponse(InventoryBase):
     items: List[InventoryItemResponse]
     property_location: Optional[Dict[str, float]] = None  # {lat, lng} for geofencing
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
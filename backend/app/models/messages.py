@@ -5,8 +5,8 @@ Supports conversations between landlords and tenants about properties.
 
 import uuid
 
-from sqlalchemy import (TIMESTAMP, Boolean, Column, ForeignKey, Integer,
-                        String, Text)
+from sqlalchemy import (TIMESTAMP, Boolean, Column, FetchedValue, ForeignKey,
+                        Index, Integer, String, Text, text)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -34,20 +34,24 @@ class Conversation(Base):
     status = Column(String(20), default="active")  # 'active', 'archived', 'resolved'
 
     # Timestamps and read tracking
-    last_message_at = Column(TIMESTAMP, server_default=func.now())
+    last_message_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    # Incremented by the trg_messages_bump_unread trigger on message insert
     unread_count_landlord = Column(Integer, default=0)
     unread_count_tenant = Column(Integer, default=0)
 
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    # Maintained by the trg_conversations_updated_at trigger
+    updated_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
     # Relationships
     property = relationship("Property", back_populates="conversations")
     landlord = relationship(
-        "User", foreign_keys=[landlord_id], backref="landlord_conversations"
+        "User", foreign_keys=[landlord_id], back_populates="landlord_conversations"
     )
     tenant = relationship(
-        "User", foreign_keys=[tenant_id], backref="tenant_conversations"
+        "User", foreign_keys=[tenant_id], back_populates="tenant_conversations"
     )
     messages = relationship(
         "Message",
@@ -64,8 +68,22 @@ class Message(Base):
     """
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Thread listing: conversation_id = ? ORDER BY created_at
+        Index("ix_messages_conversation_created", "conversation_id", "created_at"),
+        # Unread lookups/counts only ever touch the (small) unread slice
+        Index(
+            "ix_messages_unread",
+            "conversation_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_read = false"),
+        ),
+    )
+    # id (time-ordered UUIDv7), created_at and is_read are server defaults;
+    # RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
     conversation_id = Column(
         UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False
     )
@@ -84,11 +102,11 @@ class Message(Base):
     extra_data = Column(JSONB, default={})
 
     # Read status
-    is_read = Column(Boolean, default=False)
-    read_at = Column(TIMESTAMP)
+    is_read = Column(Boolean, server_default=text("false"))
+    read_at = Column(TIMESTAMP(timezone=True))
 
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
-    sender = relationship("User", backref="sent_messages")
+    sender = relationship("User", back_populates="sent_messages")
@@ -3,12 +3,12 @@ Notification models for the platform notification system.
 """
 
 import enum
-import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -29,16 +29,34 @@ class Notification(Base):
     """User notifications"""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Feed: user_id = ? ORDER BY created_at DESC LIMIT n
+        Index("ix_notifications_user_created", "user_id", text("created_at DESC")),
+        # Unread feed, badge count and mark-all-as-read only touch unread rows
+        Index(
+            "ix_notifications_unread_by_user",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("read = false"),
+        ),
+    )
+    # id / created_at / read are server defaults; RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
 
     # Notification content
     type = Column(
-        String, nullable=False
-    )  # application, message, visit, match, verification, system
+        SQLEnum(
+            NotificationType,
+            name="notification_type_enum",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
     title = Column(String, nullable=False)
     message = Column(Text, nullable=False)
     action_url = Column(
@@ -46,14 +64,14 @@ class Notification(Base):
     )  # Link to relevant page (e.g., /applications/123)
 
     # Metadata
-    extra_data = Column(String, nullable=True)  # JSON string for additional data
+    extra_data = Column(JSONB, nullable=True)  # Additional structured data
 
     # Status
-    read = Column(Boolean, default=False, index=True)
-    read_at = Column(DateTime, nullable=True)
+    read = Column(Boolean, server_default=text("false"))
+    read_at = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=naive_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user = relationship("User", backref="notifications")
+    user = relationship("User", back_populates="notifications")
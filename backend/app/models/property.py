@@ -5,7 +5,7 @@ Property models for Roomivo.
 import uuid
 
 from sqlalchemy import (DECIMAL, TIMESTAMP, Boolean, Column, Date, ForeignKey,
-                        Integer, String, Text)
+                        Index, Integer, String, Text)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,6 +17,38 @@ class Property(Base):
     """Property listing model"""
 
     __tablename__ = "properties"
+    __table_args__ = (
+        # Search hot path: status = ? AND city = ? AND monthly_rent BETWEEN ...
+        Index("ix_properties_status_city_rent", "status", "city", "monthly_rent"),
+        # JSONB containment filters (amenities @> '["parking"]')
+        Index("ix_properties_amenities_gin", "amenities", postgresql_using="gin"),
+        Index("ix_properties_public_transport_gin", "public_transport", postgresql_using="gin"),
+        Index(
+            "ix_properties_accepted_guarantor_types_gin",
+            "accepted_guarantor_types",
+            postgresql_using="gin",
+            postgresql_ops={"accepted_guarantor_types": "jsonb_path_ops"},
+        ),
+        # Location search: city/postal_code/address_line1 ILIKE '%term%' (pg_trgm)
+        Index(
+            "ix_properties_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_postal_code_trgm",
+            "postal_code",
+            postgresql_using="gin",
+            postgresql_ops={"postal_code": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_properties_address_line1_trgm",
+            "address_line1",
+            postgresql_using="gin",
+            postgresql_ops={"address_line1": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     landlord_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -142,7 +174,7 @@ class Property(Base):
     views_count = Column(Integer, default=0)
 
     # Relationships
-    landlord = relationship("User", backref="properties", foreign_keys=[landlord_id])
+    landlord = relationship("User", back_populates="properties", foreign_keys=[landlord_id])
     media_sessions = relationship(
         "PropertyMediaSession", back_populates="property", cascade="all, delete-orphan"
     )
@@ -164,6 +196,10 @@ class Property(Base):
     team_members = relationship(
         "TeamMemberProperty", back_populates="property", cascade="all, delete-orphan"
     )
+    # Never read off a Property; saved_properties.property_id cascades in the DB.
+    saved_by_users = relationship(
+        "SavedProperty", back_populates="property", lazy="raise", passive_deletes=True
+    )
 
 
 class PropertyMediaSession(Base):
@@ -263,5 +299,5 @@ class SavedProperty(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
 
     # Relationships
-    user = relationship("User", backref="saved_properties")
-    property = relationship("Property", backref="saved_by_users")
+    user = relationship("User", back_populates="saved_properties")
+    property = relationship("Property", back_populates="saved_by_users")
@@ -1,8 +1,7 @@
-import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import (Boolean, CheckConstraint, Column, DateTime, ForeignKey, Index,
+                        Numeric, String, UniqueConstraint, func, text)
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -15,26 +14,49 @@ class PropertyManagerAccess(Base):
     """
 
     __tablename__ = "property_manager_access"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # One grant row per pair; revoking/re-granting flips is_active.
+        # Also serves the "my landlords" lookup by property_manager_id.
+        UniqueConstraint("property_manager_id", "landlord_id", name="uq_pm_access_pair"),
+        # check_property_manager_access: active grant for a (manager, landlord)
+        Index(
+            "ix_pm_access_active_pair",
+            "property_manager_id",
+            "landlord_id",
+            postgresql_where=text("is_active = true"),
+        ),
+        CheckConstraint(
+            "management_fee_percentage BETWEEN 0 AND 100",
+            name="ck_pm_access_fee_percentage",
+        ),
+    )
+    # id / granted_at / is_active are server defaults; RETURN them on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
 
     # Who is managing (must be property_manager role)
-    property_manager_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    property_manager_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
 
     # Whose properties they're managing (must be landlord role)
-    landlord_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    landlord_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
 
     # Access control
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, server_default=text("true"))
 
     # Management fee (percentage of monthly rent, e.g., 10.0 = 10%)
-    management_fee_percentage = Column(
-        String, nullable=True
-    )  # Stored as string for flexibility
+    management_fee_percentage = Column(Numeric(5, 2), nullable=True)
 
     # Timestamps
-    granted_at = Column(DateTime, default=naive_utcnow)
-    revoked_at = Column(DateTime, nullable=True)
+    granted_at = Column(DateTime(timezone=True), server_default=func.now())
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
 
     # Metadata
     notes = Column(String, nullable=True)  # Why was access granted/what agreement
@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator, computed_field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, computed_field
 
 
 class PropertyCreate(BaseModel):
@@ -271,8 +271,7 @@ class PropertyResponse(BaseModel):
     match_score: Optional[int] = None
     match_breakdown: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @computed_field
     @property
@@ -326,8 +325,7 @@ class MediaSessionResponse(BaseModel):
     # Room info for capture page room selector
     rooms: Optional[list] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MediaUploadMetadata(BaseModel):
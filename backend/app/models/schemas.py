@@ -1,9 +1,52 @@
 import re
+import string
 from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
+
+_PASSWORD_UPPER = frozenset(string.ascii_uppercase)
+_PASSWORD_LOWER = frozenset(string.ascii_lowercase)
+_PASSWORD_SPECIAL = frozenset('!@#$%^&*(),.?":{}|<>')
+
+_SIGNUP_ROLE_PATTERN = "^(tenant|landlord|property_manager)$"
+
+# Contact details a bio must not carry (email address, phone number).
+_BIO_EMAIL_RE = re.compile(r"\S+@\S+\.\S+")
+_BIO_PHONE_RE = re.compile(r"\+?\d[\d .\-]{8,}")
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _check_password_complexity(v: str) -> str:
+    """Require an uppercase letter, a lowercase letter, a digit and a special
+    character, classifying each character once in a single pass."""
+    has_upper = has_lower = has_digit = has_special = False
+    for c in v:
+        if c in _PASSWORD_UPPER:
+            has_upper = True
+        elif c in _PASSWORD_LOWER:
+            has_lower = True
+        elif c.isdecimal():  # same set as the regex \d
+            has_digit = True
+        elif c in _PASSWORD_SPECIAL:
+            has_special = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit and has_special:
+            return v
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not has_digit:
+        raise ValueError("Password must contain at least one digit")
+    if not has_special:
+        raise ValueError("Password must contain at least one special character")
+    return v
 
 
 class UserRegister(BaseModel):
@@ -11,7 +54,7 @@ class UserRegister(BaseModel):
     password: str = Field(min_length=8, max_length=128)
     full_name: str
     phone: Optional[str] = Field(None, max_length=20)
-    role: str = Field(pattern="^(tenant|landlord|property_manager)$")
+    role: str = Field(pattern=_SIGNUP_ROLE_PATTERN)
     marketing_consent: bool = False
 
     @field_validator("full_name")
@@ -26,15 +69,7 @@ class UserRegister(BaseModel):
     @classmethod
     def validate_password_complexity(cls, v: str) -> str:
         """Enforce password complexity: uppercase, lowercase, digit, special char"""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError("Password must contain at least one special character")
-        return v
+        return _check_password_complexity(v)
 
 
 class UserLogin(BaseModel):
@@ -85,8 +120,7 @@ class UserResponse(BaseModel):
     contact_preferences: Optional[Dict[str, Any]] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @model_validator(mode="after")
     def compute_onboarding(self) -> 'UserResponse':
@@ -116,10 +150,9 @@ class UserUpdate(BaseModel):
             return ""
         if len(v) < 40 or len(v) > 300:
             raise ValueError("bio must be between 40 and 300 characters")
-        import re
-        if re.search(r"\S+@\S+\.\S+", v):
+        if _BIO_EMAIL_RE.search(v):
             raise ValueError("bio must not contain contact details")
-        if re.search(r"\+?\d[\d .\-]{8,}", v):
+        if _BIO_PHONE_RE.search(v):
             raise ValueError("bio must not contain contact details")
         return v
 
@@ -135,16 +168,7 @@ class ChangePasswordRequest(BaseModel):
     @classmethod
     def validate_password_complexity(cls, v: str) -> str:
         """Enforce password complexity"""
-        import re
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError("Password must contain at least one special character")
-        return v
+        return _check_password_complexity(v)
 
 class RequestEmailChangeRequest(BaseModel):
     new_email: EmailStr
@@ -166,7 +190,7 @@ class ForgotEmailRequest(BaseModel):
 class GoogleAuthRequest(BaseModel):
     credential: str  # Google ID token from frontend
     role: Optional[str] = Field(
-        default=None, pattern="^(tenant|landlord|property_manager)$"
+        default=None, pattern=_SIGNUP_ROLE_PATTERN
     )
 
 
@@ -178,15 +202,7 @@ class ResetPasswordRequest(BaseModel):
     @classmethod
     def validate_password_complexity(cls, v: str) -> str:
         """Enforce the same complexity as registration / change-password."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError("Password must contain at least one special character")
-        return v
+        return _check_password_complexity(v)
 
 
 class ApplicationCreate(BaseModel):
@@ -208,8 +224,24 @@ class TenantSummary(BaseModel):
     solvency_verified: bool = False
     guarantor_type: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, user: Any) -> "TenantSummary":
+        """Build from a loaded User row without re-validating it."""
+        return cls.model_construct(
+            id=user.id,
+            full_name=user.full_name,
+            bio=user.bio,
+            email=user.email,
+            profile_picture_url=user.profile_picture_url,
+            trust_score=user.trust_score,
+            identity_verified=user.identity_verified,
+            employment_verified=user.employment_verified,
+            income_verified=user.income_verified,
+            solvency_verified=user.solvency_verified,
+            guarantor_type=user.guarantor_type,
+        )
 
 
 class PropertySummary(BaseModel):
@@ -225,8 +257,24 @@ class PropertySummary(BaseModel):
     furnished: Optional[bool] = None
     surface_area: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, prop: Any) -> "PropertySummary":
+        """Build from a loaded Property row without re-validating it. DECIMAL
+        columns are converted to float here, as validation would."""
+        return cls.model_construct(
+            id=prop.id,
+            title=prop.title,
+            city=prop.city,
+            address_line1=prop.address_line1,
+            monthly_rent=_float_or_none(prop.monthly_rent),
+            charges=_float_or_none(prop.charges),
+            deposit=_float_or_none(prop.deposit),
+            property_type=prop.property_type,
+            furnished=prop.furnished,
+            surface_area=_float_or_none(getattr(prop, "surface_area", None)),
+        )
 
 
 class ApplicationResponse(BaseModel):
@@ -241,5 +289,24 @@ class ApplicationResponse(BaseModel):
     tenant: Optional[TenantSummary] = None
     property: Optional[PropertySummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, application: Any) -> "ApplicationResponse":
+        """Build from an Application row loaded with its tenant and property.
+
+        The list endpoints return these directly: FastAPI passes instances of
+        the response model through without validating every row again.
+        """
+        tenant, prop = application.tenant, application.property
+        return cls.model_construct(
+            id=application.id,
+            property_id=application.property_id,
+            tenant_id=application.tenant_id,
+            status=getattr(application.status, "value", application.status),
+            cover_letter=application.cover_letter,
+            created_at=application.created_at,
+            updated_at=application.updated_at,
+            tenant=TenantSummary.from_orm_fast(tenant) if tenant is not None else None,
+            property=PropertySummary.from_orm_fast(prop) if prop is not None else None,
+        )
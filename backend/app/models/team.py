@@ -7,13 +7,13 @@ import enum
 import secrets
 import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
 
 from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
@@ -24,6 +24,16 @@ class PermissionLevel(str, enum.Enum):
     FULL_ACCESS = "full_access"  # + Edit property, generate leases
 
 
+# Integer rank per level, lowest to highest. The enum's values are the
+# strings stored in Postgres, so ordering is declared here rather than by
+# making PermissionLevel an IntEnum.
+PERMISSION_RANK = {
+    PermissionLevel.VIEW_ONLY: 0,
+    PermissionLevel.MANAGE_VISITS: 1,
+    PermissionLevel.FULL_ACCESS: 2,
+}
+
+
 class InviteStatus(str, enum.Enum):
     PENDING = "pending"
     ACTIVE = "active"
@@ -38,6 +48,18 @@ class TeamMember(Base):
     """
 
     __tablename__ = "team_members"
+    __table_args__ = (
+        # Permission checks: member_user_id = ? AND status = 'active', joined
+        # on landlord_id
+        Index(
+            "ix_team_members_active_member",
+            "member_user_id",
+            "landlord_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+    # created_at is generated by Postgres; RETURN it on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -87,19 +109,19 @@ class TeamMember(Base):
         nullable=False,
         default=lambda: secrets.token_urlsafe(32),
     )
-    invite_expires_at = Column(DateTime, nullable=True)  # Optional expiry
+    invite_expires_at = Column(DateTime(timezone=True), nullable=True)  # Optional expiry
 
     # Timestamps
-    created_at = Column(DateTime, default=naive_utcnow)
-    accepted_at = Column(DateTime, nullable=True)
-    revoked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    accepted_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     landlord = relationship(
-        "User", foreign_keys=[landlord_id], backref="team_members_owned"
+        "User", foreign_keys=[landlord_id], back_populates="team_members_owned"
     )
     member = relationship(
-        "User", foreign_keys=[member_user_id], backref="team_memberships"
+        "User", foreign_keys=[member_user_id], back_populates="team_memberships"
     )
     property_access = relationship(
         "TeamMemberProperty", back_populates="team_member", cascade="all, delete-orphan"
@@ -113,11 +135,20 @@ class TeamMemberProperty(Base):
     """
 
     __tablename__ = "team_member_properties"
+    __table_args__ = (
+        # Per-property grant lookup; index-only with the override included
+        Index(
+            "ix_team_member_properties_member_property",
+            "team_member_id",
+            "property_id",
+            postgresql_include=["permission_override"],
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     team_member_id = Column(
-        UUID(as_uuid=True), ForeignKey("team_members.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("team_members.id", ondelete="CASCADE"), nullable=False
     )
     property_id = Column(
         UUID(as_uuid=True), ForeignKey("properties.id", ondelete="CASCADE"), nullable=False, index=True
@@ -131,11 +162,12 @@ class TeamMemberProperty(Base):
             name="permission_level_enum",
             native_enum=True,
             create_type=False,
+            values_callable=lambda x: [e.value for e in x],
         ),
         nullable=True,
     )
 
-    created_at = Column(DateTime, default=naive_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     team_member = relationship("TeamMember", back_populates="property_access")
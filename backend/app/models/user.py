@@ -5,13 +5,17 @@ from app.core.timeutils import naive_utcnow
 
 from sqlalchemy import JSON, TIMESTAMP, Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+# These tables still store naive UTC timestamps; the session-local now() would
+# not be UTC on a non-UTC server.
+_UTC_NOW = text("(now() AT TIME ZONE 'utc')")
+
 
 class UserRole(str, enum.Enum):
     TENANT = "tenant"
@@ -121,8 +125,8 @@ class User(Base):
     contact_preferences = Column(JSON, nullable=True)  # Notification/contact prefs
 
     # Timestamps
-    created_at = Column(DateTime, default=naive_utcnow)
-    updated_at = Column(DateTime, default=naive_utcnow, onupdate=naive_utcnow)
+    created_at = Column(DateTime, server_default=_UTC_NOW)
+    updated_at = Column(DateTime, server_default=_UTC_NOW, onupdate=naive_utcnow)
     last_login = Column(DateTime, nullable=True)
     refresh_token_version = Column(Integer, default=1)
 
@@ -133,6 +137,39 @@ class User(Base):
     applications = relationship("Application", back_populates="tenant")
     dossiers = relationship("TrustDossier", back_populates="user", cascade="all, delete-orphan")
 
+    # Reverse sides of the user-owned models. Nothing reads these collections
+    # off a User, and an implicit lazy load cannot run under AsyncSession
+    # anyway, so they raise instead of querying; load them explicitly
+    # (selectinload) if a caller ever needs one. passive_deletes where the FK
+    # cascades in the database, so the ORM never loads rows just to delete.
+    properties = relationship(
+        "Property", back_populates="landlord", foreign_keys="Property.landlord_id", lazy="raise"
+    )
+    documents = relationship("Document", back_populates="user", lazy="raise")
+    notifications = relationship(
+        "Notification", back_populates="user", lazy="raise", passive_deletes=True
+    )
+    sent_messages = relationship("Message", back_populates="sender", lazy="raise")
+    landlord_conversations = relationship(
+        "Conversation", back_populates="landlord", foreign_keys="Conversation.landlord_id", lazy="raise"
+    )
+    tenant_conversations = relationship(
+        "Conversation", back_populates="tenant", foreign_keys="Conversation.tenant_id", lazy="raise"
+    )
+    saved_properties = relationship(
+        "SavedProperty", back_populates="user", lazy="raise", passive_deletes=True
+    )
+    team_members_owned = relationship(
+        "TeamMember", back_populates="landlord", foreign_keys="TeamMember.landlord_id", lazy="raise"
+    )
+    team_memberships = relationship(
+        "TeamMember", back_populates="member", foreign_keys="TeamMember.member_user_id", lazy="raise"
+    )
+    feedback_submissions = relationship("Feedback", back_populates="user", lazy="raise")
+    webhook_subscriptions = relationship(
+        "WebhookSubscription", back_populates="landlord", lazy="raise"
+    )
+
 
 class VerificationRecord(Base):
     __tablename__ = "verification_records"
@@ -146,14 +183,18 @@ class VerificationRecord(Base):
     )  # passive_eidv, document, liveness, employment
 
     # Status and results
-    status = Column(SQLEnum(VerificationStatus), nullable=False)
+    # 001 created the verificationstatus type with the lowercase values
+    status = Column(
+        SQLEnum(VerificationStatus, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
     confidence_score = Column(Integer, nullable=True)  # 0-100
 
     # Data collected during verification
     verification_data = Column(JSON, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=naive_utcnow)
+    created_at = Column(DateTime, server_default=_UTC_NOW)
     completed_at = Column(DateTime, nullable=True)
 
 
@@ -171,4 +212,4 @@ class OnboardingResponse(Base):
     detected_segment = Column(String, nullable=True)  # D1, D2, D3, S1, S2, S3
 
     # Metadata
-    completed_at = Column(DateTime, default=naive_utcnow)
+    completed_at = Column(DateTime, server_default=_UTC_NOW)
@@ -6,9 +6,10 @@ Allows landlords to subscribe to events and receive HTTP notifications.
 import secrets
 import uuid
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import (Boolean, Column, DateTime, FetchedValue, ForeignKey,
+                        Integer, SmallInteger, String, Text)
+from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 
@@ -22,6 +23,8 @@ class WebhookSubscription(Base):
     """
 
     __tablename__ = "webhook_subscriptions"
+    # created_at/updated_at are generated by Postgres; RETURN them on write.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -43,15 +46,25 @@ class WebhookSubscription(Base):
 
     # Status
     is_active = Column(Boolean, default=True)
-    last_triggered_at = Column(DateTime, nullable=True)
-    failure_count = Column(String, default="0")  # Track consecutive failures
+    last_triggered_at = Column(DateTime(timezone=True), nullable=True)
+    failure_count = Column(
+        Integer, default=0, server_default="0"
+    )  # Track consecutive failures
 
     # Timestamps
-    created_at = Column(DateTime, default=naive_utcnow)
-    updated_at = Column(DateTime, default=naive_utcnow, onupdate=naive_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Maintained by the trg_webhook_subscriptions_updated_at trigger
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
 
     # Relationship
-    landlord = relationship("User", backref="webhook_subscriptions")
+    landlord = relationship("User", back_populates="webhook_subscriptions")
+    # deliveries.subscription_id cascades in the database (and is NOT NULL),
+    # so deleting a subscription must not load its deliveries to null them.
+    deliveries = relationship(
+        "WebhookDelivery", back_populates="subscription", lazy="raise", passive_deletes=True
+    )
 
 
 class WebhookDelivery(Base):
@@ -77,14 +90,14 @@ class WebhookDelivery(Base):
 
     # Delivery result
     success = Column(Boolean, default=False)
-    status_code = Column(String, nullable=True)
+    status_code = Column(SmallInteger, nullable=True)
     response_body = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
 
     # Timing
-    created_at = Column(DateTime, default=naive_utcnow)
-    delivered_at = Column(DateTime, nullable=True)
-    duration_ms = Column(String, nullable=True)  # Response time
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Integer, nullable=True)  # Response time
 
     # Relationship
-    subscription = relationship("WebhookSubscription", backref="deliveries")
+    subscription = relationship("WebhookSubscription", back_populates="deliveries")
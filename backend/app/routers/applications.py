@@ -3,16 +3,17 @@ API endpoints for managing Rental Applications (Candidatures).
 """
 
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.database import get_db
 from app.models.application import Application, ApplicationStatus
@@ -42,22 +43,23 @@ async def create_application(
             detail="tenant_bio_required",
         )
 
-    # 1. Check if property exists
+    # 1. Property + "already applied?" in one round trip
     result = await db.execute(
-        select(Property).where(Property.id == application_in.property_id)
+        select(
+            Property,
+            exists()
+            .where(Application.tenant_id == current_user.id)
+            .where(Application.property_id == application_in.property_id)
+            .label("already_applied"),
+        ).where(Property.id == application_in.property_id)
     )
-    property_obj = result.scalar_one_or_none()
-    if not property_obj:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Property not found")
+    property_obj, already_applied = row
 
-    # 2. Check if already applied
-    result = await db.execute(
-        select(Application)
-        .where(Application.tenant_id == current_user.id)
-        .where(Application.property_id == application_in.property_id)
-    )
-    existing = result.scalar_one_or_none()
-    if existing:
+    # 2. Reject duplicates early (the unique constraint still backs this up)
+    if already_applied:
         # 409 Conflict — duplicate application is a resource-state conflict,
         # not a malformed request (per API design standards).
         raise HTTPException(
@@ -84,16 +86,10 @@ async def create_application(
             detail="You have already applied to this property",
         )
 
-    # Load with details for response and notifications
-    result = await db.execute(
-        select(Application)
-        .options(
-            selectinload(Application.tenant),
-            selectinload(Application.property)
-        )
-        .where(Application.id == new_app.id)
-    )
-    new_app = result.scalar_one()
+    # The INSERT returned the server defaults (eager_defaults); attach the
+    # tenant and property already in hand instead of reloading them.
+    set_committed_value(new_app, "tenant", current_user)
+    set_committed_value(new_app, "property", property_obj)
 
     # Notify Landlord
     notification_service = NotificationService(db)
@@ -104,7 +100,7 @@ async def create_application(
         application_id=new_app.id,
     )
 
-    return new_app
+    return ApplicationResponse.from_orm_fast(new_app)
 
 
 @router.get("/me", response_model=List[ApplicationResponse])
@@ -121,7 +117,7 @@ async def list_my_applications(
         .where(Application.tenant_id == current_user.id)
         .order_by(Application.created_at.desc())
     )
-    return result.scalars().all()
+    return [ApplicationResponse.from_orm_fast(a) for a in result.scalars().all()]
 
 
 @router.get("/received", response_model=List[ApplicationResponse])
@@ -140,7 +136,7 @@ async def list_received_applications(
         .where(Property.landlord_id == current_user.id)
         .order_by(Application.created_at.desc())
     )
-    return result.scalars().all()
+    return [ApplicationResponse.from_orm_fast(a) for a in result.scalars().all()]
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
@@ -184,12 +180,13 @@ async def update_application_status(
     db: AsyncSession = Depends(get_db),
 ):
     """Update application status (Landlord only)"""
-    # 1. Get Application + Property + Tenant
+    # 1. Get Application + Property + Tenant in one round trip (both
+    # many-to-one; the response and the notification need them)
     result = await db.execute(
         select(Application)
         .options(
-            selectinload(Application.property),
-            selectinload(Application.tenant)
+            joinedload(Application.property),
+            joinedload(Application.tenant)
         )
         .where(Application.id == application_id)
     )
@@ -206,10 +203,11 @@ async def update_application_status(
 
     # 3. Update
     application.status = update_data.status
-    application.updated_at = naive_utcnow()
+    application.updated_at = utcnow()
 
+    # Every column the response reads was just set here or loaded above
+    # (expire_on_commit=False), so no refresh round trip is needed.
     await db.commit()
-    await db.refresh(application)
 
     # Send notification
     notification_service = NotificationService(db)
@@ -249,7 +247,7 @@ async def withdraw_application(
         )
 
     application.status = ApplicationStatus.WITHDRAWN
-    application.updated_at = naive_utcnow()
+    application.updated_at = utcnow()
 
     await db.commit()
     await db.refresh(application)
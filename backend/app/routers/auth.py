@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import (create_access_token, create_refresh_token, get_password_hash,
-                               verify_password, verify_token)
+                               password_needs_rehash, verify_password, verify_token)
 from app.models.schemas import (ForgotPasswordRequest, ForgotEmailRequest, GoogleAuthRequest,
                                 ResetPasswordRequest, Token, UserLogin,
                                 UserRegister, UserResponse, UserUpdate,
@@ -255,6 +255,11 @@ async def login(
     # Successful credential check — clear any accumulated failures.
     await _clear_login_failures(form_data.username)
 
+    # Upgrade hashes made with older Argon2 parameters while we hold the
+    # plaintext; get_db commits it with the rest of the request.
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(form_data.password)
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Account is inactive"
@@ -9,14 +9,14 @@ import ipaddress
 import json
 import socket
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import naive_utcnow, utcnow
 from typing import List, Optional
 from urllib.parse import urlparse
 from uuid import UUID
 
 import httpx
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_validator
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -116,24 +116,22 @@ class SubscriptionResponse(BaseModel):
     is_active: bool
     secret: str
     last_triggered_at: Optional[datetime]
-    failure_count: str
+    failure_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DeliveryResponse(BaseModel):
     id: str
     event_type: str
     success: bool
-    status_code: Optional[str]
+    status_code: Optional[int]
     error_message: Optional[str]
     created_at: datetime
-    duration_ms: Optional[str]
+    duration_ms: Optional[int]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # --- Endpoints ---
@@ -200,8 +198,9 @@ async def create_subscription(
         is_active=True,
     )
     db.add(subscription)
+    # secret is set client-side and the timestamps come back with the INSERT
+    # (eager_defaults), so no refresh is needed.
     await db.commit()
-    await db.refresh(subscription)
 
     return SubscriptionResponse(
         id=str(subscription.id),
@@ -393,7 +392,7 @@ async def send_webhook(
     Send webhook to subscription URL.
     Records delivery in database.
     """
-    start_time = naive_utcnow()
+    start_time = utcnow()
 
     # Create signature
     payload_str = json.dumps(payload)
@@ -418,34 +417,34 @@ async def send_webhook(
                 subscription.url, content=payload_str, headers=headers
             )
 
-        end_time = naive_utcnow()
+        end_time = utcnow()
         duration = int((end_time - start_time).total_seconds() * 1000)
 
         delivery.success = response.status_code < 400
-        delivery.status_code = str(response.status_code)
+        delivery.status_code = response.status_code
         delivery.response_body = response.text[:500] if response.text else None
         delivery.delivered_at = end_time
-        delivery.duration_ms = str(duration)
+        delivery.duration_ms = duration
 
         # Update subscription
         subscription.last_triggered_at = end_time
         if delivery.success:
-            subscription.failure_count = "0"
+            subscription.failure_count = 0
         else:
-            subscription.failure_count = str(int(subscription.failure_count or "0") + 1)
+            subscription.failure_count = (subscription.failure_count or 0) + 1
 
         result = {"success": delivery.success, "status_code": delivery.status_code}
 
     except Exception as e:
-        end_time = naive_utcnow()
+        end_time = utcnow()
         duration = int((end_time - start_time).total_seconds() * 1000)
 
         delivery.success = False
         delivery.error_message = str(e)[:500]
         delivery.delivered_at = end_time
-        delivery.duration_ms = str(duration)
+        delivery.duration_ms = duration
 
-        subscription.failure_count = str(int(subscription.failure_count or "0") + 1)
+        subscription.failure_count = (subscription.failure_count or 0) + 1
 
         result = {"success": False, "error": str(e)}
 
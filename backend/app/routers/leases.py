@@ -11,12 +11,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.models.application import Application
+from app.models.application import Application, ApplicationStatus
 from app.models.property import Property
 from app.models.user import User
 from app.models.visits_and_leases import Lease
@@ -53,8 +53,7 @@ class LeaseResponse(BaseModel):
     created_at: Optional[datetime] = None
     property_location: Optional[dict] = None  # {lat, lng}
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 from sqlalchemy.orm import selectinload
@@ -207,7 +206,7 @@ async def create_lease(
     db.add(lease)
 
     # Update application status
-    application.status = "lease_created"
+    application.status = ApplicationStatus.LEASE_CREATED
 
     await db.commit()
     await db.refresh(lease)
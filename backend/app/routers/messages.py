@@ -4,12 +4,12 @@ Handles conversations, messages, and read status.
 """
 
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -51,8 +51,7 @@ class MessageResponse(BaseModel):
     # Roomivo states facts, the reader decides (never gates the message).
     safety_advisories: List[str] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationCreate(BaseModel):
@@ -76,8 +75,7 @@ class ConversationSummary(BaseModel):
     unread_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationDetail(BaseModel):
@@ -91,8 +89,7 @@ class ConversationDetail(BaseModel):
     messages: List[MessageResponse]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UnreadCountResponse(BaseModel):
@@ -343,7 +340,6 @@ async def create_conversation(
         tenant_id=tenant.id,
         subject=subject,
         status="active",
-        unread_count_tenant=1,  # Tenant has 1 unread (the initial message)
     )
     db.add(conv)
     await db.flush()  # Get conv.id
@@ -407,14 +403,9 @@ async def send_message(
     )
     db.add(msg)
 
-    # Update conversation
-    conv.last_message_at = naive_utcnow()
-
-    # Increment unread count for the OTHER party
-    if current_user.id == conv.landlord_id:
-        conv.unread_count_tenant += 1
-    else:
-        conv.unread_count_landlord += 1
+    # Update conversation (the recipient's unread count is bumped by the
+    # trg_messages_bump_unread trigger on insert)
+    conv.last_message_at = utcnow()
 
     await db.commit()
     await db.refresh(msg)
@@ -465,7 +456,7 @@ async def mark_as_read(
                 Message.is_read == False,
             )
         )
-        .values(is_read=True, read_at=naive_utcnow())
+        .values(is_read=True, read_at=utcnow())
     )
 
     await db.commit()
@@ -549,9 +540,8 @@ async def create_system_message(
     )
     db.add(msg)
 
-    # Update conversation
-    conv.last_message_at = naive_utcnow()
-    conv.unread_count_tenant += 1
+    # Update conversation (trg_messages_bump_unread bumps the tenant's count)
+    conv.last_message_at = utcnow()
 
     await db.commit()
     await db.refresh(msg)
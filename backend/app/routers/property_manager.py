@@ -1,15 +1,16 @@
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.permissions import check_permission
+from app.core.permissions import (check_permission,
+                                  invalidate_property_manager_access)
 from app.models.property_manager import PropertyManagerAccess
 from app.models.user import User, UserRole
 from app.routers.auth import get_current_user
@@ -19,7 +20,7 @@ router = APIRouter(prefix="/property-manager", tags=["Property Manager"])
 
 class GrantAccessRequest(BaseModel):
     landlord_id: str
-    management_fee_percentage: Optional[str] = "10.0"
+    management_fee_percentage: Optional[float] = Field(10.0, ge=0, le=100)
     notes: Optional[str] = None
 
 
@@ -29,13 +30,12 @@ class PropertyManagerAccessResponse(BaseModel):
     landlord_id: str
     landlord_name: str
     is_active: bool
-    management_fee_percentage: Optional[str]
+    management_fee_percentage: Optional[float]
     granted_at: datetime
     revoked_at: Optional[datetime]
     notes: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @router.post("/request-access")
@@ -79,18 +79,27 @@ async def request_access_to_landlord(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Access already granted"
         )
 
-    # Create access record
-    access = PropertyManagerAccess(
-        property_manager_id=current_user.id,
-        landlord_id=request.landlord_id,
-        management_fee_percentage=request.management_fee_percentage,
-        notes=request.notes,
-        is_active=True,
-    )
+    if existing_access:
+        # One row per (manager, landlord): re-granting reactivates it
+        access = existing_access
+        access.is_active = True
+        access.management_fee_percentage = request.management_fee_percentage
+        access.notes = request.notes
+        access.granted_at = utcnow()
+        access.revoked_at = None
+    else:
+        # Create access record
+        access = PropertyManagerAccess(
+            property_manager_id=current_user.id,
+            landlord_id=request.landlord_id,
+            management_fee_percentage=request.management_fee_percentage,
+            notes=request.notes,
+            is_active=True,
+        )
+        db.add(access)
 
-    db.add(access)
     await db.commit()
-    await db.refresh(access)
+    await invalidate_property_manager_access(current_user.id, request.landlord_id)
 
     return {"message": "Access granted successfully", "access_id": str(access.id)}
 
@@ -182,8 +191,11 @@ async def revoke_access(
 
     # Revoke access
     access.is_active = False
-    access.revoked_at = naive_utcnow()
+    access.revoked_at = utcnow()
     await db.commit()
+    await invalidate_property_manager_access(
+        access.property_manager_id, access.landlord_id
+    )
 
     return {"message": "Access revoked successfully"}
 
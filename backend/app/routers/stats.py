@@ -5,7 +5,7 @@ Aggregates data for dashboards — Overview, Alerts, Revenue Chart.
 
 import logging
 from datetime import date, datetime, timedelta
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List, Optional
 from uuid import UUID
 
@@ -540,7 +540,9 @@ async def get_landlord_revenue_chart(
         )
     )
     res_leases = await db.execute(stmt_leases)
-    leases = res_leases.fetchall()
+    # rent_amount is NUMERIC(10,2) (Decimal); convert once per lease rather
+    # than once per lease per charted day.
+    leases = [(start_dt, end_dt, float(rent)) for start_dt, end_dt, rent in res_leases.fetchall()]
 
     # 2. Fetch applications created in range
     stmt_apps = select(func.date(Application.created_at), func.count(Application.id)).join(
@@ -565,7 +567,7 @@ async def get_landlord_revenue_chart(
         rev = 0.0
         for start_dt, end_dt, rent in leases:
             if start_dt <= day and (end_dt is None or end_dt >= day):
-                rev += float(rent)
+                rev += rent
         
         apps = apps_by_date.get(day_str, 0)
         
@@ -601,7 +603,7 @@ async def get_landlord_visits(
     total_visits = res_total.scalar_one_or_none() or 0
     
     # Booked slots that are upcoming
-    now = naive_utcnow()
+    now = utcnow()
     stmt_upcoming = select(func.count(VisitSlot.id)).where(
         and_(
             VisitSlot.landlord_id == current_user.id,
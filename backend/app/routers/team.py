@@ -6,12 +6,12 @@ Allows landlords to invite team members, manage permissions, and assign properti
 import logging
 import secrets
 from datetime import datetime, timedelta
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -57,8 +57,7 @@ class TeamMemberResponse(BaseModel):
     created_at: datetime
     accepted_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TeamMemberDetailResponse(BaseModel):
@@ -72,8 +71,7 @@ class TeamMemberDetailResponse(BaseModel):
     accepted_at: Optional[datetime]
     invite_link: Optional[str]  # Only for pending invites
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AcceptInviteRequest(BaseModel):
@@ -89,8 +87,7 @@ class PendingInviteResponse(BaseModel):
     token: str = ""
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # --- Endpoints ---
@@ -279,7 +276,7 @@ async def invite_team_member(
         permission_level=permission,
         status=InviteStatus.PENDING,
         invite_token=secrets.token_urlsafe(32),
-        invite_expires_at=naive_utcnow() + timedelta(days=7),
+        invite_expires_at=utcnow() + timedelta(days=7),
     )
     db.add(member)
     await db.flush()  # Get member.id
@@ -299,8 +296,8 @@ async def invite_team_member(
                 {"id": str(prop.id), "title": prop.title, "permission_override": None}
             )
 
+    # created_at came back with the INSERT (eager_defaults); no refresh needed.
     await db.commit()
-    await db.refresh(member)
 
     # Send invite email (off the request path)
     background_tasks.add_task(
@@ -466,7 +463,7 @@ async def revoke_team_member(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     member.status = InviteStatus.REVOKED
-    member.revoked_at = naive_utcnow()
+    member.revoked_at = utcnow()
 
     await db.commit()
 
@@ -535,7 +532,7 @@ async def accept_invite(
         raise HTTPException(status_code=400, detail="Invite already used or revoked")
 
     # Check expiry
-    if member.invite_expires_at and naive_utcnow() > member.invite_expires_at:
+    if member.invite_expires_at and utcnow() > member.invite_expires_at:
         member.status = InviteStatus.EXPIRED
         await db.commit()
         raise HTTPException(status_code=400, detail="Invite has expired")
@@ -550,7 +547,7 @@ async def accept_invite(
     # Accept invite
     member.member_user_id = current_user.id
     member.status = InviteStatus.ACTIVE
-    member.accepted_at = naive_utcnow()
+    member.accepted_at = utcnow()
 
     # Unlock Landlord role for the team member if not already unlocked
     current_roles = list(current_user.available_roles or ["tenant"])
@@ -611,5 +608,5 @@ async def get_invite_info(token: str, db: AsyncSession = Depends(get_db)):
         "permission_level": member.permission_level.value,
         "property_count": prop_count,
         "expired": member.invite_expires_at
-        and naive_utcnow() > member.invite_expires_at,
+        and utcnow() > member.invite_expires_at,
     }
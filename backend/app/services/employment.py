@@ -17,6 +17,7 @@ from app.services.french_government_api import french_gov_service
 from app.core.database import AsyncSessionLocal
 from app.models.document import DocumentExtraction
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger(__name__)
 
@@ -72,9 +73,9 @@ class EmploymentVerificationService:
         """Alias for verify_document to maintain backward compatibility with tests."""
         return await self.verify_document(file_content, file_type, expected_name, document_type="payslip")
 
-    def _get_file_hash(self, file_content: bytes) -> str:
-        """Generate a SHA-256 hash of the file content."""
-        return hashlib.sha256(file_content).hexdigest()
+    def _get_file_hash(self, file_content: bytes) -> bytes:
+        """Generate a SHA-256 digest of the file content (raw bytes, the cache key)."""
+        return hashlib.sha256(file_content).digest()
 
     async def verify_document(
         self, file_content: bytes, file_type: str, expected_name: str, document_type: str = "payslip"
@@ -101,7 +102,7 @@ class EmploymentVerificationService:
             db_extraction = result.scalar_one_or_none()
             
             if db_extraction:
-                logger.info(f"OCR Cache Hit for hash {file_hash}")
+                logger.info(f"OCR Cache Hit for hash {file_hash.hex()}")
                 data = db_extraction.extraction_data
                 cached_extraction = EmploymentData(
                     employer_name=data.get("employer_name", "Unknown"),
@@ -124,25 +125,30 @@ class EmploymentVerificationService:
             # Store in cache if successful
             if extracted_data:
                 async with AsyncSessionLocal() as session:
-                    new_extraction = DocumentExtraction(
-                        file_hash=file_hash,
-                        extraction_data={
-                            "employer_name": extracted_data.employer_name,
-                            "employee_name": extracted_data.employee_name,
-                            "gross_salary": float(extracted_data.gross_salary),
-                            "net_salary": float(extracted_data.net_salary),
-                            "pay_period": extracted_data.pay_period,
-                            "employment_type": extracted_data.employment_type,
-                            "siret": extracted_data.siret,
-                            "job_title": extracted_data.job_title,
-                            "confidence_score": float(extracted_data.confidence_score),
-                        }
+                    # Concurrent uploads of the same file race to cache it;
+                    # let Postgres drop the loser in the same round trip.
+                    stmt = (
+                        pg_insert(DocumentExtraction)
+                        .values(
+                            file_hash=file_hash,
+                            extraction_data={
+                                "employer_name": extracted_data.employer_name,
+                                "employee_name": extracted_data.employee_name,
+                                "gross_salary": float(extracted_data.gross_salary),
+                                "net_salary": float(extracted_data.net_salary),
+                                "pay_period": extracted_data.pay_period,
+                                "employment_type": extracted_data.employment_type,
+                                "siret": extracted_data.siret,
+                                "job_title": extracted_data.job_title,
+                                "confidence_score": float(extracted_data.confidence_score),
+                            },
+                        )
+                        .on_conflict_do_nothing(index_elements=["file_hash"])
                     )
-                    session.add(new_extraction)
                     try:
+                        await session.execute(stmt)
                         await session.commit()
                     except Exception as e:
-                        # Handle potential race condition or DB error
                         await session.rollback()
                         logger.warning(f"Failed to cache extraction: {e}")
 
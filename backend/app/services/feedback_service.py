@@ -19,7 +19,6 @@ class FeedbackService:
         )
         db.add(feedback)
         await db.commit()
-        await db.refresh(feedback)
         return feedback
 
 
@@ -15,6 +15,7 @@ from typing import Optional
 from app.core.database import AsyncSessionLocal
 from app.models.document import DocumentExtraction
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +60,9 @@ class IdentityVerificationService:
         if GEMINI_AVAILABLE and genai is not None and settings.GEMINI_API_KEY:
             self.ai_client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-    def _get_file_hash(self, file_content: bytes) -> str:
-        """Generate a SHA-256 hash of the file content."""
-        return hashlib.sha256(file_content).hexdigest()
+    def _get_file_hash(self, file_content: bytes) -> bytes:
+        """Generate a SHA-256 digest of the file content (raw bytes, the cache key)."""
+        return hashlib.sha256(file_content).digest()
 
     async def verify_document(
         self, file_content: bytes, file_type: str, expected_name: str, document_type: str
@@ -88,7 +89,7 @@ class IdentityVerificationService:
             db_extraction = result.scalar_one_or_none()
             
             if db_extraction:
-                logger.info(f"Identity OCR Cache Hit for hash {file_hash}")
+                logger.info(f"Identity OCR Cache Hit for hash {file_hash.hex()}")
                 data = db_extraction.extraction_data
                 cached_extraction = IdentityData(
                     full_name=data.get("full_name", "Unknown"),
@@ -108,20 +109,26 @@ class IdentityVerificationService:
             # Store in cache if successful
             if extracted_data:
                 async with AsyncSessionLocal() as session:
-                    new_extraction = DocumentExtraction(
-                        file_hash=file_hash,
-                        extraction_data={
-                            "full_name": extracted_data.full_name,
-                            "document_number": extracted_data.document_number,
-                            "expiry_date": extracted_data.expiry_date,
-                            "document_type": extracted_data.document_type,
-                            "is_identity_document": extracted_data.is_identity_document,
-                            "has_face_photo": extracted_data.has_face_photo,
-                            "confidence_score": float(extracted_data.confidence_score),
-                        }
+                    # Concurrent uploads of the same file race to cache it;
+                    # let Postgres drop the loser in the same round trip.
+                    stmt = (
+                        pg_insert(DocumentExtraction)
+                        .values(
+                            file_hash=file_hash,
+                            extraction_data={
+                                "full_name": extracted_data.full_name,
+                                "document_number": extracted_data.document_number,
+                                "expiry_date": extracted_data.expiry_date,
+                                "document_type": extracted_data.document_type,
+                                "is_identity_document": extracted_data.is_identity_document,
+                                "has_face_photo": extracted_data.has_face_photo,
+                                "confidence_score": float(extracted_data.confidence_score),
+                            },
+                        )
+                        .on_conflict_do_nothing(index_elements=["file_hash"])
                     )
-                    session.add(new_extraction)
                     try:
+                        await session.execute(stmt)
                         await session.commit()
                     except Exception as e:
                         await session.rollback()
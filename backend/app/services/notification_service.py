@@ -4,7 +4,7 @@ Respects user contact preferences and verification status.
 """
 
 from datetime import datetime
-from app.core.timeutils import naive_utcnow
+from app.core.timeutils import utcnow
 from typing import List, Optional
 from uuid import UUID
 
@@ -35,7 +35,7 @@ class NotificationService:
         title: str,
         message: str,
         action_url: Optional[str] = None,
-        extra_data: Optional[str] = None,
+        extra_data: Optional[dict] = None,
     ) -> Notification:
         """Create an in-app notification"""
         notification = Notification(
@@ -48,7 +48,6 @@ class NotificationService:
         )
         self.db.add(notification)
         await self.db.commit()
-        await self.db.refresh(notification)
         return notification
 
     async def notify_application_received(
@@ -317,7 +316,7 @@ class NotificationService:
             update(Notification)
             .where(Notification.id == notification_id)
             .where(Notification.user_id == user_id)
-            .values(read=True, read_at=naive_utcnow())
+            .values(read=True, read_at=utcnow())
         )
         await self.db.commit()
         return result.rowcount > 0
@@ -328,7 +327,7 @@ class NotificationService:
             update(Notification)
             .where(Notification.user_id == user_id)
             .where(Notification.read == False)
-            .values(read=True, read_at=naive_utcnow())
+            .values(read=True, read_at=utcnow())
         )
         await self.db.commit()
         return result.rowcount
@@ -59,4 +59,10 @@ celery_app.conf.beat_schedule = {
         "task": "app.workers.tasks.purge_stale_identity_docs_task",
         "schedule": crontab(minute="*/15"),
     },
+    # Keeps notifications bounded to the retention window (read rows only).
+    # No-op unless NOTIFICATION_RETENTION_DAYS is set.
+    "purge-read-notifications": {
+        "task": "app.workers.tasks.purge_read_notifications_task",
+        "schedule": crontab(hour=3, minute=30),
+    },
 }
@@ -59,13 +59,13 @@ def purge_stale_applications_task(self) -> dict:
     from datetime import timedelta
     from sqlalchemy import select
     from app.core.database import AsyncSessionLocal
-    from app.core.timeutils import naive_utcnow
+    from app.core.timeutils import utcnow
     from app.models.application import Application, ApplicationStatus
     from app.services.storage import storage
 
     async def _purge():
         purged_count = 0
-        cutoff_date = naive_utcnow() - timedelta(days=30)
+        cutoff_date = utcnow() - timedelta(days=30)
 
         async with AsyncSessionLocal() as db:
             # Find stale applications
@@ -425,3 +425,55 @@ def purge_stale_identity_docs_task(self) -> dict:
         return future.result()
     else:
         return asyncio.run(_purge())
+
+
+@celery_app.task(
+    name="app.workers.tasks.purge_read_notifications_task",
+    bind=True,
+    max_retries=1,
+)
+def purge_read_notifications_task(self) -> dict:
+    """
+    Delete read notifications older than settings.NOTIFICATION_RETENTION_DAYS.
+
+    Opt-in retention policy (0, the default, disables it). Unread
+    notifications are kept regardless of age so nothing disappears before it
+    is seen. One set-based DELETE per night keeps the table (and its per-user
+    indexes) bounded to roughly the retention window.
+    """
+    import asyncio
+    from datetime import timedelta
+    from sqlalchemy import delete
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal
+    from app.core.timeutils import utcnow
+    from app.models.notification import Notification
+
+    retention_days = settings.NOTIFICATION_RETENTION_DAYS
+    if retention_days <= 0:
+        return {"notifications_deleted": 0, "retention": "disabled"}
+
+    async def _purge():
+        cutoff = utcnow() - timedelta(days=retention_days)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                delete(Notification).where(
+                    Notification.read == True,
+                    Notification.created_at < cutoff,
+                )
+            )
+            await db.commit()
+
+        logger.info("purge_read_notifications: deleted=%d", result.rowcount)
+        return {"notifications_deleted": result.rowcount}
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop and loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(_purge(), loop)
+        return future.result()
+    else:
+        return asyncio.run(_purge())
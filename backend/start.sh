@@ -47,15 +47,26 @@ if [ -n "$DATABASE_URL" ]; then
         exit 1
     fi
     echo "✅ Database connection successful"
-    
-    echo "🔍 Inspecting current database schema before migration..."
-    python inspect_db.py
 else
     echo "⚠️ DATABASE_URL is not set. Skipping pre-flight checks."
 fi
 
-echo "🏗️ Running database migrations..."
-alembic upgrade head
+# MIGRATION_MODE=sync (default) migrates here, before Uvicorn starts.
+# MIGRATION_MODE=skip leaves it to a separate pre-deploy job (render.yaml), so
+# a long index build never holds the web process unready mid-deploy.
+MIGRATION_MODE="${MIGRATION_MODE:-sync}"
+if [ "$MIGRATION_MODE" = "sync" ]; then
+    if [ -n "$DATABASE_URL" ]; then
+        echo "🔍 Inspecting current database schema before migration..."
+        python inspect_db.py
+    fi
+
+    echo "🏗️ Running database migrations..."
+    # Fail fast rather than queue every query behind a blocked ALTER.
+    PGOPTIONS="-c lock_timeout=5s" alembic upgrade head
+else
+    echo "⏭️ MIGRATION_MODE=$MIGRATION_MODE: skipping migrations (run by the pre-deploy job)."
+fi
 
 echo "🔥 Starting FastAPI application with Uvicorn..."
 # Production settings:
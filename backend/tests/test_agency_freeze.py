@@ -52,3 +52,28 @@ def test_source_configs_not_mutated():
 
     get_segment_config("S3")
     assert "team" in SEGMENT_CONFIGS["S3"].features
+
+
+def test_has_feature_follows_the_flag_and_falls_back_to_d1(monkeypatch):
+    from app.core.config import settings
+    from app.core.segment_routing import has_feature
+
+    assert has_feature(None, "search") is True
+    assert has_feature("unknown", "chat") is True
+    assert has_feature(None, "analytics") is False
+
+    monkeypatch.setattr(settings, "ENABLE_AGENCY_TOOLING", True)
+    assert has_feature("S3", "team") is True
+
+
+def test_all_features_match_the_served_config(monkeypatch):
+    from app.core.config import settings
+    from app.core.segment_routing import (COMMON_FEATURES, SEGMENT_CONFIGS,
+                                          get_all_features, get_segment_config)
+
+    for segment, role in [("S3", None), (None, "landlord"), (None, "tenant"), ("nope", None)]:
+        config = get_segment_config(segment, role=role)
+        assert get_all_features(segment, role=role) == tuple(COMMON_FEATURES + config.features)
+
+    monkeypatch.setattr(settings, "ENABLE_AGENCY_TOOLING", True)
+    assert get_all_features("S3") == tuple(COMMON_FEATURES + SEGMENT_CONFIGS["S3"].features)
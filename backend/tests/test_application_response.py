@@ -0,0 +1,160 @@
+"""
+ApplicationResponse.from_orm_fast must serialize exactly like validating the
+ORM row through from_attributes (what the list endpoints used to do), and the
+create/update handlers keep to one query before writing.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.models.application import ApplicationStatus
+from app.models.schemas import ApplicationResponse
+
+
+def _row(**overrides):
+    tenant = SimpleNamespace(
+        id=uuid.uuid4(),
+        full_name="Ada Tenant",
+        bio="Quiet, tidy.",
+        email="ada@example.com",
+        profile_picture_url=None,
+        trust_score=72,
+        identity_verified=True,
+        employment_verified=False,
+        income_verified=True,
+        solvency_verified=True,
+        guarantor_type="visale",
+    )
+    prop = SimpleNamespace(
+        id=uuid.uuid4(),
+        title="Loft",
+        city="Lyon",
+        address_line1="1 rue X",
+        monthly_rent=Decimal("950.50"),
+        charges=Decimal("40.00"),
+        deposit=None,
+        property_type="apartment",
+        furnished=True,
+    )
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        property_id=prop.id,
+        tenant_id=tenant.id,
+        status=ApplicationStatus.PENDING,
+        cover_letter="Hello",
+        created_at=datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc),
+        updated_at=None,
+        tenant=tenant,
+        property=prop,
+    )
+    for key, value in overrides.items():
+        setattr(row, key, value)
+    return row
+
+
+def test_fast_path_serializes_like_validation():
+    rows = [_row(), _row(tenant=None, property=None, status=ApplicationStatus.APPROVED)]
+    adapter = TypeAdapter(List[ApplicationResponse])
+
+    fast = adapter.dump_json([ApplicationResponse.from_orm_fast(r) for r in rows])
+    validated = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    assert fast == validated
+
+
+def test_fast_path_instances_pass_response_validation_unchanged():
+    fast = [ApplicationResponse.from_orm_fast(_row())]
+    adapter = TypeAdapter(List[ApplicationResponse])
+    assert adapter.validate_python(fast)[0] is fast[0]
+
+
+async def test_status_update_loads_everything_in_one_query():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.routers.applications import ApplicationUpdate, update_application_status
+    from tests.conftest import make_mock_user
+
+    landlord = make_mock_user("landlord")
+    row = _row()
+    row.property.landlord_id = landlord.id
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    db.execute.return_value = result
+
+    with patch("app.routers.applications.NotificationService") as notifications:
+        notifications.return_value.notify_application_status_changed = AsyncMock()
+        updated = await update_application_status(
+            row.id, ApplicationUpdate(status=ApplicationStatus.APPROVED), landlord, db
+        )
+
+    assert updated.status is ApplicationStatus.APPROVED
+    assert db.execute.await_count == 1
+    db.refresh.assert_not_awaited()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "LEFT OUTER JOIN properties" in sql and "LEFT OUTER JOIN users" in sql
+
+
+async def test_create_checks_property_and_duplicate_in_one_query():
+    from unittest.mock import AsyncMock, MagicMock
+
+    import pytest
+    from fastapi import HTTPException
+    from sqlalchemy.dialects import postgresql
+
+    from app.models.schemas import ApplicationCreate
+    from app.routers.applications import create_application
+    from tests.conftest import make_mock_user
+
+    tenant = make_mock_user("tenant")
+    tenant.bio = "Quiet, employed, non-smoker."
+    db = AsyncMock()
+    result = MagicMock()
+    result.one_or_none.return_value = (MagicMock(), True)
+    db.execute.return_value = result
+
+    with pytest.raises(HTTPException) as exc:
+        await create_application(ApplicationCreate(property_id=uuid.uuid4()), tenant, db)
+
+    assert exc.value.status_code == 409
+    assert db.execute.await_count == 1
+    db.add.assert_not_called()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "EXISTS (SELECT" in sql and "FROM properties" in sql
+
+
+async def test_create_returns_without_reloading_the_application():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.models.schemas import ApplicationCreate
+    from app.routers.applications import create_application
+
+    row = _row()
+    tenant, prop = row.tenant, row.property
+    prop.landlord_id = uuid.uuid4()
+    tenant.bio = "Quiet, employed, non-smoker."
+    tenant.full_name = "Marie Martin"
+    db = AsyncMock()
+    db.add = MagicMock()
+    result = MagicMock()
+    result.one_or_none.return_value = (prop, False)
+    db.execute.return_value = result
+
+    with patch("app.routers.applications.NotificationService") as notifications:
+        notifications.return_value.notify_application_received = AsyncMock()
+        response = await create_application(
+            ApplicationCreate(property_id=prop.id, cover_letter="Hello"), tenant, db
+        )
+
+    assert db.execute.await_count == 1
+    db.commit.assert_awaited_once()
+    assert response.status == "pending"
+    assert response.tenant.id == tenant.id
+    assert response.property.title == prop.title
@@ -127,6 +127,41 @@ class TestResetPasswordSchema:
                 new_password="weak",
             )
 
+    def test_reset_password_reports_first_missing_class(self):
+        """Complexity errors name the first missing class, as registration does."""
+        with pytest.raises(ValidationError) as exc_info:
+            ResetPasswordRequest(token="token", new_password="NoDigits!here")
+        assert "digit" in str(exc_info.value).lower()
+        # Any Unicode decimal digit satisfies the digit rule (regex \d semantics)
+        assert ResetPasswordRequest(token="t", new_password="Passw\u0663rd!x")
+
+
+class TestPasswordHashing:
+    """Argon2 hashing in app.core.security."""
+
+    def test_hash_round_trip(self):
+        from app.core.security import get_password_hash, verify_password
+
+        hashed = get_password_hash("S3cure!pass")
+        assert hashed.startswith("$argon2id$")
+        assert verify_password("S3cure!pass", hashed)
+        assert not verify_password("wrong", hashed)
+
+    def test_unrecognised_hash_fails_closed(self):
+        from app.core.security import password_needs_rehash, verify_password
+
+        assert not verify_password("anything", "$2b$12$not-an-argon2-hash")
+        assert not password_needs_rehash("$2b$12$not-an-argon2-hash")
+
+    def test_weaker_parameters_need_rehash(self):
+        from argon2 import PasswordHasher
+
+        from app.core.security import password_needs_rehash, verify_password
+
+        legacy = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1).hash("pw")
+        assert verify_password("pw", legacy)
+        assert password_needs_rehash(legacy)
+
 
 class TestAuthEndpoints:
     """Integration-style tests against the auth router."""
@@ -249,3 +284,55 @@ class TestAuthAuditHardening:
         client = self._client_for(user)
         resp = client.post("/auth/switch-role", json={"role": "property_manager"})
         assert resp.status_code == 403
+
+
+class TestVerifyTokenCache:
+    """verify_token caches decoded payloads by token hash."""
+
+    def test_repeat_verification_skips_decode(self):
+        from unittest.mock import patch
+
+        from app.core import security
+
+        token = security.create_access_token({"sub": "cache@example.com"})
+        first = security.verify_token(token)
+        with patch.object(security.jwt, "decode", side_effect=AssertionError("decoded twice")):
+            second = security.verify_token(token)
+        assert second == first
+        # Callers get their own copy of the cached payload.
+        second["sub"] = "tampered"
+        assert security.verify_token(token)["sub"] == "cache@example.com"
+
+    def test_invalid_tokens_are_not_cached(self):
+        from app.core import security
+
+        before = len(security._token_cache)
+        assert security.verify_token("not-a-jwt") is None
+        assert len(security._token_cache) == before
+
+    def test_prepared_key_matches_plain_secret(self):
+        import jwt
+
+        from app.core import security
+        from app.core.config import settings
+
+        token = security.create_access_token({"sub": "key@example.com"})
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        assert payload["sub"] == "key@example.com"
+
+    def test_exp_is_integer_epoch_seconds(self):
+        import time
+        from datetime import timedelta
+
+        from app.core import security
+        from app.core.config import settings
+
+        now = int(time.time())
+        access = security.verify_token(security.create_access_token({"sub": "a"}))
+        assert isinstance(access["exp"], int)
+        assert now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60 <= access["exp"] <= now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60 + 2
+
+        short = security.verify_token(
+            security.create_access_token({"sub": "b"}, expires_delta=timedelta(minutes=5))
+        )
+        assert now + 300 <= short["exp"] <= now + 302
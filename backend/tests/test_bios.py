@@ -92,7 +92,7 @@ class TestApplyGate:
         target = _target()
         sess = MagicMock()
         sess.execute = AsyncMock(return_value=MagicMock(
-            scalar_one_or_none=MagicMock(return_value=None)))
+            one_or_none=MagicMock(return_value=None)))
         def _get_db():
             yield sess
 
@@ -0,0 +1,350 @@
+"""
+Tests for app.core.cache.CacheLayer — key generation and the cached() decorator.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import orjson
+
+from app.core.cache import CacheLayer, _LocalCache
+
+
+def test_make_key_is_stable_and_prefixed():
+    layer = CacheLayer()
+    key = layer._make_key("properties", "paris", limit=20, skip=0)
+    assert key.startswith("properties:")
+    # Same arguments -> same key, regardless of kwarg order.
+    assert key == layer._make_key("properties", "paris", skip=0, limit=20)
+
+
+def test_make_key_differs_per_argument():
+    layer = CacheLayer()
+    assert layer._make_key("properties", "paris") != layer._make_key("properties", "lyon")
+    assert layer._make_key("properties", "paris") != layer._make_key("listings", "paris")
+
+
+def test_key_builder_normalises_call_shape_and_skips_db():
+    async def search(db, city, limit=20):
+        pass
+
+    key_for = CacheLayer._key_builder(search)
+    key = key_for((object(), "paris"), {})
+    assert key == key_for((object(),), {"city": "paris", "limit": 20})
+    assert key != key_for((object(), "paris", 50), {})
+
+
+class _FakeRedis:
+    """Minimal async fake standing in for cache.redis_client."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.round_trips = 0
+        self.published = []
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.store[key] = value
+        return True
+
+    async def set(self, key, value, nx=False):
+        self.round_trips += 1
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def incr(self, key):
+        self.round_trips += 1
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return sum(self.store.pop(k, None) is not None for k in keys)
+
+    async def scan_iter(self, match=None, count=None):
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+    async def publish(self, channel, message):
+        self.round_trips += 1
+        self.published.append((channel, message))
+        return 0
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must never be used")
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self._ops.append(key)
+        return self
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        return [self._redis.store.get(key) for key in self._ops]
+
+
+async def test_get_many_is_one_round_trip_and_aligned():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    await layer.set("a", {"n": 1})
+    await layer.set("c", [3])
+    layer.redis_client.round_trips = 0
+
+    assert await layer.get_many(["a", "b", "c"]) == [{"n": 1}, None, [3]]
+    assert layer.redis_client.round_trips == 1
+
+
+async def test_get_many_without_redis_returns_misses():
+    layer = CacheLayer()
+    assert await layer.get_many(["a", "b"]) == [None, None]
+
+
+async def test_cached_hits_until_group_is_invalidated():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    calls = []
+
+    @layer.cached("properties", ttl=60)
+    async def load(city):
+        calls.append(city)
+        return {"city": city, "n": len(calls)}
+
+    assert await load("paris") == {"city": "paris", "n": 1}
+    assert await load("paris") == {"city": "paris", "n": 1}
+    assert calls == ["paris"]
+
+    await layer.invalidate_group("properties")
+    assert await load("paris") == {"city": "paris", "n": 2}
+
+
+async def test_cached_serves_repeat_calls_from_local_tier():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+
+    @layer.cached("listings", ttl=60)
+    async def load(city):
+        return {"city": city}
+
+    await load("paris")
+    layer.redis_client.round_trips = 0
+    assert await load("paris") == {"city": "paris"}
+    assert layer.redis_client.round_trips == 0
+
+
+async def test_local_hits_are_independent_copies():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+
+    @layer.cached("listings", ttl=60)
+    async def load(city):
+        return {"city": city, "tags": ["metro"]}
+
+    first = await load("paris")
+    first["tags"].append("mutated")
+    hit = await load("paris")
+    hit["city"] = "lyon"
+
+    assert await load("paris") == {"city": "paris", "tags": ["metro"]}
+
+
+class _FlakyPubSub:
+    """Pub/sub whose first subscription dies with an idle read timeout."""
+
+    def __init__(self, attempts, deliver):
+        self._attempts = attempts
+        self._deliver = deliver
+
+    async def subscribe(self, channel):
+        self._attempts.append(channel)
+
+    async def listen(self):
+        if len(self._attempts) == 1:
+            raise TimeoutError("Timeout reading from socket")
+        await self._deliver.wait()
+        yield {"data": b"k:property:1"}
+        await asyncio.Event().wait()  # quiet channel
+
+    async def aclose(self):
+        pass
+
+
+async def test_invalidation_listener_resubscribes_after_timeout(monkeypatch):
+    layer = CacheLayer()
+    attempts, deliver = [], asyncio.Event()
+    layer._pubsub_client = MagicMock()
+    layer._pubsub_client.pubsub.side_effect = lambda **kw: _FlakyPubSub(attempts, deliver)
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr("app.core.cache.asyncio.sleep", lambda _delay: real_sleep(0))
+    layer._local.set("property:2", b"1")
+
+    listener = asyncio.create_task(layer._listen_for_invalidations())
+    for _ in range(5):
+        await real_sleep(0)
+    assert attempts == ["cache-invalidate", "cache-invalidate"]
+    # Entries cached before the drop may have missed messages.
+    assert layer._local.get("property:2") is None
+
+    # The new subscription keeps evicting.
+    layer._local.set("property:1", b"1")
+    deliver.set()
+    for _ in range(3):
+        await real_sleep(0)
+    assert layer._local.get("property:1") is None
+
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+
+
+async def test_concurrent_misses_share_one_computation():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    calls = []
+    release = asyncio.Event()
+
+    @layer.cached("properties", ttl=60)
+    async def load(property_id):
+        calls.append(property_id)
+        await release.wait()
+        return {"id": property_id}
+
+    tasks = [asyncio.create_task(load("p1")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [{"id": "p1"}] * 5
+    assert calls == ["p1"]
+    assert layer._inflight == {}
+
+
+async def test_concurrent_misses_share_the_failure():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    release = asyncio.Event()
+
+    @layer.cached("properties", ttl=60)
+    async def load(property_id):
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [asyncio.create_task(load("p1")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert layer._inflight == {}
+
+
+async def test_cancelled_owner_hands_the_computation_to_a_waiter():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    calls = []
+    release = asyncio.Event()
+
+    @layer.cached("properties", ttl=60)
+    async def load(property_id):
+        calls.append(property_id)
+        await release.wait()
+        return {"id": property_id}
+
+    owner = asyncio.create_task(load("p1"))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(load("p1")) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [{"id": "p1"}] * 3
+    assert owner.cancelled()
+    assert calls == ["p1", "p1"]
+    assert layer._inflight == {}
+
+
+async def test_invalidate_group_evicts_local_tier_and_broadcasts():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    layer._local.set("properties:abc", b"1")
+    layer._local.set("listings:abc", b"2")
+
+    await layer.invalidate_group("properties")
+
+    assert layer._local.get("properties:abc") is None
+    assert layer._local.get("listings:abc") == b"2"
+    assert layer.redis_client.published == [("cache-invalidate", "p:properties:")]
+
+
+def test_evict_local_applies_remote_messages():
+    layer = CacheLayer()
+    layer._local.set("property:1", 1)
+    layer._local.set("user:7:a", 2)
+    layer._local.set("user:8:a", 3)
+
+    layer._evict_local(b"k:property:1")
+    layer._evict_local(b"p:user:7:")
+
+    assert layer._local.get("property:1") is None
+    assert layer._local.get("user:7:a") is None
+    assert layer._local.get("user:8:a") == 3
+
+
+def test_local_cache_is_bounded_lru():
+    local = _LocalCache(maxsize=2, ttl=60)
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+    assert local.get("b") is None
+    assert (local.get("a"), local.get("c")) == (1, 3)
+
+
+async def test_invalidate_pattern_scans_instead_of_keys():
+    layer = CacheLayer()
+    layer.redis_client = _FakeRedis()
+    for key in ("user:1:a", "user:1:b", "user:2:a"):
+        await layer.set(key, 1)
+
+    assert await layer.invalidate_pattern("user:1:*") == 2
+    assert set(layer.redis_client.store) == {"user:2:a"}
+
+
+def test_small_values_round_trip_uncompressed():
+    payload = CacheLayer._encode({"rate": 1.1, "source": "live"})
+    assert payload[:1] == b"r"
+    assert CacheLayer._decode(payload) == {"rate": 1.1, "source": "live"}
+
+
+def test_large_values_are_compressed():
+    value = [{"id": i, "title": "Studio meublé proche métro"} for i in range(100)]
+    payload = CacheLayer._encode(value)
+    assert payload[:1] == b"z"
+    assert len(payload) < len(orjson.dumps(value))
+    assert CacheLayer._decode(payload) == value
+
+
+def test_decode_reads_legacy_json_strings():
+    assert CacheLayer._decode(b'{"count": 3}') == {"count": 3}
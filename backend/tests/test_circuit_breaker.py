@@ -0,0 +1,133 @@
+"""
+Tests for app.core.circuit_breaker — state transitions and the decorators.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerError,
+    CircuitState,
+    _circuit_breakers,
+    circuit_breaker,
+    with_retry,
+)
+
+
+def test_opens_at_threshold_and_probes_after_deadline():
+    cb = CircuitBreaker(name="test-open", failure_threshold=2, recovery_timeout=30.0)
+    cb._record_failure()
+    assert cb.state is CircuitState.CLOSED
+    cb._record_failure()
+    assert cb.state is CircuitState.OPEN
+    assert not cb._should_allow_request()
+
+    # Deadline is monotonic; move it into the past instead of sleeping.
+    cb._open_until = time.monotonic() - 1
+    assert cb._should_allow_request()
+    assert cb.state is CircuitState.HALF_OPEN
+
+
+def test_failed_probe_reopens_with_fresh_deadline():
+    cb = CircuitBreaker(name="test-reopen", failure_threshold=1, recovery_timeout=30.0)
+    cb._record_failure()
+    cb._open_until = time.monotonic() - 1
+    assert cb._should_allow_request()
+
+    cb._record_failure()
+    assert cb.state is CircuitState.OPEN
+    assert cb._open_until > time.monotonic()
+
+
+def test_half_open_admits_at_most_max_probes_in_a_burst():
+    cb = CircuitBreaker(name="test-burst", failure_threshold=1, half_open_max_calls=3)
+    cb._record_failure()
+    cb._open_until = time.monotonic() - 1
+
+    # Nothing has completed yet, so every admission comes from the burst.
+    admitted = [cb._should_allow_request() for _ in range(10)]
+    assert admitted.count(True) == 3
+    assert cb.state is CircuitState.HALF_OPEN
+
+
+def test_closes_after_all_probes_succeed():
+    cb = CircuitBreaker(name="test-close", failure_threshold=1, half_open_max_calls=2)
+    cb._record_failure()
+    cb._open_until = time.monotonic() - 1
+    for _ in range(2):
+        assert cb._should_allow_request()
+        cb._record_success()
+    assert cb.state is CircuitState.CLOSED
+
+
+async def test_decorator_registers_breaker_at_decoration_time():
+    @circuit_breaker("test-decorated", failure_threshold=1)
+    async def call():
+        raise RuntimeError("down")
+
+    cb = _circuit_breakers["test-decorated"]
+    assert cb.state is CircuitState.CLOSED
+
+    with pytest.raises(RuntimeError):
+        await call()
+    assert cb.state is CircuitState.OPEN
+    with pytest.raises(CircuitBreakerError):
+        await call()
+
+
+async def test_cancelled_probe_gives_its_slot_back():
+    hang = asyncio.Event()
+
+    @circuit_breaker("test-cancelled-probe", failure_threshold=1)
+    async def call(block):
+        if block:
+            await hang.wait()
+        return "ok"
+
+    cb = _circuit_breakers["test-cancelled-probe"]
+    cb.half_open_max_calls = 1
+    cb._record_failure()
+    cb._open_until = time.monotonic() - 1
+
+    probe = asyncio.create_task(call(True))
+    await asyncio.sleep(0)
+    assert cb.half_open_calls == 1
+    with pytest.raises(CircuitBreakerError, match="HALF_OPEN"):
+        await call(False)
+
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert cb.state is CircuitState.HALF_OPEN
+    assert cb.half_open_calls == 0
+
+    # The next probe is admitted and closes the circuit.
+    assert await call(False) == "ok"
+    assert cb.state is CircuitState.CLOSED
+
+
+async def test_with_retry_uses_capped_jittered_backoff(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("app.core.circuit_breaker.asyncio.sleep", fake_sleep)
+    attempts = []
+
+    @with_retry(max_attempts=4, initial_delay=1.0, max_delay=3.0)
+    async def flaky():
+        attempts.append(1)
+        raise ConnectionError("nope")
+
+    with pytest.raises(ConnectionError):
+        await flaky()
+
+    assert len(attempts) == 4
+    # Schedule is 1, 2, 3 (capped); each sleep lands in [delay/2, delay].
+    for slept, delay in zip(sleeps, (1.0, 2.0, 3.0)):
+        assert delay / 2 <= slept <= delay
+    assert len(sleeps) == 3
@@ -0,0 +1,41 @@
+"""
+Tests for the /health probe's short-lived response cache.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import app.main as main
+
+
+def _session_factory():
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory, session
+
+
+async def test_health_reuses_response_within_ttl(monkeypatch):
+    factory, session = _session_factory()
+    monkeypatch.setattr(main, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(main, "get_gemini_usage", AsyncMock(return_value={}))
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    first = await main.health_check()
+    second = await main.health_check()
+
+    assert second is first
+    assert first["checks"]["database"]["status"] == "up"
+    assert session.execute.await_count == 1
+
+
+async def test_health_rechecks_after_ttl(monkeypatch):
+    factory, session = _session_factory()
+    monkeypatch.setattr(main, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(main, "get_gemini_usage", AsyncMock(return_value={}))
+    monkeypatch.setattr(main, "_health_cache", None)
+
+    await main.health_check()
+    main._health_cache = (0.0, main._health_cache[1])
+    await main.health_check()
+
+    assert session.execute.await_count == 2
@@ -0,0 +1,56 @@
+"""
+Tests for POST /leases/create — lease record creation from an application.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.application import Application, ApplicationStatus
+from app.models.visits_and_leases import Lease
+from app.routers.leases import LeaseGenerateRequest, create_lease
+from tests.conftest import make_mock_user
+
+
+def _result(value):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+async def test_create_lease_from_approved_application():
+    landlord = make_mock_user("landlord")
+    landlord.identity_verified = True
+    application = Application(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        property_id=uuid.uuid4(),
+        status=ApplicationStatus.APPROVED,
+    )
+    prop = MagicMock(
+        id=application.property_id,
+        landlord_id=landlord.id,
+        monthly_rent=Decimal("800.00"),
+        charges=Decimal("50.00"),
+    )
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.execute.side_effect = [_result(application), _result(prop)]
+
+    response = await create_lease(
+        LeaseGenerateRequest(application_id=application.id, start_date="2026-11-01"),
+        landlord,
+        db,
+    )
+
+    assert response["message"] == "Lease created successfully"
+    assert application.status is ApplicationStatus.LEASE_CREATED
+    (lease,), _ = db.add.call_args
+    assert isinstance(lease, Lease)
+    assert lease.tenant_id == application.tenant_id
+    db.commit.assert_awaited_once()
+
+
+def test_lease_created_is_a_database_enum_label():
+    # The column stores enum values; a status missing here fails on flush.
+    assert "lease_created" in Application.__table__.c.status.type.enums
@@ -0,0 +1,22 @@
+"""
+Tests for ORM relationship configuration — explicit back_populates pairs and
+loader strategies on the reverse collections.
+"""
+
+from sqlalchemy import inspect
+
+import app.models  # noqa: F401  (registers every mapper)
+from app.models.user import User
+from app.models.webhook_subscriptions import WebhookSubscription
+
+
+def test_user_reverse_collections_raise_instead_of_lazy_loading():
+    rels = inspect(User).relationships
+    for name in ("properties", "documents", "notifications", "sent_messages", "team_memberships"):
+        assert rels[name].lazy == "raise", name
+        assert rels[name].back_populates, name
+
+
+def test_db_cascaded_children_are_not_loaded_on_delete():
+    assert inspect(User).relationships["notifications"].passive_deletes
+    assert inspect(WebhookSubscription).relationships["deliveries"].passive_deletes
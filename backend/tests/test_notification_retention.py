@@ -0,0 +1,49 @@
+"""
+Tests for the opt-in read-notification retention sweep.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.core.timeutils import utcnow
+from app.workers.tasks import purge_read_notifications_task
+
+
+def _session(monkeypatch):
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(rowcount=4)
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    monkeypatch.setattr("app.core.database.AsyncSessionLocal", factory)
+    return session
+
+
+def test_sweep_is_disabled_by_default(monkeypatch):
+    session = _session(monkeypatch)
+    monkeypatch.setattr(settings, "NOTIFICATION_RETENTION_DAYS", 0)
+
+    assert purge_read_notifications_task.run() == {
+        "notifications_deleted": 0,
+        "retention": "disabled",
+    }
+    session.execute.assert_not_awaited()
+
+
+def test_sweep_deletes_only_read_rows_past_the_cutoff(monkeypatch):
+    session = _session(monkeypatch)
+    monkeypatch.setattr(settings, "NOTIFICATION_RETENTION_DAYS", 90)
+
+    before = utcnow()
+    assert purge_read_notifications_task.run() == {"notifications_deleted": 4}
+
+    stmt = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(stmt)
+    assert sql.startswith("DELETE FROM notifications")
+    assert "notifications.read = true" in sql
+    (cutoff,) = [v for v in stmt.params.values() if hasattr(v, "tzinfo")]
+    expected = before - timedelta(days=90)
+    assert abs(cutoff - expected) < timedelta(seconds=5)
+    session.commit.assert_awaited_once()
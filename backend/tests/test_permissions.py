@@ -0,0 +1,87 @@
+"""
+Tests for app.core.permissions — role-based action checks.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.permissions import check_permission
+from tests.conftest import make_mock_user
+
+
+@pytest.mark.parametrize(
+    "role, action",
+    [
+        ("admin", "anything"),
+        ("landlord", "create_property"),
+        ("tenant", "apply_to_property"),
+        ("property_manager", "manage_multiple_landlords"),
+        ("property_manager", "view_analytics"),
+    ],
+)
+async def test_allowed_actions(role, action):
+    assert await check_permission(make_mock_user(role), action) is True
+
+
+@pytest.mark.parametrize(
+    "role, action, detail",
+    [
+        ("landlord", "apply_to_property", "Landlords cannot perform action: apply_to_property"),
+        ("tenant", "create_property", "Tenants cannot perform action: create_property"),
+        ("property_manager", "pay_rent", "Property Managers cannot perform action: pay_rent"),
+    ],
+)
+async def test_forbidden_actions(role, action, detail):
+    with pytest.raises(HTTPException) as exc:
+        await check_permission(make_mock_user(role), action)
+    assert exc.value.status_code == 403
+    assert exc.value.detail == detail
+
+
+async def test_property_manager_needs_access_to_the_landlord():
+    with patch(
+        "app.core.permissions.check_property_manager_access",
+        new=AsyncMock(return_value=False),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await check_permission(
+                make_mock_user("property_manager"),
+                "edit_property",
+                resource_owner_id="landlord-1",
+                db=AsyncMock(),
+            )
+    assert exc.value.status_code == 403
+
+
+async def test_property_manager_access_is_cached_between_checks():
+    from app.core import permissions
+
+    store = {}
+
+    async def fake_get(key):
+        return store.get(key)
+
+    async def fake_set(key, value, ttl=300):
+        store[key] = value
+        return True
+
+    db = AsyncMock()
+    db.execute.return_value.scalar_one_or_none = lambda: object()
+    with patch.object(permissions.cache, "get", new=fake_get), patch.object(
+        permissions.cache, "set", new=fake_set
+    ):
+        assert await permissions.check_property_manager_access("pm-1", "ll-1", db)
+        assert await permissions.check_property_manager_access("pm-1", "ll-1", db)
+
+    assert db.execute.await_count == 1
+    assert store == {"pma:pm-1:ll-1": True}
+
+
+async def test_unknown_role_is_refused():
+    user = make_mock_user()
+    user.role = "auditor"
+    with pytest.raises(HTTPException) as exc:
+        await check_permission(user, "view_analytics")
+    assert exc.value.detail == "Insufficient permissions"
@@ -0,0 +1,31 @@
+"""
+Tests for app.core.sanitize — XSS stripping of user-provided text.
+"""
+
+from app.core.sanitize import sanitize_dict, sanitize_html
+
+
+def test_plain_text_is_only_unescaped_and_trimmed():
+    assert sanitize_html("  Studio près du métro &amp; parc ") == "Studio près du métro & parc"
+    assert sanitize_html(None) is None
+
+
+def test_strips_tags_and_xss_vectors():
+    assert sanitize_html("<b>Nice</b> flat") == "Nice flat"
+    assert sanitize_html('<a href="javascript:alert(1)">x</a>') == "x"
+    assert sanitize_html("JavaScript:alert(1)") == "alert(1)"
+    assert sanitize_html("img onerror =alert(1)") == "img alert(1)"
+
+
+def test_vectors_spliced_together_by_an_earlier_pass_are_removed():
+    assert sanitize_html("java<b>script:alert(1)") == "alert(1)"
+    assert sanitize_html("onjavascript:click=alert(1)") == "alert(1)"
+
+
+def test_escaped_markup_is_stripped_after_unescape():
+    assert sanitize_html("&lt;script&gt;alert(1)&lt;/script&gt;") == "alert(1)"
+
+
+def test_sanitize_dict_only_touches_listed_string_fields():
+    data = {"title": "<i>T</i>", "body": "<i>B</i>", "rent": 900}
+    assert sanitize_dict(data, ["title", "rent"]) == {"title": "T", "body": "<i>B</i>", "rent": 900}
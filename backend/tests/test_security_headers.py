@@ -38,3 +38,15 @@ def test_protected_endpoint_requires_auth(client):
     resp = client.get("/auth/me")
     # Assert: must not be accessible without a token
     assert resp.status_code in (401, 403)
+
+
+def test_cors_preflight_only_echoes_allowed_origins(client):
+    # Arrange
+    headers = {"Access-Control-Request-Method": "GET"}
+    # Act
+    allowed = client.options("/health", headers={**headers, "Origin": "https://roomivo.eu"})
+    denied = client.options("/health", headers={**headers, "Origin": "https://evil.example"})
+    # Assert
+    assert allowed.headers.get("access-control-allow-origin") == "https://roomivo.eu"
+    assert denied.status_code == 400
+    assert "access-control-allow-origin" not in denied.headers
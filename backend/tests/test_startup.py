@@ -0,0 +1,40 @@
+"""
+Tests for the app startup/shutdown hooks.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import app.main as main
+
+
+def _hooks(monkeypatch, benchmark_enabled):
+    monkeypatch.setattr(main.settings, "LOG_PASSWORD_HASH_COST", benchmark_enabled)
+    monkeypatch.setattr(main.cache, "connect", AsyncMock())
+    monkeypatch.setattr(main.cache, "close", AsyncMock())
+    benchmark = MagicMock(return_value=0.2)
+    monkeypatch.setattr("app.core.security.benchmark_password_hash", benchmark)
+    monkeypatch.setattr(main.fastapi_app.state, "password_hash_benchmark", None, raising=False)
+    return benchmark
+
+
+async def test_password_hash_benchmark_is_off_by_default(monkeypatch):
+    benchmark = _hooks(monkeypatch, benchmark_enabled=False)
+
+    await main.startup_event()
+    await main.shutdown_event()
+
+    benchmark.assert_not_called()
+    assert main.fastapi_app.state.password_hash_benchmark is None
+    main.cache.close.assert_awaited_once()
+
+
+async def test_password_hash_benchmark_task_is_kept_and_awaited(monkeypatch):
+    benchmark = _hooks(monkeypatch, benchmark_enabled=True)
+
+    await main.startup_event()
+    task = main.fastapi_app.state.password_hash_benchmark
+    await task
+    await main.shutdown_event()
+
+    benchmark.assert_called_once_with()
+    assert task.done() and not task.cancelled()
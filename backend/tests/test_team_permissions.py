@@ -0,0 +1,104 @@
+"""
+Tests for app.core.team_permissions — effective permission resolution.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.team_permissions import (
+    can_edit_property,
+    can_view_property,
+    get_accessible_properties,
+    get_effective_permission,
+    get_team_landlord_id,
+    permission_meets_minimum,
+)
+from app.models.team import PermissionLevel
+
+
+def _db_returning(row):
+    db = AsyncMock()
+    result = MagicMock()
+    result.first.return_value = row
+    db.execute.return_value = result
+    db.info = {}
+    return db
+
+
+async def test_owner_gets_full_access_in_one_query():
+    user_id = uuid.uuid4()
+    db = _db_returning((user_id, None, None, None))
+    assert await get_effective_permission(db, user_id, uuid.uuid4()) is PermissionLevel.FULL_ACCESS
+    assert db.execute.await_count == 1
+
+
+async def test_permission_is_memoized_per_session():
+    user_id, property_id = uuid.uuid4(), uuid.uuid4()
+    db = _db_returning((user_id, None, None, None))
+    assert await can_view_property(db, user_id, property_id)
+    assert await can_edit_property(db, user_id, property_id)
+    assert db.execute.await_count == 1
+
+    # A different property is a separate lookup.
+    await can_view_property(db, user_id, uuid.uuid4())
+    assert db.execute.await_count == 2
+
+
+async def test_missing_property_means_no_access():
+    db = _db_returning(None)
+    assert await get_effective_permission(db, uuid.uuid4(), uuid.uuid4()) is None
+
+
+async def test_team_member_without_property_grant_has_no_access():
+    db = _db_returning((uuid.uuid4(), PermissionLevel.MANAGE_VISITS, None, None))
+    assert await get_effective_permission(db, uuid.uuid4(), uuid.uuid4()) is None
+
+
+async def test_property_override_wins_over_member_level():
+    grant = uuid.uuid4()
+    db = _db_returning((uuid.uuid4(), PermissionLevel.VIEW_ONLY, grant, PermissionLevel.FULL_ACCESS))
+    assert await get_effective_permission(db, uuid.uuid4(), uuid.uuid4()) is PermissionLevel.FULL_ACCESS
+
+    db = _db_returning((uuid.uuid4(), PermissionLevel.MANAGE_VISITS, grant, None))
+    assert await get_effective_permission(db, uuid.uuid4(), uuid.uuid4()) is PermissionLevel.MANAGE_VISITS
+
+
+async def test_accessible_properties_is_one_union_query():
+    owned, shared = uuid.uuid4(), uuid.uuid4()
+    db = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = [(owned,), (shared,)]
+    db.execute.return_value = result
+
+    ids = await get_accessible_properties(db, uuid.uuid4(), PermissionLevel.MANAGE_VISITS)
+
+    assert ids == [owned, shared]
+    assert db.execute.await_count == 1
+    sql = str(
+        db.execute.call_args.args[0].compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert " UNION " in sql
+    assert "IN ('manage_visits', 'full_access')" in sql
+
+
+async def test_team_landlord_id_selects_only_the_column():
+    landlord = uuid.uuid4()
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = landlord
+    db.execute.return_value = result
+
+    assert await get_team_landlord_id(db, uuid.uuid4()) == landlord
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT team_members.landlord_id \nFROM team_members")
+
+
+def test_permission_ranking():
+    assert permission_meets_minimum(PermissionLevel.FULL_ACCESS, PermissionLevel.MANAGE_VISITS)
+    assert permission_meets_minimum(PermissionLevel.MANAGE_VISITS, PermissionLevel.MANAGE_VISITS)
+    assert not permission_meets_minimum(PermissionLevel.VIEW_ONLY, PermissionLevel.MANAGE_VISITS)
+    assert not permission_meets_minimum(None, PermissionLevel.VIEW_ONLY)